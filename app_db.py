@@ -0,0 +1,426 @@
+import logging
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import db_pool
+import db_writer
+import exports
+import matching
+import migrations
+import page_filters
+import queries
+import query_cache
+import records
+import reports
+import schema
+import skills
+
+# ========== БАЗА ДАННЫХ ==========
+DATABASE_NAME = 'keu_career.db'
+
+logger = logging.getLogger(__name__)
+
+
+def get_db_connection():
+    """Соединение из общего пула (использовать через with, закрывать не нужно)"""
+    return db_pool.connection(DATABASE_NAME)
+
+
+def init_database():
+    """Доводит схему до актуальной версии (реальная проверка - раз на процесс)"""
+    migrations.migrate(DATABASE_NAME, schema.APP_MIGRATIONS)
+
+
+def _log_refresh_error(future):
+    """Колбэк Future фонового пересчета подбора (refresh_matches)"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Пересчет подбора не выполнен", exc_info=future.exception())
+
+# ========== CRUD ОПЕРАЦИИ ==========
+class DatabaseManager:
+    def __init__(self):
+        pass
+
+    def submit_write(self, fn):
+        """Ставит запись fn(cursor) в очередь и возвращает Future с результатом"""
+        return db_writer.submit(DATABASE_NAME, fn)
+
+    def execute_write(self, fn):
+        """Выполняет запись fn(cursor) и ждет подтверждения после коммита"""
+        try:
+            return db_writer.wait(self.submit_write(fn))
+        except Exception as e:
+            st.error(f"Database error: {e}")
+
+    def execute_query(self, query, params=()):
+        """Выполняет запись и ждет подтверждения (WriteResult) после коммита"""
+        return self.execute_write(db_writer.statement(query, params))
+
+    def execute_read_query(self, query, params=()):
+        """Чтение через общий кэш: SQLite трогаем, только если таблицы изменились"""
+        def load():
+            with get_db_connection() as conn:
+                return pd.read_sql_query(query, conn, params=params)
+        return query_cache.get_or_load(DATABASE_NAME, query, params, load)
+
+    def fetch_record(self, table, query, params=()):
+        """Одна строка запроса как запись (records.py) или None; кэш - по версии таблицы table"""
+        def load():
+            with get_db_connection() as conn:
+                return records.fetch_one(conn, query, params)
+        return query_cache.get_record(DATABASE_NAME, table, (query, tuple(params)), load)
+
+    def fetch_page(self, select, order_columns, filters=(), after=None, limit=queries.PAGE_SIZE,
+                   conditions=()):
+        """Keyset-страница: (DataFrame, курсор следующей страницы или None).
+
+        filters (см. page_filters.py) компилируются в один параметризованный
+        запрос вместе с курсором и LIMIT - отбор делает SQLite.
+        """
+        filter_conditions, params = page_filters.compile_filters(filters)
+        query = queries.keyset_page(select, order_columns, [*conditions, *filter_conditions],
+                                    after=after is not None)
+        params = (*params, *(after or ()), limit + 1)  # лишняя строка - признак следующей страницы
+        page = self.execute_read_query(query, params)
+        if len(page) <= limit:
+            return page, None
+        page = page.iloc[:limit]
+        last = page.iloc[-1]
+        # .item(): numpy-типы не годятся как параметры sqlite3
+        next_cursor = tuple(last[column].item() if hasattr(last[column], 'item') else last[column]
+                            for _, column in order_columns)
+        return page, next_cursor
+
+    def search(self, select, text, filters=(), limit=queries.SEARCH_RESULTS, conditions=()):
+        """Полнотекстовый поиск (FTS5): лучшие по BM25 совпадения со snippet.
+
+        None - в тексте нет слов для поиска.
+        """
+        match = queries.fts_match(text)
+        if match is None:
+            return None
+        filter_conditions, params = page_filters.compile_filters(filters)
+        query = queries.ranked_search(select, [*conditions, *filter_conditions])
+        return self.execute_read_query(query, (match, *params, limit))
+
+    def write_snapshot(self):
+        """Снимок таблиц в Parquet для BI (snapshots.py); вернет {таблица: перезаписано партиций}"""
+        import snapshots  # pyarrow - только при снимке
+        return snapshots.snapshot_database(DATABASE_NAME)
+
+    def export_csv(self, export, filters=(), conditions=(), params=()):
+        """Потоковая выгрузка в CSV (exports.py): временный файл, открытый на чтение"""
+        return exports.csv_file(DATABASE_NAME, export, filters, conditions, params)
+
+    # Студенты
+    def insert_student(self, user_id, data):
+        query = '''
+            INSERT INTO students 
+            (user_id, full_name, course, specialization, programming_languages, 
+             work_experience, portfolio_link, contact_number, email, gpa, graduation_year, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+
+        def write(cursor):
+            # Важно: user_id конвертируем в int
+            cursor.execute(query, (int(user_id), *data))
+            skills.set_student_skills(cursor, cursor.lastrowid, skills.parse_skills(data[3]))
+            return cursor.lastrowid
+
+        student_id = self.execute_write(write)
+        self.forget_current_student()
+        if student_id is None:
+            return False  # ошибку уже показал execute_write
+        self.refresh_matches(student_id=student_id)
+        return True
+
+    def get_all_students(self):
+        return self.execute_read_query(queries.ALL_STUDENTS)
+
+    def get_students_page(self, filters=(), after=None, limit=queries.PAGE_SIZE):
+        return self.fetch_page(queries.STUDENTS_PAGE_SELECT, queries.STUDENTS_PAGE_ORDER,
+                               filters, after, limit)
+
+    def search_students(self, text, filters=(), limit=queries.SEARCH_RESULTS):
+        """Поиск по ФИО, специальности, навыкам и опыту работы"""
+        return self.search(queries.STUDENT_SEARCH_SELECT, text, filters, limit)
+
+    def get_student_by_user_id(self, user_id):
+        return self.fetch_record('students', queries.STUDENT_BY_USER_ID, (int(user_id),))
+
+    def get_student_by_id(self, student_id):
+        return self.fetch_record('students', queries.STUDENT_BY_ID, (int(student_id),))
+
+    def get_current_student(self, user_id):
+        """Профиль вошедшего студента - не больше одного чтения за перезапуск.
+
+        Внутри перезапуска профиль берется из карты rerun_records (ее
+        очищает main), между перезапусками - из сессии, пока не изменилась
+        версия таблицы students.
+        """
+        user_id = int(user_id)
+        records = st.session_state.setdefault('rerun_records', {})
+        key = ('student', user_id)
+        if key in records:
+            return records[key]
+
+        version = query_cache.data_version(DATABASE_NAME, ('students',))
+        cached = st.session_state.get('current_student')
+        if cached is not None and version is not None and cached[:2] == (user_id, version):
+            student = cached[2]
+        else:
+            student = self.get_student_by_user_id(user_id)
+            st.session_state.current_student = (user_id, version, student)
+        records[key] = student
+        return student
+
+    def forget_current_student(self):
+        """Сброс профиля из сессии и карты перезапуска после записи"""
+        st.session_state.pop('current_student', None)
+        st.session_state.rerun_records = {}
+
+    def update_student(self, user_id, data):
+        query = '''
+            UPDATE students SET
+            full_name = ?, course = ?, specialization = ?, programming_languages = ?,
+            work_experience = ?, portfolio_link = ?, contact_number = ?,
+            email = ?, gpa = ?, graduation_year = ?, is_active = ?
+            WHERE user_id = ?
+        '''
+
+        def write(cursor):
+            cursor.execute(query, (*data, int(user_id)))
+            cursor.execute("SELECT id FROM students WHERE user_id = ?", (int(user_id),))
+            student_ids = [student_id for (student_id,) in cursor.fetchall()]
+            for student_id in student_ids:
+                skills.set_student_skills(cursor, student_id, skills.parse_skills(data[3]))
+            return student_ids
+
+        student_ids = self.execute_write(write) or []
+        self.forget_current_student()
+        for student_id in student_ids:
+            self.refresh_matches(student_id=student_id)
+        return bool(student_ids)
+
+    def find_students_by_skills(self, names, match_all=True, filters=(), limit=queries.SEARCH_LIMIT):
+        """Студенты, знающие все (match_all) или любой из навыков names"""
+        filters = (*filters, page_filters.has_skills(names, match_all))
+        return self.get_students_page(filters, limit=limit)[0]
+
+    def get_skill_names(self):
+        return self.execute_read_query(queries.SKILL_NAMES)['name'].tolist()
+
+    # Вакансии
+    def get_all_vacancies(self):
+        return self.execute_read_query(queries.ACTIVE_VACANCIES)
+
+    def get_vacancies_page(self, filters=(), after=None, limit=queries.PAGE_SIZE):
+        """Активные вакансии постранично, новые сверху"""
+        return self.fetch_page(queries.VACANCIES_PAGE_SELECT, queries.VACANCIES_PAGE_ORDER,
+                               filters, after, limit, conditions=["is_active = 1"])
+
+    def search_vacancies(self, text, filters=(), limit=queries.SEARCH_RESULTS):
+        """Поиск по активным вакансиям: должность, компания, описание, требования"""
+        return self.search(queries.VACANCY_SEARCH_SELECT, text, filters, limit, conditions=["is_active = 1"])
+
+    def get_vacancy_by_id(self, vacancy_id):
+        return self.fetch_record('vacancies', queries.VACANCY_BY_ID, (int(vacancy_id),))
+
+    def insert_vacancy(self, data):
+        query = '''
+            INSERT INTO vacancies 
+            (company_name, position, specialization, required_course, salary_range,
+             description, requirements, contact_email, application_deadline)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        result = self.execute_query(query, data)
+        if result is not None:
+            self.refresh_matches(vacancy_id=result.lastrowid)
+        return True
+
+    def get_active_vacancy_titles(self):
+        return self.execute_read_query(queries.ACTIVE_VACANCY_TITLES)
+
+    # Отклики (ИСПРАВЛЕНО)
+    def apply_for_vacancy(self, student_id, vacancy_id, cover_letter=""):
+        query = '''
+            INSERT INTO applications (student_id, vacancy_id, cover_letter)
+            VALUES (?, ?, ?)
+        '''
+        self.execute_query(query, (student_id, vacancy_id, cover_letter))
+        return True
+
+    def get_application_by_id(self, application_id):
+        return self.fetch_record('applications', queries.APPLICATION_BY_ID, (int(application_id),))
+
+    def get_applications_by_student(self, student_id):
+        return self.execute_read_query(queries.APPLICATIONS_BY_STUDENT, (int(student_id),))
+
+    def get_all_applications(self):
+        return self.execute_read_query(queries.ALL_APPLICATIONS)
+
+    def get_applications_page(self, filters=(), after=None, limit=queries.PAGE_SIZE):
+        """Отклики постранично по (application_date, id), новые сверху"""
+        return self.fetch_page(queries.APPLICATIONS_PAGE_SELECT, queries.APPLICATIONS_PAGE_ORDER,
+                               filters, after, limit)
+
+    def get_recent_applications(self, limit=10):
+        # Убран строгий WHERE, добавлены алиасы для ID
+        return self.execute_read_query(queries.RECENT_APPLICATIONS, (limit,))
+
+    def update_application_status(self, application_id, status):
+        """True, если статус отклика действительно изменился"""
+        return self.update_application_statuses([application_id], status) > 0
+
+    def update_application_statuses(self, application_ids, status):
+        """Статус пачки откликов: executemany в одной транзакции, вернет число измененных"""
+        rows = [(status, int(application_id), status) for application_id in application_ids]
+        if not rows:
+            return 0
+
+        def write(cursor):
+            cursor.executemany(queries.UPDATE_APPLICATION_STATUS, rows)
+            return cursor.rowcount
+
+        return self.execute_write(write) or 0
+
+    def count_applications(self, filters=(), conditions=()):
+        filter_conditions, params = page_filters.compile_filters(filters)
+        result = self.execute_read_query(queries.count_applications([*conditions, *filter_conditions]), params)
+        return int(result.iloc[0]['applications']) if not result.empty else 0
+
+    def update_applications_where(self, status, filters=(), conditions=()):
+        """Статус всех откликов под фильтрами одним UPDATE, вернет число измененных"""
+        filter_conditions, params = page_filters.compile_filters(filters)
+        query = queries.update_applications_where([*conditions, *filter_conditions])
+        result = self.execute_query(query, (status, *params, status))
+        return result.rowcount if result is not None else 0
+
+    # Подбор вакансий (matching.py)
+    def refresh_matches(self, student_id=None, vacancy_id=None):
+        """Пересчет подбора отдельной записью в очереди писателя.
+
+        Результат не ждем: профиль или вакансия уже сохранены, топы
+        обновятся следом. Ошибку пересчета некому показать - она пишется в лог.
+        """
+        def write(cursor):
+            if student_id is not None:
+                matching.refresh_student(cursor, int(student_id))
+            if vacancy_id is not None:
+                matching.refresh_vacancy(cursor, int(vacancy_id))
+        future = self.submit_write(write)
+        future.add_done_callback(_log_refresh_error)
+        return future
+
+    def refresh_all_matches(self):
+        return self.execute_write(matching.refresh_all)
+
+    # Импорт списков студентов (roster_import.py)
+    def import_roster(self, file, filename, progress=None):
+        """Порционный импорт; подбор пересчитывается один раз в конце"""
+        import roster_import  # openpyxl - только при импорте
+        report = roster_import.import_roster(DATABASE_NAME, file, filename, SPECIALIZATION_OPTIONS,
+                                             SKILL_OPTIONS, progress)
+        if report.created:
+            self.refresh_all_matches()
+        return report
+
+    def get_student_matches(self, student_id, limit=3):
+        return self.execute_read_query(queries.STUDENT_MATCHES, (int(student_id), limit))
+
+    def get_vacancy_shortlist(self, vacancy_id):
+        return self.execute_read_query(queries.VACANCY_SHORTLIST, (int(vacancy_id),))
+
+    # Аналитика: только агрегаты из SQL
+    def get_students_by_specialization(self):
+        result = self.execute_read_query(queries.SPECIALIZATION_COUNTS)
+        return dict(zip(result['specialization'], result['students']))
+
+    def get_applications_by_status(self):
+        result = self.execute_read_query(queries.APPLICATIONS_BY_STATUS)
+        return dict(zip(result['status'], result['applications']))
+
+    def get_vacancies_by_specialization(self):
+        """Активные вакансии по специальностям, крупные группы первыми"""
+        result = self.execute_read_query(queries.VACANCIES_BY_SPECIALIZATION)
+        return dict(zip(result['specialization'], result['vacancies']))
+
+    def cached_figure(self, key, tables, build):
+        """Фигура графика, собранная build(), из кэша по версии таблиц (charts.py)"""
+        import charts  # plotly загружается только страницами с графиками
+        return charts.cached_figure(DATABASE_NAME, key, tables, build)
+
+    def get_applications_day_range(self):
+        """(первый, последний) день с откликами по сводке или None"""
+        result = self.execute_read_query(queries.APPLICATIONS_DAY_RANGE)
+        if result.empty or pd.isna(result.iloc[0]['first_day']):
+            return None
+        return (datetime.strptime(result.iloc[0]['first_day'], '%Y-%m-%d').date(),
+                datetime.strptime(result.iloc[0]['last_day'], '%Y-%m-%d').date())
+
+    def get_application_series(self, start, end, resolution='day', group=None):
+        """Отклики за [start, end] по дням, неделям или месяцам из дневной сводки"""
+        return self.execute_read_query(queries.application_series(resolution, group),
+                                       (start.isoformat(), end.isoformat()))
+
+    def get_gpa_histogram(self, bins=queries.GPA_BINS):
+        """DataFrame (gpa - начало корзины, students) по всем корзинам от 0 до GPA_MAX"""
+        width = queries.GPA_MAX / bins
+        result = self.execute_read_query(queries.GPA_HISTOGRAM, (bins / queries.GPA_MAX, bins - 1))
+        counts = dict(zip(result['bin'], result['students']))
+        return pd.DataFrame({'gpa': [round(i * width, 2) for i in range(bins)],
+                             'students': [int(counts.get(i, 0)) for i in range(bins)]})
+
+    def get_gpa_summary(self):
+        """Среднее, медиана, минимум, максимум и выборочное отклонение GPA; None - оценок нет"""
+        summary = self.execute_read_query(queries.GPA_SUMMARY).iloc[0]
+        count = int(summary['count'])
+        if count == 0:
+            return None
+        variance = max(summary['mean_square'] - summary['mean'] ** 2, 0.0)
+        return {
+            'mean': summary['mean'],
+            'median': self.execute_read_query(queries.GPA_MEDIAN).iloc[0]['median'],
+            'min': summary['min'],
+            'max': summary['max'],
+            'std': (variance * count / (count - 1)) ** 0.5 if count > 1 else float('nan'),
+        }
+
+    def request_report(self):
+        """Комплексный отчет в фоне (reports.py): ReportJob, готовый сразу, если данные не менялись"""
+        return reports.request_report(DATABASE_NAME, COURSE_OPTIONS, SPECIALIZATION_OPTIONS)
+
+    def get_cached_report(self):
+        return reports.cached_report(DATABASE_NAME)
+
+    # Статистика
+    def get_students_by_course(self):
+        result = self.execute_read_query(queries.STUDENTS_BY_COURSE)
+        return dict(zip(result['course'], result['students']))
+
+    def get_top_specialization(self):
+        result = self.execute_read_query(queries.TOP_SPECIALIZATION)
+        if not result.empty:
+            return result.iloc[0]['specialization']
+        return None
+
+    def get_statistics(self):
+        stats = self.fetch_record('stats', queries.STATISTICS)
+        if stats is not None:
+            return stats
+        return records.filled(['total_students', 'active_students', 'active_vacancies', 'total_applications',
+                               'accepted_applications', 'pending_applications', 'avg_gpa'])
+
+
+# ========== ГЛОБАЛЬНЫЕ НАСТРОЙКИ ==========
+COURSE_OPTIONS = [1, 2, 3, 4]
+SPECIALIZATION_OPTIONS = [
+    "Экономика", "Менеджмент", "Финансы", "Бухгалтерский учет",
+    "Маркетинг", "Логистика", "ITA", "Цифровой дизайн", "Информационные системы"
+]
+SKILL_OPTIONS = [
+    "Excel", "Word", "PowerPoint", "1С", "SQL", "Python", "SPSS",
+    "Бухгалтерия", "Финансовый анализ", "Маркетинговые исследования",
+    "S#", "JavaScript", "HTML/CSS", "Data Analysis", "Project Management"
+]
@@ -1,83 +1,44 @@
 import streamlit as st
 import pandas as pd
 import sqlite3
-import hashlib
+import credentials
+import db_pool
+import db_writer
+import migrations
+import schema
+
+DATABASE_NAME = 'grad_recruitment.db'
 
 
 # ========== ФУНКЦИИ АВТОРИЗАЦИИ ==========
 def get_db_connection():
-    """Создает новое соединение с базой данных"""
-    return sqlite3.connect('grad_recruitment.db', check_same_thread=False)
+    """Соединение из общего пула (использовать через with, закрывать не нужно)"""
+    return db_pool.connection(DATABASE_NAME)
 
 
 def hash_password(password):
-    """Хеширование пароля"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Хеширование пароля (scrypt, credentials.py)"""
+    return credentials.make_hash(password)
 
 
 def init_auth_database():
-    """Инициализация таблиц для авторизации"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # Таблица пользователей
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL CHECK(role IN ('admin', 'employer', 'student')),
-            email TEXT,
-            full_name TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_active INTEGER DEFAULT 1
-        )
-    ''')
-
-    # Добавляем тестовых пользователей если таблица пустая
-    cursor.execute("SELECT COUNT(*) FROM users")
-    if cursor.fetchone()[0] == 0:
-        # Администратор
-        cursor.execute('''
-            INSERT INTO users (username, password_hash, role, email, full_name)
-            VALUES (?, ?, ?, ?, ?)
-        ''', ('admin', hash_password('admin123'), 'admin', 'admin@system.kz', 'Администратор Системы'))
-
-        # Тестовый студент
-        cursor.execute('''
-            INSERT INTO users (username, password_hash, role, email, full_name)
-            VALUES (?, ?, ?, ?, ?)
-        ''', ('student', hash_password('student123'), 'student', 'student@email.com', 'Тестовый Студент'))
-
-        # Тестовый работодатель
-        cursor.execute('''
-            INSERT INTO users (username, password_hash, role, email, full_name)
-            VALUES (?, ?, ?, ?, ?)
-        ''', ('employer', hash_password('employer123'), 'employer', 'employer@company.kz', 'Тестовый Работодатель'))
-
-    conn.commit()
-    conn.close()
+    """Инициализация таблиц для авторизации (через миграции, раз на процесс)"""
+    migrations.migrate(DATABASE_NAME, schema.AUTH_MIGRATIONS)
     return True
 
 
 def authenticate_user(username, password):
-    """Аутентификация пользователя"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute('''
-        SELECT id, username, password_hash, role, full_name, email 
-        FROM users 
-        WHERE username = ? AND is_active = 1
-    ''', (username,))
-
-    user = cursor.fetchone()
-    conn.close()
-
-    if user and user[2] == hash_password(password):
+    """Аутентификация пользователя по логину или email (без учета регистра)"""
+    user = credentials.authenticate(DATABASE_NAME, '''
+        SELECT id, password_hash, username, role, full_name, email
+        FROM users
+        WHERE (username_key = ? OR email_key = ?) AND is_active = 1
+    ''', username, password)
+
+    if user:
         return {
             'id': user[0],
-            'username': user[1],
+            'username': user[2],
             'role': user[3],
             'full_name': user[4],
             'email': user[5]
@@ -86,21 +47,23 @@ def authenticate_user(username, password):
 
 
 def register_user(username, password, role, email, full_name):
-    """Регистрация нового пользователя"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    try:
+    """Регистрация нового пользователя (логин занят и без учета регистра - False)"""
+    password_hash = hash_password(password)
+    username_key, email_key = credentials.login_key(username), credentials.login_key(email)
+
+    def write(cursor):
+        cursor.execute("SELECT 1 FROM users WHERE username_key = ?", (username_key,))
+        if cursor.fetchone():
+            return False
         cursor.execute('''
-            INSERT INTO users (username, password_hash, role, email, full_name)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (username, hash_password(password), role, email, full_name))
-
-        conn.commit()
-        conn.close()
+            INSERT INTO users (username, password_hash, role, email, full_name, username_key, email_key)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (username, password_hash, role, email, full_name, username_key, email_key))
         return True
+
+    try:
+        return db_writer.write(DATABASE_NAME, write)
     except sqlite3.IntegrityError:
-        conn.close()
         return False
 
 
@@ -0,0 +1,170 @@
+import html
+import string
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+# ========== КАРТОЧКИ ==========
+# Шаблон карточки разбирается один раз при импорте модуля: получается
+# список (текст, поле), и рендер - это склейка готовых кусков без f-строк
+# и форматирования. Поля экранируются html.escape; поля с суффиксом _html
+# вставляются как есть - это уже готовая разметка (выделение совпадений,
+# вложенные шаблоны). Готовые фрагменты кэшируются по содержимому строки,
+# а страница карточек уходит в браузер одним элементом st.markdown.
+MAX_FRAGMENTS = 1024
+RAW_SUFFIX = '_html'
+
+
+class CardTemplate:
+    """Скомпилированный шаблон карточки с полями {name}"""
+
+    def __init__(self, name, source):
+        self.name = name
+        # Одна строка без отступов: в общем markdown пустые строки и отступы
+        # в 4 пробела превратили бы разметку в блок кода
+        source = ''.join(line.strip() for line in source.splitlines())
+        self._parts = []
+        fields = []
+        for literal, field, _, _ in string.Formatter().parse(source):
+            self._parts.append((literal, field))
+            if field is not None and field not in fields:
+                fields.append(field)
+        self.fields = tuple(fields)
+
+    def render(self, row):
+        """HTML карточки для строки row (dict или запись)"""
+        values = tuple(_clean(row.get(field)) for field in self.fields)
+        key = (self.name, values)
+        fragment = fragments.get(key)
+        if fragment is None:
+            prepared = dict(zip(self.fields, values))
+            chunks = []
+            for literal, field in self._parts:
+                chunks.append(literal)
+                if field is not None:
+                    value = prepared[field]
+                    chunks.append(value if field.endswith(RAW_SUFFIX) else html.escape(value))
+            fragment = fragments.put(key, ''.join(chunks))
+        return fragment
+
+
+def _clean(value):
+    """Значение поля как строка; None и NaN из DataFrame - пустая строка"""
+    if value is None or value != value:
+        return ''
+    return str(value)
+
+
+class FragmentCache:
+    """LRU готовых фрагментов: (шаблон, значения полей) -> HTML"""
+
+    def __init__(self, max_entries=MAX_FRAGMENTS):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return fragment
+
+    def put(self, key, fragment):
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+fragments = FragmentCache()
+
+
+def render_cards(template, rows):
+    """HTML всех карточек страницы одной строкой"""
+    return ''.join(template.render(row) for row in rows)
+
+
+def show_cards(template, rows, container=st):
+    """Страница карточек одним элементом (container - st, форма или колонка)"""
+    container.markdown(render_cards(template, rows), unsafe_allow_html=True)
+
+
+# ========== ШАБЛОНЫ ==========
+VACANCY_CARD = CardTemplate('vacancy', """
+<div class="content-card">
+    <h3 style="color: var(--peach-dark); margin: 0;">{position}</h3>
+    <p style="color: var(--peach-primary); font-size: 1.1rem; font-weight: 600; margin: 5px 0;">
+        {company_name}
+    </p>
+    <div style="display: flex; flex-wrap: wrap; gap: 10px; margin: 15px 0;">
+        <span style="background: var(--peach-light); color: var(--peach-dark); padding: 6px 12px; border-radius: 20px; font-size: 0.9rem;">
+            🎯 {specialization}
+        </span>
+        <span style="background: rgba(255, 160, 122, 0.2); color: var(--peach-dark); padding: 6px 12px; border-radius: 20px; font-size: 0.9rem;">
+            📚 Курс {required_course}+
+        </span>
+        <span style="background: rgba(255, 152, 0, 0.1); color: var(--warning); padding: 6px 12px; border-radius: 20px; font-size: 0.9rem;">
+            💰 {salary_range}
+        </span>
+    </div>
+    <p style="color: var(--text-dark); line-height: 1.6;">{summary_html}</p>
+</div>
+""")
+
+# Отклик в списке откликов (с контактами студента)
+APPLICATION_CARD = CardTemplate('application', """
+<div class="content-card">
+    <div style="display: flex; justify-content: space-between; align-items: start;">
+        <div>
+            <h4 style="margin: 0; color: var(--peach-dark);">{position}</h4>
+            <p style="margin: 5px 0; color: var(--peach-primary);">{company_name}</p>
+            <p style="margin: 0;"><strong>Студент:</strong> {full_name}</p>
+            <p style="margin: 0;"><strong>Email:</strong> {student_email}</p>
+            <p style="margin: 0;"><strong>Телефон:</strong> {contact_number}</p>
+            <p style="margin: 5px 0;"><strong>Дата:</strong> {date}</p>
+        </div>
+        <span class="status-badge status-{status}">{status_text}</span>
+    </div>
+    {cover_letter_html}
+</div>
+""")
+
+# Отклик на главной администратора (кратко)
+RECENT_APPLICATION_CARD = CardTemplate('recent_application', """
+<div class="content-card">
+    <div style="display: flex; justify-content: space-between; align-items: start;">
+        <div>
+            <h4 style="margin: 0; color: var(--peach-dark);">{position}</h4>
+            <p style="margin: 5px 0; color: var(--peach-primary);">{company_name}</p>
+            <p style="margin: 0;"><strong>Студент:</strong> {full_name}</p>
+            <p style="margin: 5px 0;"><strong>Дата:</strong> {date}</p>
+        </div>
+        <span class="status-badge status-{status}">{status_text}</span>
+    </div>
+    {cover_letter_html}
+</div>
+""")
+
+COVER_LETTER = CardTemplate('cover_letter', """
+<p style="margin-top: 10px;"><strong>Сопроводительное письмо:</strong><br>{cover_letter}</p>
+""")
+
+
+def cover_letter(letter):
+    """Блок сопроводительного письма или пустая строка"""
+    return COVER_LETTER.render({'cover_letter': letter}) if _clean(letter) else ''
@@ -0,0 +1,111 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.graph_objects as go
+
+import query_cache
+
+# ========== ДАННЫЕ ДЛЯ ГРАФИКОВ ==========
+# В фигуру попадают только агрегаты: счетчики групп, корзины гистограммы,
+# точки рядов. Размер JSON, который уходит в браузер, зависит от числа
+# корзин и периодов, а не от числа студентов. Готовая фигура хранится по
+# версии данных (table_versions): пока таблицы не менялись, повторный
+# показ не читает БД и не собирает фигуру заново. Хранится сам объект
+# Figure - разбор JSON обратно в Figure стоит дороже, чем его сборка.
+MAX_FIGURES = 64
+MAX_SERIES = 8  # линий на графике динамики, остальные группы - одной линией
+OTHER_LABEL = "Прочие"
+EMPTY_LABEL = "Не указано"
+
+_lock = threading.Lock()
+_figures = OrderedDict()  # (файл БД, ключ) -> (версия данных, Figure)
+
+
+def cached_figure(database, key, tables, build):
+    """Фигура из кэша либо build() с сохранением.
+
+    key - имя графика и все параметры, от которых зависит фигура;
+    tables - таблицы, по версиям которых она устаревает.
+    """
+    version = query_cache.data_version(database, tables)
+    if version is None:
+        return build()  # схема без table_versions - без кэша
+
+    cache_key = (database, key)
+    with _lock:
+        entry = _figures.get(cache_key)
+        if entry is not None and entry[0] == version:
+            _figures.move_to_end(cache_key)
+            return entry[1]
+
+    figure = build()
+    with _lock:
+        _figures[cache_key] = (version, figure)
+        _figures.move_to_end(cache_key)
+        while len(_figures) > MAX_FIGURES:
+            _figures.popitem(last=False)
+    return figure
+
+
+# ---------- Построение фигур из агрегатов ----------
+def pie(counts, title, colors=None, textinfo=None):
+    """Круговая диаграмма из {метка: количество}"""
+    trace = go.Pie(labels=list(counts), values=list(counts.values()), sort=False,
+                   marker={'colors': colors} if colors else None)
+    if textinfo:
+        trace.update(textposition='inside', textinfo=textinfo)
+    return go.Figure(trace, layout={'title': {'text': title}})
+
+
+def bar(counts, title, x_title, y_title, colorscale=None):
+    """Горизонтальные столбики из {метка: количество}, цвет - по величине"""
+    values = list(counts.values())
+    marker = {'color': values, 'colorscale': colorscale, 'showscale': True} if colorscale else None
+    figure = go.Figure(go.Bar(x=values, y=list(counts), orientation='h', marker=marker),
+                       layout={'title': {'text': title}})
+    figure.update_layout(xaxis_title=x_title, yaxis_title=y_title)
+    return figure
+
+
+def histogram(counts, edges, title, x_title, y_title, color=None):
+    """Гистограмма из готовых корзин: counts[i] - число значений в [edges[i], edges[i + 1])"""
+    edges = np.asarray(edges, dtype=float)
+    figure = go.Figure(go.Bar(x=edges[:-1], y=np.asarray(counts), width=np.diff(edges), offset=0,
+                              marker={'color': color} if color else None),
+                       layout={'title': {'text': title}})
+    figure.update_layout(xaxis_title=x_title, yaxis_title=y_title, bargap=0)
+    return figure
+
+
+def pivot_series(periods, values, groups=None, max_series=MAX_SERIES):
+    """Длинный ряд (период, группа, значение) -> (периоды, [(группа, значения по периодам)]).
+
+    Пропущенные сочетания период/группа - нули. Групп не больше
+    max_series: самые крупные по сумме, остальные складываются в одну.
+    """
+    period_index, period_positions = np.unique(np.asarray(periods, dtype=str), return_inverse=True)
+    values = np.asarray(values, dtype=float)
+    if groups is None:
+        return period_index, [(None, np.bincount(period_positions, values, len(period_index)))]
+
+    group_index, group_positions = np.unique(np.asarray(groups, dtype=str), return_inverse=True)
+    matrix = np.zeros((len(group_index), len(period_index)))
+    np.add.at(matrix, (group_positions, period_positions), values)
+
+    order = np.argsort(-matrix.sum(axis=1), kind='stable')
+    series = [(str(group_index[i]) or EMPTY_LABEL, matrix[i]) for i in order[:max_series]]
+    if len(order) > max_series:
+        series.append((OTHER_LABEL, matrix[order[max_series:]].sum(axis=0)))
+    return period_index, series
+
+
+def line(periods, values, title, x_title, y_title, groups=None):
+    """Линии по периодам; groups - группа каждой точки (или None - одна линия)"""
+    period_index, series = pivot_series(periods, values, groups)
+    figure = go.Figure(layout={'title': {'text': title}})
+    for name, points in series:
+        figure.add_trace(go.Scatter(x=period_index, y=points, name=name, mode='lines+markers',
+                                    showlegend=name is not None))
+    figure.update_layout(xaxis_title=x_title, yaxis_title=y_title)
+    return figure
@@ -0,0 +1,183 @@
+import streamlit as st
+import html
+
+# ========== КОМПОНЕНТЫ ИНТЕРФЕЙСА ==========
+def create_header():
+    st.markdown("""
+    <div class="main-header">
+        <h1>🎓 ТВОЯ КАРЬЕРА ОТ КЭУ</h1>
+        <p>Карагандинский экономический университет Казпотребсоюза</p>
+        <p>Платформа для трудоустройства студентов</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def metric_card(title, value, icon="📊", change=None):
+    change_html = ""
+    if change:
+        color = "var(--success)" if change > 0 else "var(--danger)" if change < 0 else "var(--text-light)"
+        change_html = f'<div style="font-size: 0.9rem; color: {color}; margin-top: 5px;">{change:+}%</div>'
+
+    st.markdown(f"""
+    <div class="metric-card">
+        <div style="font-size: 2.5rem; margin-bottom: 10px; color: var(--peach-dark);">{icon}</div>
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{title}</div>
+        {change_html}
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def back_button():
+    """Универсальная кнопка назад"""
+    if st.button("⬅️ Назад", key="back_button"):
+        st.session_state.page = 'dashboard'
+        st.rerun()
+
+
+def page_cursor(key, filters=()):
+    """Курсор текущей страницы списка key; смена фильтров - возврат к началу"""
+    state = st.session_state.get(f'{key}_pages')
+    if state is None or state['filters'] != filters:
+        state = {'filters': filters, 'cursors': [None]}
+        st.session_state[f'{key}_pages'] = state
+    return state['cursors'][-1]
+
+
+def pagination_controls(key, next_cursor):
+    """Кнопки листания: стек курсоров позволяет вернуться на страницу назад"""
+    cursors = st.session_state[f'{key}_pages']['cursors']
+    if len(cursors) == 1 and next_cursor is None:
+        return
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if len(cursors) > 1 and st.button("⬅️ Предыдущая", key=f"{key}_prev_page", use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.markdown(f"<p style='text-align: center;'>Страница {len(cursors)}</p>", unsafe_allow_html=True)
+    with col_next:
+        if next_cursor is not None and st.button("Следующая ➡️", key=f"{key}_next_page", use_container_width=True):
+            cursors.append(next_cursor)
+            st.rerun()
+
+
+def highlight_snippet(snippet):
+    """Фрагмент из полнотекстового поиска: совпадения выделяются <mark>"""
+    return html.escape(snippet or "").replace('\x02', '<mark>').replace('\x03', '</mark>')
+
+
+def plain_snippet(snippet):
+    """Фрагмент из полнотекстового поиска для таблиц: совпадения в «»"""
+    return (snippet or "").replace('\x02', '«').replace('\x03', '»')
+
+
+# ========== САЙДБАР ==========
+def create_sidebar():
+    with st.sidebar:
+        # Логотип
+        st.markdown("""
+        <div class="logo-container">
+            <div style="font-size: 3.5rem; color: var(--peach-dark);">🎓</div>
+            <h2>КЭУ Казпотребсоюза</h2>
+            <p>Карьерный центр</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Профиль пользователя
+        user = st.session_state.user
+        st.markdown(f"""
+        <div class="user-profile">
+            <div style="font-size: 2rem; color: var(--peach-primary);">
+                {'👨‍💼' if user['role'] == 'admin' else '👨‍🎓'}
+            </div>
+            <h4>{user['full_name']}</h4>
+            <div class="user-role">
+                {'Администратор' if user['role'] == 'admin' else 'Студент'}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Разделитель
+        st.markdown("---")
+
+        # Навигация для студентов
+        if user['role'] == 'student':
+            nav_items = [
+                ("🏠 Главная", "dashboard"),
+                ("👤 Мой профиль", "profile"),
+                ("💼 Вакансии", "vacancies"),
+                ("📨 Мои отклики", "my_applications"),
+                ("📊 Статистика", "stats")
+            ]
+        # Навигация для админа
+        else:
+            nav_items = [
+                ("🏠 Главная", "dashboard"),
+                ("👨‍🎓 Все студенты", "students"),
+                ("👨‍🎓 Детальная таблица", "students_detailed"),
+                ("💼 Вакансии", "vacancies"),
+                ("📨 Все отклики", "applications"),
+                ("🎯 Шорт-листы", "shortlist"),
+                ("📥 Импорт студентов", "import_students"),
+                ("📊 Аналитика", "analytics"),
+                ("➕ Новая вакансия", "add_vacancy")
+            ]
+
+        # Создаем кнопки навигации с уникальными ключами
+        for i, (label, page_key) in enumerate(nav_items):
+            button_type = "admin" if user['role'] == 'admin' else "student"
+            key = f"nav_{page_key}_{i}_{user['role']}"
+
+            if st.button(label, key=key, use_container_width=True):
+                st.session_state.page = page_key
+                st.rerun()
+
+        st.markdown("---")
+
+        # Статистика в сайдбаре
+        try:
+            stats = st.session_state.db_manager.get_statistics()
+            st.markdown(f"""
+            <div style="background: white; padding: 15px; border-radius: 10px; border: 2px solid var(--peach-light); 
+                         box-shadow: 0 3px 10px rgba(0, 0, 0, 0.1);">
+                <h4 style="color: var(--peach-dark); margin: 0 0 10px 0; text-align: center;">
+                    📊 Быстрая статистика
+                </h4>
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.2rem; font-weight: 700; color: var(--peach-dark);">{stats['total_students']}</div>
+                        <div style="font-size: 0.8rem; color: var(--text-light);">Студентов</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.2rem; font-weight: 700; color: var(--peach-dark);">{stats['active_vacancies']}</div>
+                        <div style="font-size: 0.8rem; color: var(--text-light);">Вакансий</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.2rem; font-weight: 700; color: var(--peach-dark);">{stats['total_applications']}</div>
+                        <div style="font-size: 0.8rem; color: var(--text-light);">Откликов</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.2rem; font-weight: 700; color: var(--peach-dark);">{stats['accepted_applications']}</div>
+                        <div style="font-size: 0.8rem; color: var(--text-light);">Принято</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        except Exception as e:
+            st.error(f"Ошибка статистики: {e}")
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Кнопка выхода
+        if st.button("🚪 Выйти", key="logout_button", use_container_width=True, type="secondary"):
+            logout()
+
+
+def logout():
+    if 'user' in st.session_state:
+        del st.session_state.user
+    st.session_state.pop('current_student', None)
+    st.session_state.page = 'login'
+    st.rerun()
@@ -0,0 +1,142 @@
+import base64
+import functools
+import hashlib
+import hmac
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+
+import db_pool
+import db_writer
+
+# ========== ПАРОЛИ ==========
+# Хэш - scrypt с солью, параметры записаны в самой строке:
+#   scrypt$<n>$<r>$<p>$<соль base64>$<ключ base64>
+# Старые хэши (64 hex-символа несоленого SHA-256) проверяются как раньше
+# и при первом удачном входе заменяются на scrypt. Вычисление ключа
+# (~16 МБ памяти и десятки миллисекунд) идет в ограниченном пуле: волна
+# входов ждет своей очереди, а не занимает все ядра, нужные страницам.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+KEY_BYTES = 32
+MAX_MEMORY = 64 * 1024 * 1024
+
+SCHEME = 'scrypt'
+MAX_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='kdf')
+
+
+def _b64(data):
+    return base64.b64encode(data).decode('ascii')
+
+
+def _scrypt(password, salt, n, r, p):
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                          dklen=KEY_BYTES, maxmem=MAX_MEMORY)
+
+
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """Строка хэша scrypt с новой солью (синхронно, в текущем потоке)"""
+    salt = secrets.token_bytes(SALT_BYTES)
+    return f"{SCHEME}${n}${r}${p}${_b64(salt)}${_b64(_scrypt(password, salt, n, r, p))}"
+
+
+def legacy_hash(password):
+    """Прежний формат: несоленый SHA-256"""
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def login_key(value):
+    """Ключ логина или email для сравнения без учета регистра.
+
+    COLLATE NOCASE в SQLite складывает только ASCII («Иванов» и «иванов» для
+    него разные), поэтому ключ - casefold() из Python. Он хранится в
+    users.username_key и users.email_key (schema.py); каждая вставка в users
+    заполняет обе колонки.
+    """
+    return value.casefold() if value else None
+
+
+def verify_password(password, stored):
+    """Совпадает ли пароль с хэшем (scrypt или старым SHA-256)"""
+    if not stored:
+        return False
+    if stored.startswith(SCHEME + '$'):
+        try:
+            _, n, r, p, salt, key = stored.split('$')
+            expected = base64.b64decode(key)
+            actual = _scrypt(password, base64.b64decode(salt), int(n), int(r), int(p))
+        except ValueError:
+            return False  # испорченная строка хэша
+        return hmac.compare_digest(actual, expected)
+    # Байты, а не str: compare_digest отвергает str с не-ASCII символами
+    return hmac.compare_digest(legacy_hash(password).encode(), stored.encode('utf-8'))
+
+
+def needs_rehash(stored):
+    """Хэш старого формата или с параметрами слабее текущих"""
+    if not stored or not stored.startswith(SCHEME + '$'):
+        return True
+    try:
+        _, n, r, p, _ = stored.split('$', 4)
+    except ValueError:
+        return True
+    return (int(n), int(r), int(p)) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+
+# ---------- Через пул ----------
+def make_hash(password):
+    """hash_password в пуле; ждет результат"""
+    return _executor.submit(hash_password, password).result()
+
+
+def hash_passwords(passwords):
+    """Хэши для списка паролей (в пуле, порядок сохраняется)"""
+    return list(_executor.map(hash_password, passwords))
+
+
+@functools.lru_cache(maxsize=1)
+def _dummy_hash():
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def check_password(password, stored):
+    """verify_password в пуле; ждет результат.
+
+    stored=None (логин не найден) - проверка против случайного хэша: ответ
+    занимает столько же времени, и по нему не видно, есть ли пользователь.
+    """
+    if stored is None:
+        _executor.submit(verify_password, password, _dummy_hash()).result()
+        return False
+    return _executor.submit(verify_password, password, stored).result()
+
+
+def authenticate(database, query, login, password):
+    """Строка пользователя по логину или email и паролю, иначе None.
+
+    query выбирает (id, password_hash, username, ...) по двум параметрам
+    "username_key = ? OR email_key = ?", оба - login_key(login). Если строк
+    несколько, берется та, у которой логин совпал точно. Старый или слабый хэш после
+    удачной проверки переписывается через писателя (db_writer); вход его
+    не ждет.
+    """
+    with db_pool.connection(database) as conn:
+        key = login_key(login)
+        rows = conn.execute(query, (key, key)).fetchall()
+    rows.sort(key=lambda row: row[2] != login)
+    row = rows[0] if rows else None
+
+    if not check_password(password, row[1] if row else None):
+        return None
+
+    if needs_rehash(row[1]):
+        def rehash(new_hash, user_id=row[0], old_hash=row[1]):
+            db_writer.submit(database, db_writer.statement(
+                "UPDATE users SET password_hash = ? WHERE id = ? AND password_hash = ?",
+                (new_hash, user_id, old_hash)))
+        _executor.submit(hash_password, password).add_done_callback(lambda f: rehash(f.result()))
+    return row
@@ -3,154 +3,32 @@ import pandas as pd
 import sqlite3
 from datetime import datetime
 import json
+import db_pool
+import db_writer
+import exports
+import migrations
+import page_filters
+import queries
+import query_cache
+import records
+import schema
+import skills
 
 # ========== БАЗА ДАННЫХ SQLite ==========
 DATABASE_NAME = 'recruit_system.db'
 
 
 def get_db_connection():
-    """Создает соединение с базой данных SQLite."""
-    try:
-        conn = sqlite3.connect(DATABASE_NAME, check_same_thread=False)
-        return conn
-    except sqlite3.Error as e:
-        st.error(f"Ошибка подключения к БД: {e}")
-        return None
+    """Соединение из общего пула (использовать через with, закрывать не нужно)"""
+    return db_pool.connection(DATABASE_NAME)
 
 
 def init_database():
-    """Инициализация базы данных с вашей структурой"""
-    conn = get_db_connection()
-    if conn is None:
-        return
-
-    cursor = conn.cursor()
-
-    # Основная таблица студентов (ваша структура)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS students (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            full_name TEXT NOT NULL,
-            course INTEGER NOT NULL,
-            specialization TEXT,
-            programming_languages TEXT,
-            work_experience TEXT,
-            portfolio_link TEXT,
-            contact_number TEXT,
-            document_id TEXT,
-            is_active BOOLEAN,
-            email TEXT,
-            gpa REAL,
-            university TEXT DEFAULT 'Международный Университет Информационных Технологий',
-            graduation_year INTEGER,
-            registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    # Таблица вакансий
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS vacancies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            position TEXT NOT NULL,
-            specialization TEXT,
-            required_course INTEGER,
-            salary_range TEXT,
-            description TEXT,
-            requirements TEXT,
-            contact_email TEXT,
-            application_deadline DATE,
-            is_active INTEGER DEFAULT 1,
-            posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    # Таблица откликов на вакансии
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id INTEGER,
-            vacancy_id INTEGER,
-            application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            status TEXT DEFAULT 'pending',
-            cover_letter TEXT,
-            FOREIGN KEY (student_id) REFERENCES students (id),
-            FOREIGN KEY (vacancy_id) REFERENCES vacancies (id)
-        )
-    ''')
-
-    # Таблица уведомлений
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS notifications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            title TEXT NOT NULL,
-            message TEXT NOT NULL,
-            is_read INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            notification_type TEXT DEFAULT 'info'
-        )
-    ''')
-
-    # Таблица отчетов о трудоустройстве
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS employment_reports (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id INTEGER,
-            company_name TEXT,
-            position TEXT,
-            employment_date DATE,
-            salary TEXT,
-            report_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (student_id) REFERENCES students (id)
-        )
-    ''')
-
-    # Проверяем, есть ли данные в таблице students
-    cursor.execute("SELECT COUNT(*) FROM students")
-    if cursor.fetchone()[0] == 0:
-        # Добавляем тестовых студентов
-        test_students = [
-            ('Алиев Аскар Бауыржанович', 4, 'Информационные Системы', 'Python, SQL, Java',
-             'Разработка веб-приложений на Django, участие в хакатонах',
-             'https://github.com/askarali', '+7 701 123 4567', '123456789012',
-             1, 'askar@email.com', 3.8, 'Международный Университет Информационных Технологий', 2024),
-            ('Смирнова Анна Ивановна', 5, 'Компьютерные Науки', 'C++, Python, JavaScript',
-             'Стажировка в ТОО "КазТех", разработка мобильного приложения',
-             'https://github.com/annasm', '+7 777 987 6543', '987654321098',
-             1, 'anna@email.com', 3.9, 'Казахстанско-Британский Технический Университет', 2024),
-        ]
-
-        cursor.executemany('''
-            INSERT INTO students 
-            (full_name, course, specialization, programming_languages, work_experience, 
-             portfolio_link, contact_number, document_id, is_active, email, gpa, university, graduation_year)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', test_students)
-
-    # Проверяем, есть ли данные в таблице vacancies
-    cursor.execute("SELECT COUNT(*) FROM vacancies")
-    if cursor.fetchone()[0] == 0:
-        # Добавляем тестовые вакансии
-        test_vacancies = [
-            ('Kaspi Bank', 'Junior Java Developer', 'Программная Инженерия', 4,
-             'от 300 000 KZT', 'Разработка backend систем для банковских приложений',
-             'Java, Spring Boot, SQL, Git', 'hr@kaspi.kz', '2024-12-31'),
-            ('One Technologies', 'Python Developer', 'Информационные Системы', 4,
-             '350 000 - 500 000 KZT', 'Разработка микросервисов на Python',
-             'Python, FastAPI, PostgreSQL, Docker', 'career@one.kz', '2024-12-15'),
-        ]
-
-        cursor.executemany('''
-            INSERT INTO vacancies 
-            (company_name, position, specialization, required_course, salary_range,
-             description, requirements, contact_email, application_deadline)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', test_vacancies)
-
-    conn.commit()
-    conn.close()
+    """Инициализация базы данных с вашей структурой (через миграции, раз на процесс)"""
+    try:
+        migrations.migrate(DATABASE_NAME, schema.RECRUIT_MIGRATIONS)
+    except sqlite3.Error as e:
+        st.error(f"Ошибка инициализации БД: {e}")
 
 
 # ========== CRUD ОПЕРАЦИИ ДЛЯ SQLite ==========
@@ -158,36 +36,39 @@ class DatabaseManager:
     def __init__(self):
         pass
 
+    def submit_write(self, fn):
+        """Ставит запись fn(cursor) в очередь и возвращает Future с результатом"""
+        return db_writer.submit(DATABASE_NAME, fn)
+
     def execute_query(self, query, params=()):
-        """Выполняет SQL запрос с созданием нового соединения"""
-        conn = get_db_connection()
-        if conn is None:
-            return None
+        """Выполняет SQL запрос на запись и ждет подтверждения коммита"""
+        return self.execute_write(db_writer.statement(query, params))
+
+    def execute_write(self, fn):
+        """Выполняет запись fn(cursor); None - если запись не удалась"""
         try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor
-        except sqlite3.Error as e:
+            return db_writer.wait(self.submit_write(fn))
+        except (sqlite3.Error, TimeoutError) as e:
             st.error(f"Ошибка выполнения запроса: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
+
+    def fetch_record(self, table, query, params=()):
+        """Одна строка запроса как запись (records.py) или None; кэш - по версии таблицы table"""
+        def load():
+            with get_db_connection() as conn:
+                return records.fetch_one(conn, query, params)
+        return query_cache.get_record(DATABASE_NAME, table, (query, tuple(params)), load)
 
     def execute_read_query(self, query, params=()):
-        """Выполняет SQL запрос на чтение"""
-        conn = get_db_connection()
-        if conn is None:
-            return pd.DataFrame()
+        """Выполняет SQL запрос на чтение (через общий кэш результатов)"""
+        def load():
+            with get_db_connection() as conn:
+                return pd.read_sql_query(query, conn, params=params)
         try:
-            return pd.read_sql_query(query, conn, params=params)
+            return query_cache.get_or_load(DATABASE_NAME, query, params, load)
         except Exception as e:
             st.error(f"Ошибка выполнения запроса на чтение: {e}")
             return pd.DataFrame()
-        finally:
-            if conn:
-                conn.close()
 
     # Студенты
     def insert_student(self, data):
@@ -197,19 +78,26 @@ class DatabaseManager:
              portfolio_link, contact_number, document_id, email, gpa, graduation_year, is_active)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
-        result = self.execute_query(query, data)
+
+        def write(cursor):
+            cursor.execute(query, data)
+            skills.set_student_skills(cursor, cursor.lastrowid, skills.parse_skills(data[3]))
+            return cursor.lastrowid
+
+        result = self.execute_write(write)
         return result is not None
 
     def get_all_students(self):
-        query = "SELECT * FROM students ORDER BY registration_date DESC"
-        return self.execute_read_query(query)
+        return self.execute_read_query(queries.ALL_STUDENTS)
+
+    def find_students(self, filters=(), limit=queries.SEARCH_LIMIT):
+        """Студенты по фильтрам (page_filters) одним запросом с LIMIT"""
+        conditions, params = page_filters.compile_filters(filters)
+        query = queries.keyset_page(queries.STUDENTS_PAGE_SELECT, queries.STUDENTS_PAGE_ORDER, conditions)
+        return self.execute_read_query(query, (*params, limit))
 
     def get_student_by_id(self, student_id):
-        query = "SELECT * FROM students WHERE id = ?"
-        result = self.execute_read_query(query, (student_id,))
-        if not result.empty:
-            return result.iloc[0]
-        return None
+        return self.fetch_record('students', queries.STUDENT_BY_ID, (int(student_id),))
 
     def update_student(self, student_id, data):
         query = '''
@@ -220,8 +108,20 @@ class DatabaseManager:
             last_update = CURRENT_TIMESTAMP
             WHERE id = ?
         '''
-        result = self.execute_query(query, (*data, student_id))
-        return result is not None
+
+        def write(cursor):
+            cursor.execute(query, (*data, student_id))
+            updated = cursor.rowcount
+            # Нет такого студента - связи навыков не трогаем, иначе останутся сироты
+            if updated:
+                skills.set_student_skills(cursor, student_id, skills.parse_skills(data[3]))
+            return updated
+
+        return bool(self.execute_write(write))
+
+    def find_students_by_skills(self, names, match_all=True, limit=queries.SEARCH_LIMIT):
+        """Студенты, знающие все (match_all) или любой из навыков names"""
+        return self.find_students((page_filters.has_skills(names, match_all),), limit)
 
     def delete_student(self, student_id):
         query = "DELETE FROM students WHERE id = ?"
@@ -240,8 +140,7 @@ class DatabaseManager:
         return result is not None
 
     def get_all_vacancies(self):
-        query = "SELECT * FROM vacancies WHERE is_active = 1 ORDER BY posted_date DESC"
-        return self.execute_read_query(query)
+        return self.execute_read_query(queries.ACTIVE_VACANCIES)
 
     # Отклики на вакансии
     def apply_for_vacancy(self, student_id, vacancy_id, cover_letter=""):
@@ -280,8 +179,7 @@ class DatabaseManager:
 
     def get_notifications(self, user_id=None):
         if user_id:
-            query = "SELECT * FROM notifications WHERE user_id = ? ORDER BY created_at DESC"
-            return self.execute_read_query(query, (user_id,))
+            return self.execute_read_query(queries.NOTIFICATIONS_BY_USER, (user_id,))
         else:
             query = "SELECT * FROM notifications ORDER BY created_at DESC LIMIT 50"
             return self.execute_read_query(query)
@@ -311,23 +209,17 @@ class DatabaseManager:
         '''
         return self.execute_read_query(query)
 
+    def export_csv(self, export, filters=()):
+        """Потоковая выгрузка в CSV (exports.py): временный файл, открытый на чтение"""
+        return exports.csv_file(DATABASE_NAME, export, filters)
+
     # Статистика
     def get_statistics(self):
-        query = '''
-            SELECT 
-                (SELECT COUNT(*) FROM students) as total_students,
-                (SELECT COUNT(*) FROM students WHERE is_active = 1) as active_students,
-                (SELECT COUNT(*) FROM vacancies WHERE is_active = 1) as active_vacancies,
-                (SELECT COUNT(*) FROM applications) as total_applications,
-                (SELECT COUNT(*) FROM employment_reports) as employed_students,
-                (SELECT COUNT(*) FROM notifications WHERE is_read = 0) as unread_notifications
-        '''
-        result = self.execute_read_query(query)
-        if not result.empty:
-            return result.iloc[0]
-        return pd.Series([0, 0, 0, 0, 0, 0],
-                         index=['total_students', 'active_students', 'active_vacancies',
-                                'total_applications', 'employed_students', 'unread_notifications'])
+        stats = self.fetch_record('stats', queries.RECRUIT_STATISTICS)
+        if stats is not None:
+            return stats
+        return records.filled(['total_students', 'active_students', 'active_vacancies',
+                               'total_applications', 'employed_students', 'unread_notifications'])
 
 
 # ========== ГЛОБАЛЬНЫЕ НАСТРОЙКИ ==========
@@ -494,13 +386,12 @@ def student_management_page():
     search_query = st.text_input("🔍 Поиск по имени", placeholder="Введите ФИО...")
 
     try:
-        # Получение данных
-        students_df = st.session_state.db_manager.get_all_students()
+        # Получение данных: поиск выполняется в SQL
+        db_manager = st.session_state.db_manager
+        filters = page_filters.student_filters(name=search_query)
+        students_df = db_manager.find_students(filters)
 
         if not students_df.empty:
-            if search_query:
-                students_df = students_df[students_df['full_name'].str.contains(search_query, case=False, na=False)]
-
             # Таблица студентов
             st.dataframe(
                 students_df[
@@ -516,12 +407,33 @@ def student_management_page():
                 use_container_width=True,
                 hide_index=True
             )
+            st.download_button(
+                label="📥 Экспорт в CSV",
+                data=lambda: db_manager.export_csv(exports.STUDENTS, filters),
+                file_name=f"students_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                mime="text/csv",
+                key="export_students_csv"
+            )
         else:
             st.info("👤 Студенты не найдены")
     except Exception as e:
         st.error(f"Ошибка при загрузке данных: {e}")
 
 
+def employment_reports_page():
+    """Отчеты о трудоустройстве (пока только выгрузка)"""
+    st.header("📊 Трудоустройство (страница в разработке)")
+
+    db_manager = st.session_state.db_manager
+    st.download_button(
+        label="📥 Экспорт отчетов в CSV",
+        data=lambda: db_manager.export_csv(exports.EMPLOYMENT_REPORTS),
+        file_name=f"employment_reports_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+        mime="text/csv",
+        key="export_employment_csv"
+    )
+
+
 def main():
     init_session_state()
     apply_custom_styles()
@@ -723,7 +635,7 @@ def main():
         'students': student_management_page,
         'vacancies': lambda: st.header("💼 Вакансии (страница в разработке)"),
         'applications': lambda: st.header("📨 Отклики (страница в разработке)"),
-        'employment_reports': lambda: st.header("📊 Трудоустройство (страница в разработке)"),
+        'employment_reports': employment_reports_page,
         'notifications': lambda: st.header("🔔 Уведомления (страница в разработке)"),
         'analytics': lambda: st.header("📈 Аналитика (страница в разработке)"),
         'student_form': lambda: st.header("📝 Форма студента (страница в разработке)"),
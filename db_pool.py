@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import threading
+import queue
+from contextlib import contextmanager
+
+# ========== ПУЛ СОЕДИНЕНИЙ SQLite ==========
+DEFAULT_POOL_SIZE = 8
+ACQUIRE_TIMEOUT = 10  # секунд ожидания свободного соединения
+BUSY_TIMEOUT_MS = 5000
+
+# Режим хранения: 'wal' включает WAL-журнал, busy_timeout и запись через
+# единственный поток-писатель (см. db_writer). По умолчанию - rollback-журнал.
+STORAGE_MODE = os.environ.get('DB_STORAGE_MODE', 'rollback').lower()
+
+
+def wal_enabled():
+    return STORAGE_MODE == 'wal'
+
+
+def apply_storage_pragmas(conn):
+    """Настройки соединения для выбранного режима хранения"""
+    if wal_enabled():
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+
+def _unicode_lower(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+def register_functions(conn):
+    """SQL-функции приложения. Встроенный lower() в SQLite понимает только
+    ASCII, поэтому поиск без учета регистра по кириллице идет через py_lower().
+    """
+    conn.create_function('py_lower', 1, _unicode_lower, deterministic=True)
+
+
+class PoolExhaustedError(sqlite3.OperationalError):
+    """Все соединения пула заняты дольше ACQUIRE_TIMEOUT"""
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+class ConnectionPool:
+    """Ограниченный пул соединений к одному файлу БД.
+
+    Соединения создаются лениво (не больше max_size), перед выдачей
+    проверяются запросом SELECT 1 и переиспользуются всеми потоками
+    Streamlit, поэтому открываются с check_same_thread=False.
+    """
+
+    def __init__(self, database, max_size=DEFAULT_POOL_SIZE, timeout=ACQUIRE_TIMEOUT):
+        self.database = database
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.database, check_same_thread=False)
+        apply_storage_pragmas(conn)
+        register_functions(conn)
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn):
+        try:
+            # Незавершенная транзакция предыдущего владельца не должна утечь
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self):
+        """Выдает соединение из пула, при необходимости создает новое"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolExhaustedError(f"Нет свободных соединений к {self.database}")
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if self._is_healthy(conn):
+                    return conn
+                _close_quietly(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn):
+        """Возвращает соединение в пул (битые соединения закрываются)"""
+        try:
+            if not self._closed and self._is_healthy(conn):
+                self._idle.put(conn)
+            else:
+                _close_quietly(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Закрывает простаивающие соединения и запрещает возврат остальных"""
+        self._closed = True
+        while True:
+            try:
+                _close_quietly(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(database):
+    """Один пул на файл БД на весь процесс (переживает перезапуски скрипта)"""
+    pool = _pools.get(database)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(database)
+            if pool is None:
+                pool = ConnectionPool(database)
+                _pools[database] = pool
+    return pool
+
+
+def connection(database):
+    """Контекстный менеджер: соединение из пула для указанного файла БД"""
+    return get_pool(database).connection()
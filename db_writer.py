@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+import queue
+from collections import namedtuple
+from concurrent.futures import Future
+
+import db_pool
+
+# ========== ОЧЕРЕДЬ ЗАПИСИ (ОДИН ПИСАТЕЛЬ НА ФАЙЛ БД) ==========
+MAX_BATCH = 64  # сколько ожидающих записей объединять в один коммит
+WRITE_TIMEOUT = 30  # секунд, которые вызывающий ждет подтверждения записи
+
+WriteResult = namedtuple('WriteResult', ['lastrowid', 'rowcount'])
+
+
+def statement(query, params=()):
+    """Запись из одного SQL-оператора в виде задачи для очереди"""
+    def run(cursor):
+        cursor.execute(query, params)
+        return WriteResult(cursor.lastrowid, cursor.rowcount)
+    return run
+
+
+class WriteQueue:
+    """Поток-писатель: выполняет задачи по очереди и коммитит их группами.
+
+    Задача - функция fn(cursor), ее результат возвращается через Future
+    только после COMMIT. Каждая задача выполняется в своем SAVEPOINT,
+    поэтому ошибка одной не откатывает соседей по группе. Любое исключение
+    задачи (включая BaseException) уходит в ее Future: поток-писатель не
+    должен умирать, иначе все последующие записи ждали бы вечно.
+    """
+
+    def __init__(self, database, max_batch=MAX_BATCH):
+        self.database = database
+        self.max_batch = max_batch
+        self._jobs = queue.Queue()
+        self._conn = sqlite3.connect(database, check_same_thread=False, isolation_level=None)
+        db_pool.apply_storage_pragmas(self._conn)
+        db_pool.register_functions(self._conn)  # py_lower() в условиях фильтров (page_filters)
+        self._thread = threading.Thread(target=self._run, name=f"db-writer:{database}", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn):
+        future = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def execute(self, query, params=()):
+        return self.submit(statement(query, params))
+
+    def _next_batch(self):
+        batch = [self._jobs.get()]
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._jobs.get_nowait())
+            except queue.Empty:
+                break
+        return [job for job in batch if job[1].set_running_or_notify_cancel()]
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._commit_batch(batch)
+
+    def _commit_batch(self, batch):
+        cursor = self._conn.cursor()
+        done = []
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            for fn, future in batch:
+                cursor.execute("SAVEPOINT write_job")
+                try:
+                    result = fn(cursor)
+                except BaseException as e:
+                    cursor.execute("ROLLBACK TO write_job")
+                    cursor.execute("RELEASE write_job")
+                    future.set_exception(e)
+                    continue
+                cursor.execute("RELEASE write_job")
+                done.append((future, result))
+            cursor.execute("COMMIT")
+        except BaseException as e:
+            try:
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+            except sqlite3.Error:
+                pass
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in done:
+            future.set_result(result)
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(database):
+    writer = _writers.get(database)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.get(database)
+            if writer is None:
+                writer = WriteQueue(database)
+                _writers[database] = writer
+    return writer
+
+
+def submit(database, fn):
+    """Выполняет запись fn(cursor) и возвращает Future с ее результатом.
+
+    В режиме WAL задача уходит в очередь писателя, иначе выполняется сразу
+    на соединении из пула, и возвращается уже завершенный Future. Ждать
+    результат - через wait(), с ограничением по времени.
+    """
+    if db_pool.wal_enabled():
+        return get_writer(database).submit(fn)
+
+    future = Future()
+    try:
+        with db_pool.connection(database) as conn:
+            result = fn(conn.cursor())
+            conn.commit()
+    except Exception as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+    return future
+
+
+def wait(future, timeout=WRITE_TIMEOUT):
+    """Результат записи; TimeoutError, если писатель не ответил за timeout секунд.
+
+    Задача при этом остается в очереди и может выполниться позже.
+    """
+    return future.result(timeout=timeout)
+
+
+def write(database, fn, timeout=WRITE_TIMEOUT):
+    """submit() и ожидание результата с ограничением по времени"""
+    return wait(submit(database, fn), timeout)
@@ -0,0 +1,112 @@
+import csv
+import io
+import sys
+import tempfile
+from collections import namedtuple
+
+import db_pool
+import page_filters
+import queries
+
+# ========== ЭКСПОРТ В CSV ==========
+# Строки идут прямо из курсора SQLite порциями по CHUNK_SIZE (fetchmany)
+# и сразу превращаются в текст CSV: ни DataFrame, ни полный список строк
+# не создаются, память не зависит от размера таблицы. Порядок - по тем же
+# индексам, что и у постраничных таблиц, поэтому SQLite не сортирует
+# выборку целиком, а отдает строки по мере чтения индекса.
+CHUNK_SIZE = 1000
+
+# select - колонки в порядке заголовков, order - ORDER BY по индексу
+Export = namedtuple('Export', ['select', 'order', 'headers'])
+
+STUDENTS = Export(queries.STUDENTS_EXPORT_SELECT, queries.STUDENTS_EXPORT_ORDER, [
+    'ФИО', 'Курс', 'Специальность', 'GPA', 'Email', 'Телефон', 'Навыки',
+    'Год выпуска', 'Опыт работы', 'В поиске работы', 'Дата регистрации'
+])
+
+APPLICATIONS = Export(queries.APPLICATIONS_EXPORT_SELECT, queries.APPLICATIONS_EXPORT_ORDER, [
+    'ID', 'Дата отклика', 'Статус', 'Студент', 'Email', 'Телефон',
+    'Позиция', 'Компания', 'Зарплата', 'Сопроводительное письмо'
+])
+
+VACANCIES = Export(queries.VACANCIES_EXPORT_SELECT, queries.VACANCIES_EXPORT_ORDER, [
+    'Позиция', 'Компания', 'Специальность', 'Курс', 'Зарплата', 'Дедлайн',
+    'Контактный email', 'Активна', 'Дата публикации', 'Описание', 'Требования'
+])
+
+EMPLOYMENT_REPORTS = Export(queries.EMPLOYMENT_REPORTS_EXPORT_SELECT, queries.EMPLOYMENT_REPORTS_EXPORT_ORDER, [
+    'Студент', 'Специальность', 'Компания', 'Должность',
+    'Дата трудоустройства', 'Зарплата', 'Дата отчета'
+])
+
+EXPORTS = {
+    'students': STUDENTS,
+    'applications': APPLICATIONS,
+    'vacancies': VACANCIES,
+    'employment_reports': EMPLOYMENT_REPORTS,
+}
+
+
+def iter_rows(cursor, chunk_size=CHUNK_SIZE):
+    """Строки курсора порциями по chunk_size"""
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+
+def iter_csv(database, export, filters=(), conditions=(), params=(), chunk_size=CHUNK_SIZE):
+    """CSV кусками текста: заголовок, затем по chunk_size строк.
+
+    filters (page_filters) компилируются в WHERE вместе с conditions;
+    params - параметры conditions, они идут перед параметрами фильтров.
+    Соединение из пула занято, пока генератор не дочитан или не закрыт.
+    """
+    filter_conditions, filter_params = page_filters.compile_filters(filters)
+    query = queries.ordered_select(export.select, export.order, [*conditions, *filter_conditions])
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(export.headers)
+    with db_pool.connection(database) as conn:
+        # Одно чтение - один снимок БД: в WAL запись не разрывает выгрузку
+        cursor = conn.execute(query, (*params, *filter_params))
+        for rows in iter_rows(cursor, chunk_size):
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()  # пустая выборка - только заголовок
+
+
+def write_csv(fileobj, chunks):
+    """Пишет куски CSV в бинарный файл; BOM - чтобы Excel понял кодировку"""
+    fileobj.write('\ufeff'.encode('utf-8'))
+    for chunk in chunks:
+        fileobj.write(chunk.encode('utf-8'))
+    return fileobj
+
+
+def csv_file(database, export, filters=(), conditions=(), params=(), chunk_size=CHUNK_SIZE):
+    """Выгрузка во временный файл на диске, позиция - в начале файла"""
+    fileobj = tempfile.TemporaryFile()
+    write_csv(fileobj, iter_csv(database, export, filters, conditions, params, chunk_size))
+    fileobj.seek(0)
+    return fileobj
+
+
+def main(argv):
+    # python exports.py keu_career.db students students.csv
+    if len(argv) != 3 or argv[1] not in EXPORTS:
+        print(f"Использование: python exports.py <база> <{'|'.join(EXPORTS)}> <файл.csv>")
+        return 2
+    database, name, path = argv
+    with open(path, 'wb') as fileobj:
+        write_csv(fileobj, iter_csv(database, EXPORTS[name]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
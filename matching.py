@@ -0,0 +1,305 @@
+import re
+
+import numpy as np
+
+# ========== ПОДБОР ВАКАНСИЙ ДЛЯ СТУДЕНТОВ ==========
+# Оценка пары студент-вакансия считается матрично сразу для всех пар:
+# навыки (покрытие навыков вакансии), специальность, курс против
+# required_course и GPA. Лучшие TOP_K пар хранятся в двух таблицах
+# (schema.py): student_matches - вакансии студента, vacancy_matches -
+# студенты вакансии. Страницы только читают их.
+TOP_K = 10
+CHUNK_SIZE = 2048  # студентов на одну матрицу оценок (память ~ CHUNK_SIZE x вакансии)
+
+WEIGHTS = {'skills': 0.4, 'specialization': 0.3, 'course': 0.2, 'gpa': 0.1}
+NEUTRAL_SKILLS = 0.5  # у вакансии в тексте не нашлось ни одного известного навыка
+
+
+class Students:
+    def __init__(self, ids, skills, specialization, course, gpa):
+        self.ids = ids
+        self.skills = skills  # (студенты x навыки), 0/1
+        self.specialization = specialization
+        self.course = course
+        self.gpa = gpa
+
+    def __len__(self):
+        return len(self.ids)
+
+    def chunk(self, start, stop):
+        return Students(self.ids[start:stop], self.skills[start:stop], self.specialization[start:stop],
+                        self.course[start:stop], self.gpa[start:stop])
+
+
+class Vacancies:
+    def __init__(self, ids, skills, specialization, required_course):
+        self.ids = ids
+        self.skills = skills  # (вакансии x навыки), 0/1
+        self.specialization = specialization
+        self.required_course = required_course
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def _skill_index(cursor):
+    cursor.execute("SELECT id, name FROM skills ORDER BY id")
+    return {skill_id: (column, name) for column, (skill_id, name) in enumerate(cursor.fetchall())}
+
+
+def _specialization_codes(values, codes, missing):
+    # Не указанная специальность (разный missing у студентов и вакансий) ни с чем не совпадает
+    return np.array([codes.setdefault(value, len(codes)) if value else missing for value in values],
+                    dtype=np.int32)
+
+
+def _chunks(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), CHUNK_SIZE):
+        yield ids[start:start + CHUNK_SIZE]
+
+
+def load_students(cursor, skill_index, codes, student_ids=None):
+    query = "SELECT id, specialization, course, gpa FROM students"
+    params = ()
+    if student_ids is not None:
+        query += f" WHERE id IN ({', '.join('?' for _ in student_ids)})"
+        params = tuple(student_ids)
+    cursor.execute(query + " ORDER BY id", params)
+    rows = cursor.fetchall()
+
+    ids = np.array([row[0] for row in rows], dtype=np.int64)
+    position = {student_id: row for row, student_id in enumerate(ids.tolist())}
+    matrix = np.zeros((len(rows), len(skill_index)), dtype=np.float32)
+    cursor.execute("SELECT student_id, skill_id FROM student_skills" +
+                   (f" WHERE student_id IN ({', '.join('?' for _ in student_ids)})" if student_ids is not None else ""),
+                   params)
+    for student_id, skill_id in cursor.fetchall():
+        if student_id in position and skill_id in skill_index:
+            matrix[position[student_id], skill_index[skill_id][0]] = 1
+
+    return Students(
+        ids, matrix,
+        _specialization_codes([row[1] for row in rows], codes, -1),
+        np.array([row[2] or 0 for row in rows], dtype=np.float32),
+        np.array([row[3] or 0 for row in rows], dtype=np.float32),
+    )
+
+
+def load_vacancies(cursor, skill_index, codes, vacancy_ids=None):
+    """Активные вакансии; навыки вакансии - известные навыки, упомянутые в ее тексте"""
+    query = "SELECT id, specialization, required_course, position, description, requirements FROM vacancies " \
+            "WHERE is_active = 1"
+    params = ()
+    if vacancy_ids is not None:
+        query += f" AND id IN ({', '.join('?' for _ in vacancy_ids)})"
+        params = tuple(vacancy_ids)
+    cursor.execute(query + " ORDER BY id", params)
+    rows = cursor.fetchall()
+
+    patterns = [(column, re.compile(r'(?<!\w)' + re.escape(name.lower()) + r'(?!\w)'))
+                for column, name in skill_index.values()]
+    matrix = np.zeros((len(rows), len(skill_index)), dtype=np.float32)
+    for row, vacancy in enumerate(rows):
+        text = " ".join(part for part in vacancy[3:] if part).lower()
+        for column, pattern in patterns:
+            if pattern.search(text):
+                matrix[row, column] = 1
+
+    return Vacancies(
+        np.array([row[0] for row in rows], dtype=np.int64), matrix,
+        _specialization_codes([row[1] for row in rows], codes, -2),
+        np.array([row[2] or 1 for row in rows], dtype=np.float32),
+    )
+
+
+def score(students, vacancies):
+    """Матрица оценок (студенты x вакансии) в диапазоне [0, 1]"""
+    required = vacancies.skills.sum(axis=1)
+    overlap = students.skills @ vacancies.skills.T
+    skills = np.where(required > 0, overlap / np.maximum(required, 1), NEUTRAL_SKILLS)
+    specialization = (students.specialization[:, None] == vacancies.specialization[None, :])
+    # Каждый недостающий курс снимает треть балла за курс
+    course = np.clip(1 - (vacancies.required_course[None, :] - students.course[:, None]) / 3, 0, 1)
+    gpa = np.clip(students.gpa / 4, 0, 1)[:, None]
+    return (WEIGHTS['skills'] * skills + WEIGHTS['specialization'] * specialization
+            + WEIGHTS['course'] * course + WEIGHTS['gpa'] * gpa).astype(np.float32)
+
+
+def _top_k(scores, k):
+    """Индексы k лучших значений в каждой строке (без сортировки внутри)"""
+    if scores.shape[1] <= k:
+        return np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def _student_rows(students, vacancies, scores, k):
+    rows = []
+    columns = _top_k(scores, k)
+    for row, student_id in enumerate(students.ids.tolist()):
+        for column in columns[row]:
+            rows.append((student_id, int(vacancies.ids[column]), float(scores[row, column])))
+    return rows
+
+
+class _VacancyTop:
+    """Накопитель лучших студентов по каждой вакансии при обходе порциями"""
+
+    def __init__(self, vacancies, k):
+        self.vacancies = vacancies
+        self.k = k
+        self.scores = np.empty((len(vacancies), 0), dtype=np.float32)
+        self.student_ids = np.empty((len(vacancies), 0), dtype=np.int64)
+
+    def add(self, students, scores):
+        merged_scores = np.concatenate([self.scores, scores.T], axis=1)
+        merged_ids = np.concatenate(
+            [self.student_ids, np.broadcast_to(students.ids, (len(self.vacancies), len(students)))], axis=1)
+        keep = _top_k(merged_scores, self.k)
+        self.scores = np.take_along_axis(merged_scores, keep, axis=1)
+        self.student_ids = np.take_along_axis(merged_ids, keep, axis=1)
+
+    def rows(self):
+        rows = []
+        for row, vacancy_id in enumerate(self.vacancies.ids.tolist()):
+            for column in range(self.scores.shape[1]):
+                rows.append((vacancy_id, int(self.student_ids[row, column]), float(self.scores[row, column])))
+        return rows
+
+
+def _score_all_students(cursor, skill_index, codes, vacancies, k, on_chunk):
+    """Оценки всех студентов против vacancies порциями по CHUNK_SIZE"""
+    students = load_students(cursor, skill_index, codes)
+    top = _VacancyTop(vacancies, k)
+    for start in range(0, len(students), CHUNK_SIZE):
+        chunk = students.chunk(start, start + CHUNK_SIZE)
+        scores = score(chunk, vacancies)
+        top.add(chunk, scores)
+        if on_chunk is not None:
+            on_chunk(chunk, scores)
+    return top
+
+
+def refresh_all(cursor, k=TOP_K):
+    """Полный пересчет обеих таблиц (внутри транзакции записи)"""
+    skill_index, codes = _skill_index(cursor), {}
+    vacancies = load_vacancies(cursor, skill_index, codes)
+    student_rows = []
+
+    def collect(chunk, scores):
+        student_rows.extend(_student_rows(chunk, vacancies, scores, k))
+
+    top = _score_all_students(cursor, skill_index, codes, vacancies, k, collect)
+    cursor.execute("DELETE FROM student_matches")
+    cursor.execute("DELETE FROM vacancy_matches")
+    cursor.executemany("INSERT INTO student_matches (student_id, vacancy_id, score) VALUES (?, ?, ?)",
+                       student_rows)
+    cursor.executemany("INSERT INTO vacancy_matches (vacancy_id, student_id, score) VALUES (?, ?, ?)",
+                       top.rows())
+
+
+def _refresh_vacancy_columns(cursor, skill_index, codes, vacancy_ids, k):
+    """Заново считает лучших студентов для вакансий vacancy_ids"""
+    for ids in _chunks(vacancy_ids):
+        cursor.executemany("DELETE FROM vacancy_matches WHERE vacancy_id = ?", [(i,) for i in ids])
+        vacancies = load_vacancies(cursor, skill_index, codes, ids)
+        if len(vacancies):
+            top = _score_all_students(cursor, skill_index, codes, vacancies, k, None)
+            cursor.executemany("INSERT INTO vacancy_matches (vacancy_id, student_id, score) VALUES (?, ?, ?)",
+                               top.rows())
+
+
+def _refresh_student_rows(cursor, skill_index, codes, student_ids, k):
+    """Заново считает лучшие вакансии для студентов student_ids"""
+    vacancies = load_vacancies(cursor, skill_index, codes)
+    for ids in _chunks(student_ids):
+        cursor.executemany("DELETE FROM student_matches WHERE student_id = ?", [(i,) for i in ids])
+        students = load_students(cursor, skill_index, codes, ids)
+        if len(students) and len(vacancies):
+            cursor.executemany("INSERT INTO student_matches (student_id, vacancy_id, score) VALUES (?, ?, ?)",
+                               _student_rows(students, vacancies, score(students, vacancies), k))
+
+
+def refresh_student(cursor, student_id, k=TOP_K):
+    """Профиль студента изменился: его строка и затронутые топы вакансий.
+
+    Новая оценка вливается в сохраненный топ вакансии: студент вне топа
+    вытесняет худшего, оценка участника просто обновляется. Всех студентов
+    заново оценивает только вакансия, где оценка участника полного топа
+    упала (или студент удален) - его место может занять кто-то вне топа.
+    """
+    skill_index, codes = _skill_index(cursor), {}
+    students = load_students(cursor, skill_index, codes, [student_id])
+    vacancies = load_vacancies(cursor, skill_index, codes)
+    scores = score(students, vacancies)
+    cursor.execute("DELETE FROM student_matches WHERE student_id = ?", (student_id,))
+    if len(students) and len(vacancies):
+        cursor.executemany("INSERT INTO student_matches (student_id, vacancy_id, score) VALUES (?, ?, ?)",
+                           _student_rows(students, vacancies, scores, k))
+
+    cursor.execute('''
+        SELECT vacancy_id, COUNT(*), MIN(score), MAX(CASE WHEN student_id = ? THEN score END)
+        FROM vacancy_matches GROUP BY vacancy_id
+    ''', (student_id,))
+    current = {vacancy_id: (count, lowest, old) for vacancy_id, count, lowest, old in cursor.fetchall()}
+
+    if not len(students):
+        # Студент удален: топы, где он был, пересчитываются, если были полными
+        rescan = [vacancy_id for vacancy_id, (count, _, old) in current.items() if old is not None and count >= k]
+        cursor.executemany("DELETE FROM vacancy_matches WHERE vacancy_id = ? AND student_id = ?",
+                           [(vacancy_id, student_id) for vacancy_id, (_, _, old) in current.items()
+                            if old is not None])
+    else:
+        rescan, updates, inserts, evictions = [], [], [], []
+        for vacancy_id, new_score in zip(vacancies.ids.tolist(), scores[0].tolist()):
+            count, lowest, old = current.get(vacancy_id, (0, 0.0, None))
+            if old is not None:
+                if new_score < old and count >= k:
+                    rescan.append(vacancy_id)
+                elif new_score != old:
+                    updates.append((new_score, vacancy_id, student_id))
+            elif count < k:
+                inserts.append((vacancy_id, student_id, new_score))
+            elif new_score > lowest:
+                evictions.append((vacancy_id, vacancy_id))
+                inserts.append((vacancy_id, student_id, new_score))
+        cursor.executemany("UPDATE vacancy_matches SET score = ? WHERE vacancy_id = ? AND student_id = ?", updates)
+        # Худший в топе уходит до вставки нового участника
+        cursor.executemany('''
+            DELETE FROM vacancy_matches
+            WHERE vacancy_id = ? AND student_id = (
+                SELECT student_id FROM vacancy_matches WHERE vacancy_id = ? ORDER BY score, student_id LIMIT 1)
+        ''', evictions)
+        cursor.executemany("INSERT INTO vacancy_matches (vacancy_id, student_id, score) VALUES (?, ?, ?)", inserts)
+    if rescan:
+        _refresh_vacancy_columns(cursor, skill_index, codes, rescan, k)
+
+
+def refresh_vacancy(cursor, vacancy_id, k=TOP_K):
+    """Вакансия добавлена, изменена или закрыта: ее топ и затронутые топы студентов.
+
+    Один проход по всем студентам собирает и топ вакансии, и студентов,
+    в чей топ она теперь проходит.
+    """
+    skill_index, codes = _skill_index(cursor), {}
+    cursor.execute("DELETE FROM vacancy_matches WHERE vacancy_id = ?", (vacancy_id,))
+    vacancies = load_vacancies(cursor, skill_index, codes, [vacancy_id])
+    affected = {student_id for (student_id,) in
+                cursor.execute("SELECT student_id FROM student_matches WHERE vacancy_id = ?", (vacancy_id,))}
+
+    if len(vacancies):
+        cursor.execute("SELECT student_id, COUNT(*), MIN(score) FROM student_matches GROUP BY student_id")
+        current = {student_id: (count, lowest) for student_id, count, lowest in cursor.fetchall()}
+
+        def collect(chunk, scores):
+            for student_id, new_score in zip(chunk.ids.tolist(), scores[:, 0].tolist()):
+                count, lowest = current.get(student_id, (0, 0.0))
+                if count < k or new_score > lowest:
+                    affected.add(student_id)
+
+        top = _score_all_students(cursor, skill_index, codes, vacancies, k, collect)
+        cursor.executemany("INSERT INTO vacancy_matches (vacancy_id, student_id, score) VALUES (?, ?, ?)",
+                           top.rows())
+
+    if affected:
+        _refresh_student_rows(cursor, skill_index, codes, sorted(affected), k)
@@ -0,0 +1,72 @@
+import threading
+from collections import namedtuple
+
+import db_pool
+
+# ========== ВЕРСИОНИРОВАННЫЕ МИГРАЦИИ СХЕМЫ ==========
+# Миграция: номер версии, название и шаг - список SQL-операторов
+# либо функция step(cursor). Номера версий строго возрастают.
+Migration = namedtuple('Migration', ['version', 'name', 'step'])
+
+_applied = {}  # файл БД -> версия схемы, уже проверенная в этом процессе
+_lock = threading.Lock()
+
+
+def _current_version(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    return cursor.fetchone()[0]
+
+
+def _apply(cursor, migration):
+    if callable(migration.step):
+        migration.step(cursor)
+    else:
+        for sql in migration.step:
+            cursor.execute(sql)
+    cursor.execute("INSERT INTO schema_version (version, name) VALUES (?, ?)",
+                   (migration.version, migration.name))
+
+
+def migrate(database, migrations):
+    """Доводит схему файла БД до последней версии из списка migrations.
+
+    Реальная проверка выполняется один раз на процесс: повторные вызовы
+    (например, при каждом перезапуске скрипта Streamlit) стоят один
+    поиск в словаре. Каждая миграция применяется в своей транзакции.
+    """
+    target = migrations[-1].version
+    if _applied.get(database) == target:
+        return target
+
+    with _lock:
+        if _applied.get(database) == target:
+            return target
+
+        with db_pool.connection(database) as conn:
+            cursor = conn.cursor()
+            for migration in migrations:
+                # BEGIN IMMEDIATE сериализует миграции между процессами
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    if migration.version > _current_version(cursor):
+                        _apply(cursor, migration)
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+
+        _applied[database] = target
+        return target
+
+
+def schema_version(database):
+    """Текущая версия схемы в файле БД (0 - схема еще не создана)"""
+    with db_pool.connection(database) as conn:
+        return _current_version(conn.cursor())
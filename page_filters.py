@@ -0,0 +1,95 @@
+import re
+from collections import namedtuple
+
+import skills
+
+# ========== ФИЛЬТРЫ СПИСКОВ ==========
+# Фильтр страницы описывается данными: колонки, операция и значение.
+# compile_filters собирает из них условия WHERE с параметрами, так что
+# отбор выполняет SQLite, а в Python приходят только подходящие строки.
+# Пустое значение ("", None, "Все") означает, что фильтр не выбран.
+Filter = namedtuple('Filter', ['columns', 'op', 'value'])
+
+ANY = "Все"
+
+_COLUMN_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$')
+
+
+def equals(column, value):
+    return Filter((column,), '=', value)
+
+
+def at_least(column, value):
+    return Filter((column,), '>=', value)
+
+
+def at_most(column, value):
+    return Filter((column,), '<=', value)
+
+
+def one_of(column, values):
+    return Filter((column,), 'in', tuple(values or ()))
+
+
+def contains(columns, text):
+    """Подстрока без учета регистра хотя бы в одной из колонок"""
+    if isinstance(columns, str):
+        columns = (columns,)
+    return Filter(tuple(columns), 'contains', text.strip() if isinstance(text, str) else text)
+
+
+def has_skills(names, match_all=True):
+    """Студент знает все навыки names (match_all) или хотя бы один из них"""
+    return Filter(('id',), 'skills_all' if match_all else 'skills_any', tuple(dict.fromkeys(names or ())))
+
+
+def is_unset(value):
+    # Пустой кортеж - по типу: numpy-скаляр == () дает пустой массив, а не bool
+    if isinstance(value, tuple):
+        return not value
+    return value is None or value == "" or value == ANY
+
+
+def _native(value):
+    # numpy-типы из DataFrame не годятся как параметры sqlite3
+    return value.item() if hasattr(value, 'item') else value
+
+
+def compile_filters(filters):
+    """(conditions, params): условия для WHERE и их параметры по порядку"""
+    conditions, params = [], []
+    for spec in filters:
+        if is_unset(spec.value):
+            continue
+        for column in spec.columns:
+            if not _COLUMN_RE.match(column):
+                raise ValueError(f"Недопустимое имя колонки в фильтре: {column!r}")
+
+        if spec.op in ('=', '>=', '<='):
+            conditions.append(f"{spec.columns[0]} {spec.op} ?")
+            params.append(_native(spec.value))
+        elif spec.op == 'in':
+            placeholders = ", ".join("?" for _ in spec.value)
+            conditions.append(f"{spec.columns[0]} IN ({placeholders})")
+            params.extend(_native(value) for value in spec.value)
+        elif spec.op == 'contains':
+            # py_lower() регистрируется в db_pool: встроенный lower() не знает кириллицу
+            matches = [f"instr(py_lower({column}), ?) > 0" for column in spec.columns]
+            conditions.append(matches[0] if len(matches) == 1 else f"({' OR '.join(matches)})")
+            params.extend([spec.value.lower()] * len(matches))
+        elif spec.op in ('skills_all', 'skills_any'):
+            condition, values = skills.skills_condition(spec.value, spec.op == 'skills_all', spec.columns[0])
+            conditions.append(condition)
+            params.extend(values)
+        else:
+            raise ValueError(f"Неизвестная операция фильтра: {spec.op!r}")
+    return conditions, params
+
+
+def student_filters(name=None, course=None, specialization=None):
+    """Фильтры списков студентов: ФИО, курс, специальность"""
+    return (
+        contains('full_name', name),
+        equals('course', course),
+        equals('specialization', specialization),
+    )
@@ -0,0 +1,495 @@
+import re
+import sys
+
+import db_pool
+import page_filters
+
+# ========== ГОРЯЧИЕ ЗАПРОСЫ ==========
+# SQL частых чтений DatabaseManager вынесен сюда, чтобы check_query_plans
+# проверял те же самые тексты запросов, что выполняет приложение.
+
+ALL_STUDENTS = "SELECT * FROM students ORDER BY registration_date DESC"
+
+STUDENT_BY_USER_ID = "SELECT * FROM students WHERE user_id = ?"
+
+# Одна строка по первичному ключу (кэш записей query_cache.RecordCache)
+STUDENT_BY_ID = "SELECT * FROM students WHERE id = ?"
+VACANCY_BY_ID = "SELECT * FROM vacancies WHERE id = ?"
+APPLICATION_BY_ID = "SELECT * FROM applications WHERE id = ?"
+
+ACTIVE_VACANCIES = "SELECT * FROM vacancies WHERE is_active = 1 ORDER BY posted_date DESC"
+
+APPLICATIONS_BY_STUDENT = '''
+    SELECT a.id as app_id, a.status, a.application_date, a.cover_letter,
+           v.position, v.company_name, v.salary_range
+    FROM applications a
+    JOIN vacancies v ON a.vacancy_id = v.id
+    WHERE a.student_id = ?
+    ORDER BY a.application_date DESC
+'''
+
+# Явно указываем app_id, чтобы не путать с id студента или вакансии
+ALL_APPLICATIONS = '''
+    SELECT a.id as app_id, a.status, a.application_date, a.cover_letter,
+           s.full_name, s.email as student_email, s.contact_number,
+           v.position, v.company_name, v.salary_range
+    FROM applications a
+    LEFT JOIN students s ON a.student_id = s.id
+    LEFT JOIN vacancies v ON a.vacancy_id = v.id
+    ORDER BY a.application_date DESC
+'''
+
+RECENT_APPLICATIONS = '''
+    SELECT a.id as app_id, a.status, a.application_date, a.cover_letter,
+           s.full_name, v.position, v.company_name
+    FROM applications a
+    LEFT JOIN students s ON a.student_id = s.id
+    LEFT JOIN vacancies v ON a.vacancy_id = v.id
+    ORDER BY a.application_date DESC
+    LIMIT ?
+'''
+
+# ========== KEYSET-ПАГИНАЦИЯ ==========
+# Страница - это строки строго "после" последней строки предыдущей страницы
+# в порядке (дата, id) по убыванию. Курсор - значения этих колонок, поэтому
+# SQLite сразу спускается по индексу к нужному месту, и время выдачи страницы
+# не зависит ни от ее номера, ни от размера таблицы (в отличие от OFFSET).
+PAGE_SIZE = 20
+SEARCH_LIMIT = 500  # потолок строк для таблиц с фильтрами без листания
+
+# (выражение в SQL, колонка результата) - из колонок берется курсор
+APPLICATIONS_PAGE_ORDER = (('a.application_date', 'application_date'), ('a.id', 'app_id'))
+STUDENTS_PAGE_ORDER = (('registration_date', 'registration_date'), ('id', 'id'))
+VACANCIES_PAGE_ORDER = (('posted_date', 'posted_date'), ('id', 'id'))
+
+APPLICATIONS_PAGE_SELECT = '''
+    SELECT a.id as app_id, a.status, a.application_date, a.cover_letter,
+           s.full_name, s.email as student_email, s.contact_number,
+           v.position, v.company_name, v.salary_range
+    FROM applications a
+    LEFT JOIN students s ON a.student_id = s.id
+    LEFT JOIN vacancies v ON a.vacancy_id = v.id
+'''
+
+STUDENTS_PAGE_SELECT = "SELECT * FROM students"
+
+VACANCIES_PAGE_SELECT = "SELECT * FROM vacancies"
+
+
+# Отклики с вакансией и студентом - для фильтров массовых действий
+APPLICATIONS_FILTER_FROM = '''
+    FROM applications a
+    LEFT JOIN students s ON a.student_id = s.id
+    LEFT JOIN vacancies v ON a.vacancy_id = v.id
+'''
+
+# Вакансия закрыта, удалена или срок подачи прошел
+CLOSED_VACANCY = "(v.id IS NULL OR v.is_active = 0 OR v.application_deadline < date('now'))"
+
+# Статус меняется, только если он действительно другой (лишние записи будят триггеры)
+UPDATE_APPLICATION_STATUS = "UPDATE applications SET status = ? WHERE id = ? AND status IS NOT ?"
+
+
+def _where(conditions):
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+def count_applications(conditions=()):
+    return f"SELECT COUNT(*) as applications {APPLICATIONS_FILTER_FROM.strip()}\n    {_where(conditions)}"
+
+
+def update_applications_where(conditions=()):
+    """UPDATE всех откликов под условиями одним оператором; параметры: статус, условия, статус"""
+    return f'''
+    UPDATE applications SET status = ?
+    WHERE id IN (
+        SELECT a.id {APPLICATIONS_FILTER_FROM.strip()}
+        {_where(conditions)}
+    ) AND status IS NOT ?
+    '''
+
+
+def keyset_page(select, order_columns, conditions=(), after=False):
+    """SQL одной страницы: select + условия + курсор + ORDER BY ... LIMIT ?
+
+    При after=True добавляется сравнение row value с курсором, параметры
+    курсора идут после параметров условий, последний параметр - LIMIT.
+    """
+    conditions = list(conditions)
+    expressions = [expression for expression, _ in order_columns]
+    if after:
+        placeholders = ", ".join("?" for _ in expressions)
+        conditions.append(f"({', '.join(expressions)}) < ({placeholders})")
+    where = _where(conditions)
+    order = ", ".join(f"{expression} DESC" for expression in expressions)
+    return f"{select.strip()}\n    {where}\n    ORDER BY {order}\n    LIMIT ?"
+
+
+def ordered_select(select, order, conditions=()):
+    """select + условия + ORDER BY без LIMIT - для потоковой выгрузки (exports.py)"""
+    return f"{select.strip()}\n    {_where(conditions)}\n    ORDER BY {order}"
+
+
+# ========== ПОЛНОТЕКСТОВЫЙ ПОИСК ==========
+# vacancies_fts / students_fts (schema.py). Порядок - ORDER BY rank (BM25 с
+# весами колонок, заданными в миграции). Границы совпадений в snippet
+# помечены символами \x02 и \x03: страница сама решает, как их показать.
+SEARCH_RESULTS = 50
+
+VACANCY_SEARCH_SELECT = '''
+    SELECT * FROM (
+        SELECT v.*, vacancies_fts.rank as rank,
+               snippet(vacancies_fts, -1, char(2), char(3), '…', 16) as snippet
+        FROM vacancies_fts
+        JOIN vacancies v ON v.id = vacancies_fts.rowid
+        WHERE vacancies_fts MATCH ?
+    )
+'''
+
+STUDENT_SEARCH_SELECT = '''
+    SELECT * FROM (
+        SELECT s.*, students_fts.rank as rank,
+               snippet(students_fts, -1, char(2), char(3), '…', 12) as snippet
+        FROM students_fts
+        JOIN students s ON s.id = students_fts.rowid
+        WHERE students_fts MATCH ?
+    )
+'''
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def fts_match(text):
+    """Строка поиска -> выражение MATCH: все слова как префиксы (И).
+
+    Слова берутся в кавычки, так что операторы FTS5 из ввода пользователя
+    не интерпретируются. None - в строке нет ни одного слова.
+    """
+    words = _WORD_RE.findall((text or "").lower().replace('ё', 'е'))
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def fts_condition(table, column='id'):
+    """Условие WHERE "строка найдена в table"; параметр - выражение fts_match"""
+    return f"{column} IN (SELECT rowid FROM {table} WHERE {table} MATCH ?)"
+
+
+def ranked_search(select, conditions=()):
+    """SQL поиска: select + условия по колонкам результата + ORDER BY rank LIMIT ?"""
+    return f"{select.strip()}\n    {_where(conditions)}\n    ORDER BY rank\n    LIMIT ?"
+
+
+# Позволяем входить по username ИЛИ email без учета регистра: параметры -
+# ключи credentials.login_key (casefold), колонки *_key индексированы;
+# пароль проверяет credentials.py
+AUTHENTICATE_USER = '''
+    SELECT id, password_hash, username, role, full_name
+    FROM users
+    WHERE username_key = ? OR email_key = ?
+'''
+
+# Строка stats поддерживается триггерами (schema.py), чтение - O(1)
+STATISTICS = '''
+    SELECT total_students, active_students, active_vacancies, total_applications,
+           accepted_applications, pending_applications,
+           CASE WHEN gpa_count > 0 THEN gpa_sum / gpa_count END as avg_gpa
+    FROM stats
+    WHERE id = 1
+'''
+
+TOP_SPECIALIZATION = '''
+    SELECT specialization, COUNT(*) as students
+    FROM students
+    WHERE specialization IS NOT NULL AND specialization != ''
+    GROUP BY specialization
+    ORDER BY students DESC
+    LIMIT 1
+'''
+
+STUDENTS_BY_COURSE = "SELECT course, COUNT(*) as students FROM students GROUP BY course"
+
+SKILL_NAMES = "SELECT name FROM skills ORDER BY name"
+
+# ========== АНАЛИТИКА ==========
+# Страница аналитики получает только агрегаты: строк в ответе столько же,
+# сколько групп, а не записей. Результаты кэшируются query_cache до
+# изменения таблиц.
+SPECIALIZATION_COUNTS = '''
+    SELECT specialization, COUNT(*) as students
+    FROM students
+    WHERE specialization IS NOT NULL AND specialization != ''
+    GROUP BY specialization
+    ORDER BY students DESC
+'''
+
+# Группа NULL не показывается, как и в value_counts(), которые эти запросы заменили
+APPLICATIONS_BY_STATUS = '''
+    SELECT status, COUNT(*) as applications
+    FROM applications
+    WHERE status IS NOT NULL
+    GROUP BY status
+'''
+
+VACANCIES_BY_SPECIALIZATION = '''
+    SELECT specialization, COUNT(*) as vacancies
+    FROM vacancies
+    WHERE is_active = 1 AND specialization IS NOT NULL
+    GROUP BY specialization
+    ORDER BY vacancies DESC
+'''
+
+# Ряды откликов из дневной сводки daily_application_stats (schema.py):
+# период - день, понедельник недели или первое число месяца
+SERIES_PERIODS = {
+    'day': "day",
+    'week': "date(day, '-6 days', 'weekday 1')",
+    'month': "strftime('%Y-%m-01', day)",
+}
+SERIES_GROUPS = ('status', 'specialization', 'company_name')
+
+APPLICATIONS_DAY_RANGE = '''
+    SELECT MIN(day) as first_day, MAX(day) as last_day
+    FROM daily_application_stats
+    WHERE day != ''
+'''
+
+
+def application_series(resolution='day', group=None):
+    """Число откликов по периодам (и группе) за дни BETWEEN ? AND ?"""
+    period = SERIES_PERIODS[resolution]
+    group_column = f", {group}" if group in SERIES_GROUPS else ""
+    return f'''
+    SELECT {period} as period{group_column}, SUM(applications) as applications
+    FROM daily_application_stats
+    WHERE day BETWEEN ? AND ?
+    GROUP BY period{group_column}
+    ORDER BY period
+    '''
+
+
+GPA_MAX = 4.0
+GPA_BINS = 20
+
+# Параметры: корзин на единицу GPA, номер последней корзины (GPA = GPA_MAX
+# попадает в нее). Умножение, а не деление на ширину: 0.6 / 0.2 = 2.999...
+GPA_HISTOGRAM = '''
+    SELECT MIN(CAST(gpa * ? AS INTEGER), ?) as bin, COUNT(*) as students
+    FROM students
+    WHERE gpa IS NOT NULL
+    GROUP BY bin
+    ORDER BY bin
+'''
+
+GPA_SUMMARY = '''
+    SELECT COUNT(gpa) as count, AVG(gpa) as mean, MIN(gpa) as min, MAX(gpa) as max,
+           AVG(gpa * gpa) as mean_square
+    FROM students
+'''
+
+# Медиана: одна или две средние строки по порядку GPA
+GPA_MEDIAN = '''
+    SELECT AVG(gpa) as median FROM (
+        SELECT gpa FROM students
+        WHERE gpa IS NOT NULL
+        ORDER BY gpa
+        LIMIT 2 - (SELECT COUNT(gpa) FROM students) % 2
+        OFFSET (SELECT (COUNT(gpa) - 1) / 2 FROM students)
+    )
+'''
+
+# Комплексный отчет (reports.py): по одному группирующему проходу на таблицу
+REPORT_STUDENT_GROUPS = '''
+    SELECT course, specialization, COUNT(*) as students, SUM(is_active = 1) as active,
+           COUNT(gpa) as gpa_count, SUM(gpa) as gpa_sum, SUM(gpa * gpa) as gpa_square_sum,
+           MIN(gpa) as gpa_min, MAX(gpa) as gpa_max
+    FROM students
+    GROUP BY course, specialization
+'''
+
+REPORT_VACANCY_GROUPS = '''
+    SELECT specialization, COUNT(*) as vacancies
+    FROM vacancies
+    WHERE is_active = 1
+    GROUP BY specialization
+'''
+
+REPORT_APPLICATION_GROUPS = "SELECT status, COUNT(*) as applications FROM applications GROUP BY status"
+
+# Предрасчитанный подбор (matching.py)
+STUDENT_MATCHES = '''
+    SELECT v.*, m.score
+    FROM student_matches m
+    JOIN vacancies v ON v.id = m.vacancy_id
+    WHERE m.student_id = ? AND v.is_active = 1
+    ORDER BY m.score DESC
+    LIMIT ?
+'''
+
+VACANCY_SHORTLIST = '''
+    SELECT s.id, s.full_name, s.course, s.specialization, s.gpa, s.programming_languages,
+           s.email, s.contact_number, m.score
+    FROM vacancy_matches m
+    JOIN students s ON s.id = m.student_id
+    WHERE m.vacancy_id = ?
+    ORDER BY m.score DESC
+'''
+
+ACTIVE_VACANCY_TITLES = '''
+    SELECT id, position, company_name
+    FROM vacancies
+    WHERE is_active = 1
+    ORDER BY posted_date DESC
+'''
+
+# database.py
+RECRUIT_STATISTICS = '''
+    SELECT total_students, active_students, active_vacancies, total_applications,
+           employed_students, unread_notifications
+    FROM stats
+    WHERE id = 1
+'''
+
+NOTIFICATIONS_BY_USER = "SELECT * FROM notifications WHERE user_id = ? ORDER BY created_at DESC"
+
+# ========== ВЫГРУЗКА (exports.py) ==========
+# Порядок совпадает с индексами: строки читаются по индексу без сортировки
+STUDENTS_EXPORT_SELECT = '''
+    SELECT full_name, course, specialization, gpa, email, contact_number,
+           programming_languages, graduation_year, work_experience,
+           CASE WHEN is_active = 1 THEN 'Да' ELSE 'Нет' END as is_active,
+           registration_date
+    FROM students
+'''
+STUDENTS_EXPORT_ORDER = "registration_date DESC, id DESC"
+
+APPLICATIONS_EXPORT_SELECT = '''
+    SELECT a.id, a.application_date, a.status, s.full_name, s.email, s.contact_number,
+           v.position, v.company_name, v.salary_range, a.cover_letter
+    FROM applications a
+    LEFT JOIN students s ON a.student_id = s.id
+    LEFT JOIN vacancies v ON a.vacancy_id = v.id
+'''
+APPLICATIONS_EXPORT_ORDER = "a.application_date DESC, a.id DESC"
+
+VACANCIES_EXPORT_SELECT = '''
+    SELECT position, company_name, specialization, required_course, salary_range,
+           application_deadline, contact_email,
+           CASE WHEN is_active = 1 THEN 'Да' ELSE 'Нет' END as is_active,
+           posted_date, description, requirements
+    FROM vacancies
+'''
+VACANCIES_EXPORT_ORDER = "posted_date DESC, id DESC"
+
+# Только в recruit_system.db
+EMPLOYMENT_REPORTS_EXPORT_SELECT = '''
+    SELECT s.full_name, s.specialization, er.company_name, er.position,
+           er.employment_date, er.salary, er.report_date
+    FROM employment_reports er
+    LEFT JOIN students s ON er.student_id = s.id
+'''
+EMPLOYMENT_REPORTS_EXPORT_ORDER = "er.employment_date DESC, er.id DESC"
+
+# ========== ОЖИДАЕМЫЕ ИНДЕКСЫ ==========
+# (название, SQL, параметры, индексы, которые должен использовать план)
+APP_QUERY_INDEXES = [
+    ('get_all_students', ALL_STUDENTS, (), ['idx_students_registration']),
+    ('get_student_by_user_id', STUDENT_BY_USER_ID, (1,), ['sqlite_autoindex_students_1']),
+    ('get_all_vacancies', ACTIVE_VACANCIES, (), ['idx_vacancies_active_posted']),
+    ('get_applications_by_student', APPLICATIONS_BY_STUDENT, (1,), ['idx_applications_student_date']),
+    ('get_all_applications', ALL_APPLICATIONS, (), ['idx_applications_date']),
+    ('get_recent_applications', RECENT_APPLICATIONS, (10,), ['idx_applications_date']),
+    ('get_applications_page', keyset_page(APPLICATIONS_PAGE_SELECT, APPLICATIONS_PAGE_ORDER, after=True),
+     ('2024-01-01', 1, PAGE_SIZE + 1), ['idx_applications_date']),
+    ('get_students_page', keyset_page(STUDENTS_PAGE_SELECT, STUDENTS_PAGE_ORDER, after=True),
+     ('2024-01-01', 1, PAGE_SIZE + 1), ['idx_students_registration']),
+    ('get_vacancies_page', keyset_page(VACANCIES_PAGE_SELECT, VACANCIES_PAGE_ORDER, ['is_active = 1'], after=True),
+     ('2024-01-01', 1, PAGE_SIZE + 1), ['idx_vacancies_active_posted']),
+    ('get_students_page[course]',
+     keyset_page(STUDENTS_PAGE_SELECT, STUDENTS_PAGE_ORDER,
+                 page_filters.compile_filters([page_filters.equals('course', 3)])[0], after=True),
+     (3, '2024-01-01', 1, PAGE_SIZE + 1), ['idx_students_course_registration']),
+    ('get_students_page[specialization]',
+     keyset_page(STUDENTS_PAGE_SELECT, STUDENTS_PAGE_ORDER,
+                 page_filters.compile_filters([page_filters.equals('specialization', 'Финансы')])[0], after=True),
+     ('Финансы', '2024-01-01', 1, PAGE_SIZE + 1), ['idx_students_spec_registration']),
+    ('get_applications_page[status]',
+     keyset_page(APPLICATIONS_PAGE_SELECT, APPLICATIONS_PAGE_ORDER,
+                 page_filters.compile_filters([page_filters.equals('a.status', 'pending')])[0], after=True),
+     ('pending', '2024-01-01', 1, PAGE_SIZE + 1), ['idx_applications_status_date']),
+    ('get_vacancies_page[specialization]',
+     keyset_page(VACANCIES_PAGE_SELECT, VACANCIES_PAGE_ORDER,
+                 ['is_active = 1', *page_filters.compile_filters([page_filters.equals('specialization', 'ITA')])[0]],
+                 after=True),
+     ('ITA', '2024-01-01', 1, PAGE_SIZE + 1), ['idx_vacancies_active_spec_posted']),
+    ('find_students_by_skills',
+     keyset_page(STUDENTS_PAGE_SELECT, STUDENTS_PAGE_ORDER,
+                 page_filters.compile_filters([page_filters.has_skills(['SQL', '1С'])])[0]),
+     ('SQL', '1С', SEARCH_LIMIT), ['idx_student_skills_skill']),
+    ('get_applications_by_status', APPLICATIONS_BY_STATUS, (), ['idx_applications_status_date']),
+    ('get_vacancies_by_specialization', VACANCIES_BY_SPECIALIZATION, (), ['idx_vacancies_active_spec_posted']),
+    ('export[students]', ordered_select(STUDENTS_EXPORT_SELECT, STUDENTS_EXPORT_ORDER), (),
+     ['idx_students_registration']),
+    ('export[applications]', ordered_select(APPLICATIONS_EXPORT_SELECT, APPLICATIONS_EXPORT_ORDER), (),
+     ['idx_applications_date']),
+    ('export[vacancies]', ordered_select(VACANCIES_EXPORT_SELECT, VACANCIES_EXPORT_ORDER, ['is_active = 1']), (),
+     ['idx_vacancies_active_posted']),
+    ('authenticate_user', AUTHENTICATE_USER, ('u', 'u'),
+     ['idx_users_username_key', 'idx_users_email_key']),
+]
+
+RECRUIT_QUERY_INDEXES = [
+    ('get_all_students', ALL_STUDENTS, (), ['idx_students_registration']),
+    ('get_all_vacancies', ACTIVE_VACANCIES, (), ['idx_vacancies_active_posted']),
+    ('get_notifications', NOTIFICATIONS_BY_USER, (1,), ['idx_notifications_user_created']),
+    ('find_students[specialization]',
+     keyset_page(STUDENTS_PAGE_SELECT, STUDENTS_PAGE_ORDER,
+                 page_filters.compile_filters([page_filters.equals('specialization', 'Финансы')])[0]),
+     ('Финансы', SEARCH_LIMIT), ['idx_students_spec_registration']),
+    ('export[employment_reports]', ordered_select(EMPLOYMENT_REPORTS_EXPORT_SELECT, EMPLOYMENT_REPORTS_EXPORT_ORDER), (),
+     ['idx_employment_reports_date']),
+]
+
+
+def explain_query_plan(conn, sql, params=()):
+    """Строки плана EXPLAIN QUERY PLAN (поле detail)"""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()]
+
+
+def check_query_plans(database, expectations):
+    """Возвращает список проблем: запросы, план которых не использует свой индекс"""
+    problems = []
+    with db_pool.connection(database) as conn:
+        for name, sql, params, indexes in expectations:
+            plan = explain_query_plan(conn, sql, params)
+            text = "\n".join(plan)
+            missing = [index for index in indexes if f"INDEX {index}" not in text]
+            if missing:
+                problems.append((name, missing, plan))
+    return problems
+
+
+def main(argv):
+    # python queries.py keu_career.db [recruit_system.db]
+    import migrations
+    import schema
+
+    targets = {'recruit_system.db': (schema.RECRUIT_MIGRATIONS, RECRUIT_QUERY_INDEXES)}
+    failed = False
+    for database in argv or ['keu_career.db']:
+        schema_migrations, expectations = targets.get(database, (schema.APP_MIGRATIONS, APP_QUERY_INDEXES))
+        migrations.migrate(database, schema_migrations)
+        problems = check_query_plans(database, expectations)
+        for name, missing, plan in problems:
+            failed = True
+            print(f"{database}: {name} не использует {', '.join(missing)}")
+            for line in plan:
+                print(f"    {line}")
+        if not problems:
+            print(f"{database}: все запросы используют свои индексы")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,184 @@
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import schema
+
+# ========== КЭШ РЕЗУЛЬТАТОВ ЧТЕНИЯ ==========
+MAX_CACHE_BYTES = 64 * 1024 * 1024  # общий лимит памяти под закэшированные DataFrame
+MAX_CACHE_ENTRIES = 512
+MAX_RECORDS = 2048  # строк в кэше точечных чтений
+
+_TABLE_RE = re.compile(r'\b(?:FROM|JOIN)\s+([A-Za-z_][A-Za-z0-9_]*)', re.IGNORECASE)
+
+
+def tables_of(query):
+    """Таблицы, от которых зависит результат запроса (с учетом производных)"""
+    tables = set()
+    for table in _TABLE_RE.findall(query):
+        table = table.lower()
+        tables.add(table)
+        tables.update(schema.DERIVED_TABLES.get(table, ()))
+    return frozenset(tables)
+
+
+class TableVersions:
+    """Версии таблиц одного файла БД.
+
+    Отдельное соединение-наблюдатель сравнивает PRAGMA data_version: пока
+    никто не закоммитил изменения, версии не перечитываются. После любого
+    коммита (из этого или другого процесса) читается маленькая таблица
+    table_versions, которую ведут триггеры.
+    """
+
+    def __init__(self, database):
+        self._conn = sqlite3.connect(database, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._data_version = None
+        self._versions = {}
+
+    def current(self):
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._versions = dict(self._conn.execute("SELECT name, version FROM table_versions"))
+                self._data_version = data_version
+            return self._versions
+
+    def snapshot(self, tables):
+        versions = self.current()
+        return tuple(versions.get(table, 0) for table in sorted(tables))
+
+
+class QueryCache:
+    """LRU-кэш результатов (запрос, параметры) с лимитом памяти.
+
+    Запись считается актуальной, пока не изменились версии таблиц, из
+    которых она прочитана; время жизни не ограничено.
+    """
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES, max_entries=MAX_CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (frame, tables, snapshot, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._versions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def versions(self, database):
+        tracker = self._versions.get(database)
+        if tracker is None:
+            with self._lock:
+                tracker = self._versions.setdefault(database, TableVersions(database))
+        return tracker
+
+    def get_or_load(self, database, query, params, loader):
+        """Результат из кэша либо loader() с сохранением в кэш.
+
+        Возвращается копия, чтобы изменения DataFrame на странице не
+        портили закэшированное значение.
+        """
+        tables = tables_of(query)
+        try:
+            snapshot = self.versions(database).snapshot(tables) if tables else None
+        except sqlite3.Error:
+            snapshot = None  # схема еще без table_versions - читаем без кэша
+        if snapshot is None:
+            return loader()
+
+        key = (database, query, tuple(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == snapshot:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0].copy()
+        self.misses += 1
+
+        frame = loader()
+        self._store(key, frame, tables, snapshot)
+        return frame.copy()
+
+    def _store(self, key, frame, tables, snapshot):
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[3]
+            self._entries[key] = (frame, tables, snapshot, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class RecordCache:
+    """LRU одиночных строк: (файл БД, таблица, ключ) -> запись (records.py).
+
+    Строка актуальна, пока не изменилась версия ее таблицы: любая запись
+    в таблицу (триггеры table_versions) делает ее записи устаревшими.
+    Версии берутся у того же наблюдателя, что и у QueryCache. Записи
+    неизменяемые и отдаются без копирования.
+    """
+
+    def __init__(self, query_cache, max_entries=MAX_RECORDS):
+        self.query_cache = query_cache
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (row, version)
+        self._lock = threading.Lock()
+
+    def get_or_load(self, database, table, key, loader):
+        """Запись из кэша либо loader() (None - строки нет)"""
+        tables = [table, *schema.DERIVED_TABLES.get(table, ())]
+        try:
+            version = self.query_cache.versions(database).snapshot(tables)
+        except sqlite3.Error:
+            version = None
+        if version is None:
+            return loader()
+
+        key = (database, table, key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == version:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        row = loader()
+        with self._lock:
+            self._entries[key] = (row, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return row
+
+
+# Один кэш на процесс: общий для всех сессий Streamlit
+cache = QueryCache()
+record_cache = RecordCache(cache)
+
+
+def get_or_load(database, query, params, loader):
+    return cache.get_or_load(database, query, params, loader)
+
+
+def get_record(database, table, key, loader):
+    return record_cache.get_or_load(database, table, key, loader)
+
+
+def data_version(database, tables):
+    """Версии таблиц tables - ключ для производных артефактов (None - схема без версий)"""
+    try:
+        return cache.versions(database).snapshot(tables)
+    except sqlite3.Error:
+        return None
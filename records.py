@@ -0,0 +1,57 @@
+from collections import namedtuple
+
+# ========== ЗАПИСИ ДЛЯ ТОЧЕЧНЫХ ЧТЕНИЙ ==========
+# Одна строка результата - неизменяемый кортеж с __slots__ (namedtuple) и
+# обычными типами Python, как их отдает sqlite3: без DataFrame, numpy-
+# скаляров и приведений int(). Поля доступны и как атрибуты (student.gpa),
+# и по имени (student['gpa']) - как у строки pandas, которую они заменяют.
+# Класс создается один раз на набор колонок. DataFrame остаются для
+# табличных страниц.
+
+
+class _RecordMixin:
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if isinstance(key, str) else default
+
+    def keys(self):
+        return self._fields
+
+
+_classes = {}  # колонки -> класс записи
+
+
+def record_class(fields):
+    """Класс записи для колонок fields (кэшируется)"""
+    fields = tuple(fields)
+    cls = _classes.get(fields)
+    if cls is None:
+        cls = type('Record', (_RecordMixin, namedtuple('Record', fields)), {'__slots__': ()})
+        cls = _classes.setdefault(fields, cls)
+    return cls
+
+
+def from_cursor(cursor, row):
+    """Запись из строки row курсора cursor"""
+    return record_class(column[0] for column in cursor.description)._make(row)
+
+
+def fetch_one(conn, query, params=()):
+    """Первая строка запроса как запись или None"""
+    cursor = conn.execute(query, params)
+    row = cursor.fetchone()
+    return from_cursor(cursor, row) if row is not None else None
+
+
+def filled(fields, value=0):
+    """Запись, у которой все поля равны value (значения по умолчанию)"""
+    return record_class(fields)._make(value for _ in fields)
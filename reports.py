@@ -0,0 +1,206 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+import db_pool
+import queries
+import query_cache
+
+# ========== КОМПЛЕКСНЫЙ ОТЧЕТ ==========
+# Все разделы отчета считаются из трех группирующих запросов (по одному на
+# таблицу) в фоновом потоке, страница только показывает прогресс. Готовый
+# отчет хранится по версии данных (table_versions): пока таблицы не
+# менялись, повторный запрос отдает тот же текст сразу, без пересчета.
+REPORT_TABLES = ('students', 'vacancies', 'applications')
+
+Report = namedtuple('Report', ['text', 'generated_at', 'version'])
+
+# Один поток на процесс: параллельные отчеты только делили бы одно ядро
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='report')
+_lock = threading.Lock()
+_reports = {}  # файл БД -> последний готовый Report
+_jobs = {}  # (файл БД, версия) -> ReportJob в работе
+
+
+class ReportJob:
+    """Фоновое построение отчета: прогресс 0..1, этап и Future с Report"""
+
+    def __init__(self):
+        self.future = Future()
+        self.progress = 0.0
+        self.stage = "В очереди"
+
+    def update(self, progress, stage):
+        self.progress = progress
+        self.stage = stage
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+
+def _percent(part, total):
+    return part / total * 100 if total else 0
+
+
+def collect(conn):
+    """Сырые группы для отчета: студенты, вакансии, отклики"""
+    return (conn.execute(queries.REPORT_STUDENT_GROUPS).fetchall(),
+            conn.execute(queries.REPORT_VACANCY_GROUPS).fetchall(),
+            conn.execute(queries.REPORT_APPLICATION_GROUPS).fetchall())
+
+
+def render(student_groups, vacancy_groups, application_groups, course_options, specialization_options,
+           generated_at):
+    """Текст отчета из групп: каждая секция - сумма по уже сгруппированным строкам"""
+    total_students = active_students = gpa_count = 0
+    gpa_sum = gpa_square_sum = 0.0
+    gpa_min = gpa_max = None
+    by_course, by_specialization = {}, {}
+    for course, specialization, students, active, count, total, square_total, low, high in student_groups:
+        total_students += students
+        active_students += active or 0
+        by_course[course] = by_course.get(course, 0) + students
+        by_specialization[specialization] = by_specialization.get(specialization, 0) + students
+        if count:
+            gpa_count += count
+            gpa_sum += total
+            gpa_square_sum += square_total
+            gpa_min = low if gpa_min is None else min(gpa_min, low)
+            gpa_max = high if gpa_max is None else max(gpa_max, high)
+
+    gpa_mean = gpa_sum / gpa_count if gpa_count else None
+    gpa_std = None
+    if gpa_count > 1:
+        gpa_std = max(gpa_square_sum - gpa_count * gpa_mean ** 2, 0.0) / (gpa_count - 1)
+        gpa_std **= 0.5
+
+    active_vacancies = sum(count for _, count in vacancy_groups)
+    demanded = sorted((-count, specialization) for specialization, count in vacancy_groups if specialization)
+    top_specialization = demanded[0][1] if demanded else None
+
+    statuses = dict(application_groups)
+    total_applications = sum(statuses.values())
+    accepted = statuses.get('accepted', 0)
+    conversion_rate = _percent(accepted, total_applications)
+
+    lines = [
+        "КОМПЛЕКСНЫЙ ОТЧЕТ КАРЬЕРНОГО ЦЕНТРА КЭУ",
+        "=========================================",
+        f"Дата генерации: {generated_at.strftime('%d.%m.%Y %H:%M:%S')}",
+        "",
+        "СТУДЕНТЫ:",
+        f"- Всего студентов: {total_students}",
+        f"- Активно ищут работу: {active_students}",
+        f"- Средний GPA: {f'{gpa_mean:.2f}' if gpa_mean is not None else 'Нет данных'}",
+        "",
+        "ВАКАНСИИ:",
+        f"- Активных вакансий: {active_vacancies}",
+        f"- Популярная специальность: {top_specialization or 'Нет данных'}",
+        "",
+        "ОТКЛИКИ:",
+        f"- Всего откликов: {total_applications}",
+        f"- Принято: {accepted}",
+        f"- На рассмотрении: {statuses.get('pending', 0)}",
+        f"- Отклонено: {statuses.get('rejected', 0)}",
+        f"- Конверсия: {conversion_rate:.1f}%",
+        "",
+        "РАСПРЕДЕЛЕНИЕ ПО КУРСАМ:",
+    ]
+    if total_students:
+        for course in course_options:
+            count = by_course.get(course, 0)
+            lines.append(f"- Курс {course}: {count} студентов ({_percent(count, total_students):.1f}%)")
+
+    lines += ["", "РАСПРЕДЕЛЕНИЕ ПО СПЕЦИАЛЬНОСТЯМ:"]
+    for specialization in specialization_options:
+        count = by_specialization.get(specialization, 0)
+        if count:
+            lines.append(f"- {specialization}: {count} студентов ({_percent(count, total_students):.1f}%)")
+
+    if gpa_mean is not None:
+        lines += [
+            "",
+            "УСПЕВАЕМОСТЬ:",
+            f"- Средний GPA: {gpa_mean:.2f}",
+            f"- Максимальный GPA: {gpa_max:.2f}",
+            f"- Минимальный GPA: {gpa_min:.2f}",
+            f"- Стандартное отклонение: {gpa_std:.2f}" if gpa_std is not None else "- Стандартное отклонение: -",
+        ]
+
+    lines += ["", "РЕКОМЕНДАЦИИ:"]
+    if top_specialization:
+        lines.append(f"- Наиболее востребованная специальность: {top_specialization}")
+    if total_applications:
+        if conversion_rate < 30:
+            lines.append("- Рекомендуется улучшить качество подготовки студентов к собеседованиям")
+        lines.append(f"- Уровень конверсии откликов: {conversion_rate:.1f}%")
+
+    return "\n".join(lines) + "\n"
+
+
+def build_report(database, course_options, specialization_options, version=None, job=None):
+    """Строит отчет; три запроса идут в одной транзакции чтения (один снимок данных)"""
+    job = job or ReportJob()
+    job.update(0.1, "Чтение данных")
+    with db_pool.connection(database) as conn:
+        conn.execute("BEGIN")
+        try:
+            groups = collect(conn)
+        finally:
+            conn.rollback()
+    job.update(0.7, "Оформление отчета")
+    generated_at = datetime.now()
+    text = render(*groups, course_options, specialization_options, generated_at)
+    job.update(1.0, "Готово")
+    return Report(text, generated_at, version)
+
+
+def cached_report(database):
+    """Готовый отчет, если данные с тех пор не менялись, иначе None"""
+    version = query_cache.data_version(database, REPORT_TABLES)
+    report = _reports.get(database)
+    if report is not None and version is not None and report.version == version:
+        return report
+    return None
+
+
+def request_report(database, course_options, specialization_options):
+    """ReportJob для текущей версии данных.
+
+    Если отчет уже построен - задача сразу завершена; если строится -
+    возвращается та же задача, второй раз он не запускается.
+    """
+    version = query_cache.data_version(database, REPORT_TABLES)
+    key = (database, version)
+    with _lock:
+        report = cached_report(database)
+        if report is not None:
+            job = ReportJob()
+            job.update(1.0, "Готово")
+            job.future.set_result(report)
+            return job
+        job = _jobs.get(key)
+        if job is not None:
+            return job
+        job = _jobs[key] = ReportJob()
+
+    def run():
+        try:
+            report = build_report(database, course_options, specialization_options, version, job)
+        except Exception as e:
+            with _lock:
+                _jobs.pop(key, None)
+            job.future.set_exception(e)
+            return
+        with _lock:
+            _jobs.pop(key, None)
+            if version is not None:
+                _reports[database] = report
+        job.future.set_result(report)
+
+    _executor.submit(run)
+    return job
@@ -0,0 +1,346 @@
+import csv
+import io
+import re
+import secrets
+import sqlite3
+import tempfile
+from collections import namedtuple
+
+import credentials
+import db_writer
+import skills
+
+try:
+    import openpyxl
+except ImportError:  # XLSX - опционально, CSV работает без него
+    openpyxl = None
+
+# ========== ИМПОРТ СПИСКОВ СТУДЕНТОВ ==========
+# Файл читается построчно (csv / openpyxl read_only) и обрабатывается
+# порциями по CHUNK_SIZE строк: каждая порция проверяется и записывается
+# одной транзакцией писателя (executemany), так что в памяти никогда не
+# лежит больше одной порции.
+CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+# Колонка файла (без учета регистра) -> поле
+COLUMN_ALIASES = {
+    'full_name': ('full_name', 'фио', 'имя', 'студент'),
+    'email': ('email', 'e-mail', 'почта'),
+    'username': ('username', 'логин'),
+    'password': ('password', 'пароль'),
+    'course': ('course', 'курс'),
+    'specialization': ('specialization', 'специальность'),
+    'gpa': ('gpa', 'средний балл'),
+    'skills': ('skills', 'навыки', 'programming_languages'),
+    'contact_number': ('contact_number', 'phone', 'телефон'),
+    'graduation_year': ('graduation_year', 'год выпуска'),
+}
+
+# Без них строка не может стать профилем: курс не подставляется по умолчанию
+REQUIRED_FIELDS = ('full_name', 'email', 'course', 'specialization')
+
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+RowError = namedtuple('RowError', ['line', 'message'])
+
+
+class RosterError(ValueError):
+    """Файл нельзя прочитать как список студентов"""
+
+
+class ImportReport:
+    def __init__(self):
+        self.processed = 0
+        self.created = 0
+        self.errors = []  # первые MAX_REPORTED_ERRORS ошибок
+        self.error_count = 0
+        # Сгенерированные пароли пишутся во временный файл, а не копятся в памяти
+        self.credentials = tempfile.TemporaryFile(mode='w+', encoding='utf-8', newline='')
+        self._credentials_writer = csv.writer(self.credentials)
+        self._credentials_writer.writerow(['username', 'password'])
+        self.generated_passwords = 0
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(line, message))
+
+    def add_credentials(self, username, password):
+        self._credentials_writer.writerow([username, password])
+        self.generated_passwords += 1
+
+    def credentials_csv(self):
+        self.credentials.seek(0)
+        return self.credentials.read()
+
+
+# ---------- Чтение файла ----------
+def _field_map(header):
+    """Индексы колонок файла для известных полей"""
+    lookup = {alias: field for field, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    fields = {}
+    for index, name in enumerate(header):
+        field = lookup.get(str(name or '').strip().lower())
+        if field and field not in fields:
+            fields[field] = index
+    missing = [field for field in REQUIRED_FIELDS if field not in fields]
+    if missing:
+        raise RosterError(f"В файле нет обязательных колонок: {', '.join(missing)}")
+    return fields
+
+
+def _rows(header, rows, first_line):
+    fields = _field_map(header)
+    for line, row in enumerate(rows, start=first_line):
+        if not any(value not in (None, '') for value in row):
+            continue  # пустая строка
+        yield line, {field: row[index] if index < len(row) else None for field, index in fields.items()}
+
+
+def _read_csv(file):
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    # Разделитель определяем по заголовку: в данных запятые встречаются
+    # внутри значений (GPA "3,5", списки навыков)
+    header_line = text.readline()
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(header_line, delimiters=',;\t')
+    except csv.Error:
+        dialect = csv.excel
+    try:
+        reader = csv.reader(text, dialect)
+        header = next(reader, None)
+        if header is None:
+            raise RosterError("Файл пуст")
+        yield from _rows(header, reader, 2)
+    finally:
+        text.detach()  # загруженный файл закрывает владелец, а не обертка
+
+
+def _read_xlsx(file):
+    if openpyxl is None:
+        raise RosterError("Для импорта XLSX установите пакет openpyxl")
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise RosterError("Лист пуст")
+        yield from _rows(header, rows, 2)
+    finally:
+        workbook.close()
+
+
+def read_roster(file, filename):
+    """(номер строки, {поле: значение}) по одной строке файла"""
+    if filename.lower().endswith('.xlsx'):
+        return _read_xlsx(file)
+    if filename.lower().endswith('.csv'):
+        return _read_csv(file)
+    raise RosterError("Поддерживаются файлы .csv и .xlsx")
+
+
+# ---------- Проверка и нормализация ----------
+def _text(value):
+    return re.sub(r'\s+', ' ', str(value)).strip() if value is not None else ''
+
+
+def normalize_row(raw, specializations, skill_options):
+    """Строка файла -> поля студента; ValueError с понятным текстом, если строка плохая"""
+    full_name = _text(raw.get('full_name'))
+    if not full_name:
+        raise ValueError("не указано ФИО")
+
+    email = _text(raw.get('email')).lower()
+    if not _EMAIL_RE.match(email):
+        raise ValueError(f"некорректный email: {email or '(пусто)'}")
+
+    username = _text(raw.get('username')) or email.split('@')[0]
+
+    course_text = _text(raw.get('course'))
+    if not course_text:
+        raise ValueError("не указан курс")
+    digits = re.search(r'\d+', course_text)
+    if not digits or not 1 <= int(digits.group()) <= 4:
+        raise ValueError(f"курс должен быть от 1 до 4: {course_text}")
+    course = int(digits.group())
+
+    specialization_text = _text(raw.get('specialization'))
+    known = {name.lower(): name for name in specializations}
+    specialization = known.get(specialization_text.lower())
+    if specialization is None:
+        raise ValueError(f"неизвестная специальность: {specialization_text or '(пусто)'}")
+
+    gpa = None
+    gpa_text = _text(raw.get('gpa')).replace(',', '.')
+    if gpa_text:
+        try:
+            gpa = float(gpa_text)
+        except ValueError:
+            raise ValueError(f"GPA не число: {gpa_text}")
+        if not 0 <= gpa <= 4:
+            raise ValueError(f"GPA должен быть от 0 до 4: {gpa_text}")
+
+    graduation_year = None
+    year_text = _text(raw.get('graduation_year'))
+    if year_text:
+        if not re.fullmatch(r'\d{4}(\.0)?', year_text):
+            raise ValueError(f"некорректный год выпуска: {year_text}")
+        graduation_year = int(float(year_text))
+
+    # Навыки приводятся к написанию из списка формы, незнакомые сохраняются как есть
+    canonical = {name.lower(): name for name in skill_options}
+    skill_names = [canonical.get(name.lower(), name)
+                   for name in skills.parse_skills(_text(raw.get('skills')).replace(';', ','))]
+
+    return {
+        'full_name': full_name,
+        'email': email,
+        'username': username,
+        'password': _text(raw.get('password')),
+        'course': course,
+        'specialization': specialization,
+        'gpa': gpa,
+        'skills': list(dict.fromkeys(skill_names)),
+        'contact_number': _text(raw.get('contact_number')),
+        'graduation_year': graduation_year,
+    }
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ---------- Запись ----------
+def _write_chunk(students):
+    """Запись порции (номер строки, поля) одной транзакцией; вернет [(line, ошибка)] и созданных"""
+    def write(cursor):
+        errors = []
+        # Логин и email сравниваются по ключам credentials.login_key, как при входе
+        for _, student in students:
+            student['username_key'] = credentials.login_key(student['username'])
+            student['email_key'] = credentials.login_key(student['email'])
+        placeholders = ", ".join("?" for _ in students)
+        cursor.execute(f'''
+            SELECT username_key, email_key FROM users
+            WHERE username_key IN ({placeholders}) OR email_key IN ({placeholders})
+        ''', (*[student['username_key'] for _, student in students],
+              *[student['email_key'] for _, student in students]))
+        taken_usernames, taken_emails = set(), set()
+        for username_key, email_key in cursor.fetchall():
+            taken_usernames.add(username_key)
+            taken_emails.add(email_key)
+
+        accepted = []
+        for line, student in students:
+            if student['username_key'] in taken_usernames:
+                errors.append((line, f"логин уже занят: {student['username']}"))
+            elif student['email_key'] in taken_emails:
+                errors.append((line, f"email уже зарегистрирован: {student['email']}"))
+            else:
+                taken_usernames.add(student['username_key'])
+                taken_emails.add(student['email_key'])
+                accepted.append(student)
+        if not accepted:
+            return errors, []
+
+        cursor.executemany('''
+            INSERT INTO users (username, password_hash, role, full_name, email, username_key, email_key)
+            VALUES (?, ?, 'student', ?, ?, ?, ?)
+        ''', [(student['username'], student['password_hash'], student['full_name'], student['email'],
+               student['username_key'], student['email_key'])
+              for student in accepted])
+
+        placeholders = ", ".join("?" for _ in accepted)
+        cursor.execute(f"SELECT username, id FROM users WHERE username IN ({placeholders})",
+                       [student['username'] for student in accepted])
+        user_ids = dict(cursor.fetchall())
+
+        cursor.executemany('''
+            INSERT INTO students
+            (user_id, full_name, course, specialization, programming_languages,
+             contact_number, email, gpa, graduation_year)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [(user_ids[student['username']], student['full_name'], student['course'],
+               student['specialization'], skills.join_skills(student['skills']),
+               student['contact_number'], student['email'], student['gpa'], student['graduation_year'])
+              for student in accepted])
+
+        cursor.execute(f"SELECT user_id, id FROM students WHERE user_id IN ({placeholders})",
+                       [user_ids[student['username']] for student in accepted])
+        student_ids = dict(cursor.fetchall())
+        skills.add_student_skills(cursor, [(student_ids[user_ids[student['username']]], name)
+                                           for student in accepted for name in student['skills']])
+        return errors, accepted
+    return write
+
+
+def _chunk_result(future):
+    """Результат записи порции.
+
+    Если писатель не ответил за WRITE_TIMEOUT, порция снимается с очереди;
+    уже начатую запись приходится дождаться, иначе отчет разошелся бы с базой.
+    """
+    try:
+        return db_writer.wait(future)
+    except TimeoutError:
+        if future.cancel():
+            raise
+        return future.result()
+
+
+def import_roster(database, file, filename, specializations, skill_options, progress=None,
+                  chunk_size=CHUNK_SIZE):
+    """Импорт списка студентов; progress(report) вызывается после каждой порции.
+
+    Ошибки отдельных строк не прерывают импорт: строка пропускается и
+    попадает в report.errors. Порция, которую не удалось записать, целиком
+    уходит в ошибки, и импорт продолжается со следующей. RosterError - файл
+    целиком не подходит.
+    """
+    report = ImportReport()
+    for chunk in _chunks(read_roster(file, filename), chunk_size):
+        students = []
+        for line, raw in chunk:
+            try:
+                student = normalize_row(raw, specializations, skill_options)
+            except ValueError as e:
+                report.add_error(line, str(e))
+                continue
+            if not student['password']:
+                student['password'] = secrets.token_urlsafe(9)
+                student['generated'] = True
+            students.append((line, student))
+
+        if students:
+            # scrypt считается в пуле credentials до очереди записи: писатель
+            # не держит транзакцию, пока вычисляются хэши
+            hashes = credentials.hash_passwords([student['password'] for _, student in students])
+            for (_, student), password_hash in zip(students, hashes):
+                student['password_hash'] = password_hash
+            try:
+                errors, created = _chunk_result(db_writer.submit(database, _write_chunk(students)))
+            except (sqlite3.Error, TimeoutError) as e:
+                # Порция откатилась целиком; прошлые порции уже в базе, поэтому
+                # импорт продолжается, а строки порции попадают в ошибки
+                reason = str(e) or "база данных не ответила вовремя"
+                errors, created = [(line, f"порция не записана: {reason}") for line, _ in students], []
+            for line, message in errors:
+                report.add_error(line, message)
+            for student in created:
+                if student.get('generated'):
+                    report.add_credentials(student['username'], student['password'])
+            report.created += len(created)
+
+        report.processed += len(chunk)
+        if progress is not None:
+            progress(report)
+    return report
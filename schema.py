@@ -0,0 +1,760 @@
+import hashlib
+
+from migrations import Migration
+
+# ========== СХЕМЫ БАЗ ДАННЫХ ==========
+# Списки миграций для трех файлов БД: keu_career.db (app.py),
+# recruit_system.db (database.py) и grad_recruitment.db (auth.py).
+# Уже выпущенные миграции не меняются - только добавляются новые.
+
+
+def _sha256(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+# ---------- Материализованная статистика (app.py и database.py) ----------
+# Одна строка stats (id = 1) поддерживается триггерами, поэтому чтение
+# статистики стоит O(1) независимо от размера таблиц. Сравнение через IS
+# дает 0/1 и для NULL-значений.
+def _stats_trigger(name, event, assignments):
+    return f'''
+    CREATE TRIGGER IF NOT EXISTS {name} AFTER {event}
+    BEGIN
+        UPDATE stats SET {assignments} WHERE id = 1;
+    END
+    '''
+
+
+_STATS_TABLE = '''
+    CREATE TABLE IF NOT EXISTS stats (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        total_students INTEGER NOT NULL DEFAULT 0,
+        active_students INTEGER NOT NULL DEFAULT 0,
+        active_vacancies INTEGER NOT NULL DEFAULT 0,
+        total_applications INTEGER NOT NULL DEFAULT 0,
+        accepted_applications INTEGER NOT NULL DEFAULT 0,
+        pending_applications INTEGER NOT NULL DEFAULT 0,
+        gpa_sum REAL NOT NULL DEFAULT 0,
+        gpa_count INTEGER NOT NULL DEFAULT 0
+    )
+'''
+
+_STATS_BACKFILL = '''
+    INSERT OR REPLACE INTO stats (
+        id, total_students, active_students, active_vacancies, total_applications,
+        accepted_applications, pending_applications, gpa_sum, gpa_count
+    )
+    SELECT 1,
+        (SELECT COUNT(*) FROM students),
+        (SELECT COUNT(*) FROM students WHERE is_active = 1),
+        (SELECT COUNT(*) FROM vacancies WHERE is_active = 1),
+        (SELECT COUNT(*) FROM applications),
+        (SELECT COUNT(*) FROM applications WHERE status = 'accepted'),
+        (SELECT COUNT(*) FROM applications WHERE status = 'pending'),
+        (SELECT COALESCE(SUM(gpa), 0) FROM students),
+        (SELECT COUNT(gpa) FROM students)
+'''
+
+_STATS_TRIGGERS = [
+    _stats_trigger('trg_stats_students_insert', 'INSERT ON students', '''
+        total_students = total_students + 1,
+        active_students = active_students + (NEW.is_active IS 1),
+        gpa_sum = gpa_sum + COALESCE(NEW.gpa, 0),
+        gpa_count = gpa_count + (NEW.gpa IS NOT NULL)'''),
+    _stats_trigger('trg_stats_students_delete', 'DELETE ON students', '''
+        total_students = total_students - 1,
+        active_students = active_students - (OLD.is_active IS 1),
+        gpa_sum = gpa_sum - COALESCE(OLD.gpa, 0),
+        gpa_count = gpa_count - (OLD.gpa IS NOT NULL)'''),
+    _stats_trigger('trg_stats_students_update', 'UPDATE OF is_active, gpa ON students', '''
+        active_students = active_students + (NEW.is_active IS 1) - (OLD.is_active IS 1),
+        gpa_sum = gpa_sum + COALESCE(NEW.gpa, 0) - COALESCE(OLD.gpa, 0),
+        gpa_count = gpa_count + (NEW.gpa IS NOT NULL) - (OLD.gpa IS NOT NULL)'''),
+    _stats_trigger('trg_stats_vacancies_insert', 'INSERT ON vacancies', '''
+        active_vacancies = active_vacancies + (NEW.is_active IS 1)'''),
+    _stats_trigger('trg_stats_vacancies_delete', 'DELETE ON vacancies', '''
+        active_vacancies = active_vacancies - (OLD.is_active IS 1)'''),
+    _stats_trigger('trg_stats_vacancies_update', 'UPDATE OF is_active ON vacancies', '''
+        active_vacancies = active_vacancies + (NEW.is_active IS 1) - (OLD.is_active IS 1)'''),
+    _stats_trigger('trg_stats_applications_insert', 'INSERT ON applications', '''
+        total_applications = total_applications + 1,
+        accepted_applications = accepted_applications + (NEW.status IS 'accepted'),
+        pending_applications = pending_applications + (NEW.status IS 'pending')'''),
+    _stats_trigger('trg_stats_applications_delete', 'DELETE ON applications', '''
+        total_applications = total_applications - 1,
+        accepted_applications = accepted_applications - (OLD.status IS 'accepted'),
+        pending_applications = pending_applications - (OLD.status IS 'pending')'''),
+    _stats_trigger('trg_stats_applications_update', 'UPDATE OF status ON applications', '''
+        accepted_applications = accepted_applications + (NEW.status IS 'accepted') - (OLD.status IS 'accepted'),
+        pending_applications = pending_applications + (NEW.status IS 'pending') - (OLD.status IS 'pending')'''),
+]
+
+# database.py дополнительно считает трудоустроенных и непрочитанные уведомления
+_RECRUIT_STATS_EXTRA = [
+    "ALTER TABLE stats ADD COLUMN employed_students INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE stats ADD COLUMN unread_notifications INTEGER NOT NULL DEFAULT 0",
+    '''
+    UPDATE stats SET
+        employed_students = (SELECT COUNT(*) FROM employment_reports),
+        unread_notifications = (SELECT COUNT(*) FROM notifications WHERE is_read = 0)
+    WHERE id = 1
+    ''',
+    _stats_trigger('trg_stats_employment_insert', 'INSERT ON employment_reports',
+                   "employed_students = employed_students + 1"),
+    _stats_trigger('trg_stats_employment_delete', 'DELETE ON employment_reports',
+                   "employed_students = employed_students - 1"),
+    _stats_trigger('trg_stats_notifications_insert', 'INSERT ON notifications',
+                   "unread_notifications = unread_notifications + (NEW.is_read IS 0)"),
+    _stats_trigger('trg_stats_notifications_delete', 'DELETE ON notifications',
+                   "unread_notifications = unread_notifications - (OLD.is_read IS 0)"),
+    _stats_trigger('trg_stats_notifications_update', 'UPDATE OF is_read ON notifications',
+                   "unread_notifications = unread_notifications + (NEW.is_read IS 0) - (OLD.is_read IS 0)"),
+]
+
+
+# ---------- Версии таблиц для кэша чтения (query_cache) ----------
+# Каждая запись в таблицу увеличивает ее счетчик в table_versions, так что
+# кэш понимает, какие именно таблицы изменились, в том числе другим процессом.
+def _table_versions(tables):
+    statements = [
+        '''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+    ]
+    for table in tables:
+        statements.append(f"INSERT OR IGNORE INTO table_versions (name, version) VALUES ('{table}', 0)")
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            statements.append(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_version_{table}_{event.lower()} AFTER {event} ON {table}
+            BEGIN
+                UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+            END
+            ''')
+    return statements
+
+
+# ---------- Полнотекстовый поиск (FTS5) ----------
+# Внешний FTS5-индекс хранит только токены, текст читается из самой таблицы.
+# unicode61 приводит кириллицу к нижнему регистру, но не считает ё вариантом е,
+# поэтому в индекс пишем текст с ё -> е (так же нормализуется запрос поиска).
+def _fts_text(prefix, column):
+    return f"replace(replace({prefix}.{column}, 'ё', 'е'), 'Ё', 'Е')"
+
+
+def _fts_index(table, columns, rank):
+    """{table}_fts по columns, наполнение и триггеры синхронизации"""
+    fts = f"{table}_fts"
+    column_list = ", ".join(columns)
+
+    def values(prefix):
+        return ", ".join(_fts_text(prefix, column) for column in columns)
+
+    return [
+        f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {column_list},
+            content='{table}', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        ''',
+        # Веса колонок для ORDER BY rank
+        f"INSERT INTO {fts} ({fts}, rank) VALUES ('rank', '{rank}')",
+        f"INSERT INTO {fts} (rowid, {column_list}) SELECT id, {values(table)} FROM {table}",
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {values('NEW')});
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {values('OLD')});
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{fts}_update AFTER UPDATE OF {column_list} ON {table}
+        BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', OLD.id, {values('OLD')});
+            INSERT INTO {fts} (rowid, {column_list}) VALUES (NEW.id, {values('NEW')});
+        END
+        ''',
+    ]
+
+
+# ---------- Навыки студентов (app.py и database.py) ----------
+# Словарь skills и связи student_skills вместо разбора строки
+# students.programming_languages: "кто знает SQL и 1С" - поиск по индексу
+# (skill_id, student_id). Строка остается для отображения, связи пишет
+# skills.set_student_skills вместе с ней.
+_SKILLS_TABLES = [
+    '''
+    CREATE TABLE IF NOT EXISTS skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS student_skills (
+        student_id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        PRIMARY KEY (student_id, skill_id),
+        FOREIGN KEY (student_id) REFERENCES students (id),
+        FOREIGN KEY (skill_id) REFERENCES skills (id)
+    ) WITHOUT ROWID
+    ''',
+    "CREATE INDEX IF NOT EXISTS idx_student_skills_skill ON student_skills (skill_id, student_id)",
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_student_skills_cleanup AFTER DELETE ON students
+    BEGIN
+        DELETE FROM student_skills WHERE student_id = OLD.id;
+    END
+    ''',
+]
+
+
+def _skills_migration(skill_options):
+    """Словарь навыков из списка формы и перенос строк programming_languages"""
+    def step(cursor):
+        for statement in _SKILLS_TABLES:
+            cursor.execute(statement)
+        cursor.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)",
+                           [(name,) for name in skill_options])
+
+        cursor.execute("SELECT id, programming_languages FROM students WHERE programming_languages != ''")
+        links = set()
+        for student_id, text in cursor.fetchall():
+            for name in text.split(','):
+                name = name.strip()
+                if name:
+                    links.add((student_id, name))
+        # Навыки, которых нет в списке формы, тоже попадают в словарь
+        cursor.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)",
+                           [(name,) for name in {name for _, name in links}])
+        cursor.executemany('''
+            INSERT OR IGNORE INTO student_skills (student_id, skill_id)
+            SELECT ?, id FROM skills WHERE name = ?
+        ''', sorted(links))
+
+        for statement in _table_versions(['skills', 'student_skills']):
+            cursor.execute(statement)
+    return step
+
+
+# ---------- Подбор вакансий (app.py, matching.py) ----------
+_MATCHES_TABLES = [
+    # Лучшие вакансии каждого студента
+    '''
+    CREATE TABLE IF NOT EXISTS student_matches (
+        student_id INTEGER NOT NULL,
+        vacancy_id INTEGER NOT NULL,
+        score REAL NOT NULL,
+        PRIMARY KEY (student_id, vacancy_id)
+    ) WITHOUT ROWID
+    ''',
+    # Лучшие студенты каждой вакансии (шорт-лист)
+    '''
+    CREATE TABLE IF NOT EXISTS vacancy_matches (
+        vacancy_id INTEGER NOT NULL,
+        student_id INTEGER NOT NULL,
+        score REAL NOT NULL,
+        PRIMARY KEY (vacancy_id, student_id)
+    ) WITHOUT ROWID
+    ''',
+]
+
+
+def _matches_migration(cursor):
+    import matching
+
+    for statement in _MATCHES_TABLES + _table_versions(['student_matches', 'vacancy_matches']):
+        cursor.execute(statement)
+    matching.refresh_all(cursor)
+
+
+# ---------- Дневная сводка откликов (app.py, графики аналитики) ----------
+# Число откликов по (день, статус, специальность и компания вакансии).
+# Триггеры поправляют сводку на каждую запись в applications и vacancies,
+# поэтому ряд за годы истории - это сотни строк сводки, а не все отклики.
+# Пустые значения ключа хранятся как '' (NULL в ключе не сливается в ON CONFLICT).
+_DAILY_STATS_KEY = "day, status, specialization, company_name"
+
+_DAILY_STATS_TABLE = f'''
+    CREATE TABLE IF NOT EXISTS daily_application_stats (
+        day TEXT NOT NULL,
+        status TEXT NOT NULL,
+        specialization TEXT NOT NULL,
+        company_name TEXT NOT NULL,
+        applications INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY ({_DAILY_STATS_KEY})
+    ) WITHOUT ROWID
+'''
+
+
+def _daily_stats_add(select):
+    return f'''
+        INSERT INTO daily_application_stats ({_DAILY_STATS_KEY}, applications)
+        {select}
+        ON CONFLICT ({_DAILY_STATS_KEY}) DO UPDATE SET applications = applications + excluded.applications;'''
+
+
+def _daily_stats_application(prefix, sign):
+    """Один отклик (NEW или OLD) в сводку со знаком sign"""
+    return _daily_stats_add(f'''
+        SELECT COALESCE(date({prefix}.application_date), ''), COALESCE({prefix}.status, ''),
+               COALESCE(v.specialization, ''), COALESCE(v.company_name, ''), {sign}
+        FROM (SELECT 1) LEFT JOIN vacancies v ON v.id = {prefix}.vacancy_id
+        WHERE 1''')
+
+
+def _daily_stats_vacancy(vacancy_id, specialization, company_name, sign):
+    """Все отклики вакансии под указанными специальностью и компанией"""
+    return _daily_stats_add(f'''
+        SELECT COALESCE(date(a.application_date), ''), COALESCE(a.status, ''),
+               {specialization}, {company_name}, {sign} * COUNT(*)
+        FROM applications a
+        WHERE a.vacancy_id = {vacancy_id}
+        GROUP BY 1, 2''')
+
+
+def _daily_stats_move(vacancy_id, old, new):
+    """Перенос откликов вакансии с ключа old на new: (специальность, компания) в SQL"""
+    return (_daily_stats_vacancy(vacancy_id, *old, -1) + _daily_stats_vacancy(vacancy_id, *new, 1)
+            + "\n        DELETE FROM daily_application_stats WHERE applications = 0;")
+
+
+_NO_VACANCY = ("''", "''")
+_OLD_VACANCY = ("COALESCE(OLD.specialization, '')", "COALESCE(OLD.company_name, '')")
+_NEW_VACANCY = ("COALESCE(NEW.specialization, '')", "COALESCE(NEW.company_name, '')")
+
+_DAILY_STATS = [
+    _DAILY_STATS_TABLE,
+    # Обнулившиеся строки удаляются по частичному индексу, без просмотра сводки
+    "CREATE INDEX IF NOT EXISTS idx_daily_application_stats_empty ON daily_application_stats (applications) "
+    "WHERE applications = 0",
+    f'''
+    INSERT INTO daily_application_stats ({_DAILY_STATS_KEY}, applications)
+    SELECT COALESCE(date(a.application_date), ''), COALESCE(a.status, ''),
+           COALESCE(v.specialization, ''), COALESCE(v.company_name, ''), COUNT(*)
+    FROM applications a
+    LEFT JOIN vacancies v ON v.id = a.vacancy_id
+    GROUP BY 1, 2, 3, 4
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_applications_insert AFTER INSERT ON applications
+    BEGIN{_daily_stats_application('NEW', 1)}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_applications_delete AFTER DELETE ON applications
+    BEGIN{_daily_stats_application('OLD', -1)}
+        DELETE FROM daily_application_stats WHERE applications = 0;
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_applications_update
+    AFTER UPDATE OF application_date, status, vacancy_id ON applications
+    BEGIN{_daily_stats_application('OLD', -1)}{_daily_stats_application('NEW', 1)}
+        DELETE FROM daily_application_stats WHERE applications = 0;
+    END
+    ''',
+    # Отклики на еще не существовавшую вакансию лежали под ''
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_vacancies_insert AFTER INSERT ON vacancies
+    BEGIN{_daily_stats_move('NEW.id', _NO_VACANCY, _NEW_VACANCY)}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_vacancies_update
+    AFTER UPDATE OF specialization, company_name ON vacancies
+    BEGIN{_daily_stats_move('NEW.id', _OLD_VACANCY, _NEW_VACANCY)}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_vacancies_delete AFTER DELETE ON vacancies
+    BEGIN{_daily_stats_move('OLD.id', _OLD_VACANCY, _NO_VACANCY)}
+    END
+    ''',
+]
+
+
+# Производные таблицы (обновляются триггерами) и таблицы, от которых они зависят
+DERIVED_TABLES = {
+    'stats': ('students', 'vacancies', 'applications', 'employment_reports', 'notifications'),
+    'vacancies_fts': ('vacancies',),
+    'students_fts': ('students',),
+    'daily_application_stats': ('applications', 'vacancies'),
+}
+
+
+# ---------- keu_career.db (app.py) ----------
+_APP_TABLES = [
+    # Таблица пользователей
+    '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role TEXT NOT NULL,
+        full_name TEXT,
+        email TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    # Таблица студентов
+    '''
+    CREATE TABLE IF NOT EXISTS students (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER UNIQUE,
+        full_name TEXT NOT NULL,
+        course INTEGER NOT NULL,
+        specialization TEXT NOT NULL,
+        programming_languages TEXT,
+        work_experience TEXT,
+        portfolio_link TEXT,
+        contact_number TEXT,
+        email TEXT,
+        gpa REAL,
+        university TEXT DEFAULT 'Карагандинский экономический университет Казпотребсоюза',
+        graduation_year INTEGER,
+        is_active INTEGER DEFAULT 1,
+        registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    ''',
+    # Таблица вакансий
+    '''
+    CREATE TABLE IF NOT EXISTS vacancies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        position TEXT NOT NULL,
+        specialization TEXT,
+        required_course INTEGER,
+        salary_range TEXT,
+        description TEXT,
+        requirements TEXT,
+        contact_email TEXT,
+        application_deadline DATE,
+        is_active INTEGER DEFAULT 1,
+        posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    # Таблица откликов
+    '''
+    CREATE TABLE IF NOT EXISTS applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER,
+        vacancy_id INTEGER,
+        application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status TEXT DEFAULT 'pending',
+        cover_letter TEXT,
+        FOREIGN KEY (student_id) REFERENCES students (id),
+        FOREIGN KEY (vacancy_id) REFERENCES vacancies (id)
+    )
+    ''',
+]
+
+
+def _seed_app(cursor):
+    # Добавляем тестовых пользователей если таблица пуста
+    cursor.execute("SELECT COUNT(*) FROM users")
+    if cursor.fetchone()[0] == 0:
+        # Администратор
+        cursor.execute('''
+            INSERT INTO users (username, password_hash, role, full_name, email)
+            VALUES (?, ?, ?, ?, ?)
+        ''', ('admin', _sha256("admin123"), 'admin', 'Администратор Системы', 'admin@keu.edu.kz'))
+
+        # Тестовый студент
+        cursor.execute('''
+            INSERT INTO users (username, password_hash, role, full_name, email)
+            VALUES (?, ?, ?, ?, ?)
+        ''', ('student', _sha256("student123"), 'student', 'Акойбенов Диас Кайырбекович', 'student@keu.edu.kz'))
+
+        cursor.execute('''
+            INSERT INTO students (user_id, full_name, course, specialization, programming_languages,
+            work_experience, contact_number, email, gpa, graduation_year)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (2, 'Айкобенов Диас Кайырбекович', 4, 'Информационные системы', 'Excel, Word, PowerPoint',
+              'Практика в банке "Каспи"', '+7 701 123 4567', 'student@keu.edu.kz', 3.8, 2024))
+
+    # Добавляем тестовые вакансии
+    cursor.execute("SELECT COUNT(*) FROM vacancies")
+    if cursor.fetchone()[0] == 0:
+        test_vacancies = [
+            ('Kaspi Bank', 'Стажер-экономист', 'Экономика', 3,
+             'от 150 000 KZT', 'Анализ финансовых показателей, подготовка отчетов',
+             'Знание Excel, базовые знания экономики, ответственность', 'hr@kaspi.kz', '2024-12-31'),
+            ('Halyk Bank', 'Ассистент финансового аналитика', 'Финансы', 4,
+             '200 000 - 250 000 KZT', 'Помощь в анализе финансовых рынков',
+             'Финансовое образование, аналитическое мышление', 'career@halykbank.kz', '2024-12-15'),
+            ('Kazpost', 'Менеджер по продажам', 'Менеджмент', 3,
+             '180 000 - 220 000 KZT', 'Работа с клиентами, развитие продаж',
+             'Коммуникабельность, стрессоустойчивость', 'jobs@kazpost.kz', '2024-11-30'),
+        ]
+
+        cursor.executemany('''
+            INSERT INTO vacancies
+            (company_name, position, specialization, required_course, salary_range,
+             description, requirements, contact_email, application_deadline)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', test_vacancies)
+
+
+# Индексы под горячие запросы DatabaseManager (проверка: python queries.py)
+_APP_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_students_registration ON students (registration_date)",
+    "CREATE INDEX IF NOT EXISTS idx_vacancies_active_posted ON vacancies (is_active, posted_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_student_date ON applications (student_id, application_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_date ON applications (application_date)",
+    # Покрывающий индекс: отклики на вакансию и их статусы без чтения строк
+    "CREATE INDEX IF NOT EXISTS idx_applications_vacancy_status ON applications (vacancy_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_users_email ON users (email)",
+]
+
+# Индексы под фильтры страниц (page_filters): равенство по фильтру + порядок
+# keyset-страницы, чтобы SQLite сразу шел к нужным строкам. Общие для
+# keu_career.db и recruit_system.db.
+_FILTER_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_students_course_registration ON students (course, registration_date)",
+    "CREATE INDEX IF NOT EXISTS idx_students_spec_registration ON students (specialization, registration_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_status_date ON applications (status, application_date)",
+    "CREATE INDEX IF NOT EXISTS idx_vacancies_active_spec_posted ON vacancies (is_active, specialization, posted_date)",
+]
+
+# Вход по логину или email без учета регистра (credentials.py)
+def _login_keys_migration(cursor):
+    """Колонки username_key/email_key (credentials.login_key) с индексами.
+
+    COLLATE NOCASE складывает только ASCII: кириллические логины,
+    отличающиеся регистром, не находились бы при входе и не ловились
+    как дубликаты.
+    """
+    from credentials import login_key
+
+    cursor.execute("ALTER TABLE users ADD COLUMN username_key TEXT")
+    cursor.execute("ALTER TABLE users ADD COLUMN email_key TEXT")
+    cursor.execute("SELECT id, username, email FROM users")
+    cursor.executemany("UPDATE users SET username_key = ?, email_key = ? WHERE id = ?",
+                       [(login_key(username), login_key(email), user_id)
+                        for user_id, username, email in cursor.fetchall()])
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_username_key ON users (username_key)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_email_key ON users (email_key)")
+
+
+APP_MIGRATIONS = [
+    Migration(1, 'base tables', _APP_TABLES),
+    Migration(2, 'seed demo data', _seed_app),
+    Migration(3, 'hot query indexes', _APP_INDEXES),
+    Migration(4, 'trigger-maintained stats', [_STATS_TABLE, _STATS_BACKFILL] + _STATS_TRIGGERS),
+    Migration(5, 'table versions', _table_versions(['users', 'students', 'vacancies', 'applications'])),
+    Migration(6, 'filter indexes', _FILTER_INDEXES),
+    Migration(7, 'full-text search',
+              _fts_index('vacancies', ['position', 'company_name', 'specialization', 'description', 'requirements'],
+                         'bm25(10.0, 5.0, 3.0, 1.0, 1.0)')
+              + _fts_index('students', ['full_name', 'specialization', 'programming_languages', 'work_experience'],
+                           'bm25(5.0, 3.0, 4.0, 2.0)')),
+    # Список навыков формы профиля (SKILL_OPTIONS на момент миграции)
+    Migration(8, 'student skills', _skills_migration([
+        "Excel", "Word", "PowerPoint", "1С", "SQL", "Python", "SPSS",
+        "Бухгалтерия", "Финансовый анализ", "Маркетинговые исследования",
+        "S#", "JavaScript", "HTML/CSS", "Data Analysis", "Project Management",
+    ])),
+    Migration(9, 'student-vacancy matches', _matches_migration),
+    Migration(10, 'daily application stats', _DAILY_STATS),
+    Migration(11, 'casefolded login keys', _login_keys_migration),
+]
+
+
+# ---------- recruit_system.db (database.py) ----------
+_RECRUIT_TABLES = [
+    # Основная таблица студентов (ваша структура)
+    '''
+    CREATE TABLE IF NOT EXISTS students (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        full_name TEXT NOT NULL,
+        course INTEGER NOT NULL,
+        specialization TEXT,
+        programming_languages TEXT,
+        work_experience TEXT,
+        portfolio_link TEXT,
+        contact_number TEXT,
+        document_id TEXT,
+        is_active BOOLEAN,
+        email TEXT,
+        gpa REAL,
+        university TEXT DEFAULT 'Международный Университет Информационных Технологий',
+        graduation_year INTEGER,
+        registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    # Таблица вакансий
+    '''
+    CREATE TABLE IF NOT EXISTS vacancies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        position TEXT NOT NULL,
+        specialization TEXT,
+        required_course INTEGER,
+        salary_range TEXT,
+        description TEXT,
+        requirements TEXT,
+        contact_email TEXT,
+        application_deadline DATE,
+        is_active INTEGER DEFAULT 1,
+        posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    # Таблица откликов на вакансии
+    '''
+    CREATE TABLE IF NOT EXISTS applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER,
+        vacancy_id INTEGER,
+        application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status TEXT DEFAULT 'pending',
+        cover_letter TEXT,
+        FOREIGN KEY (student_id) REFERENCES students (id),
+        FOREIGN KEY (vacancy_id) REFERENCES vacancies (id)
+    )
+    ''',
+    # Таблица уведомлений
+    '''
+    CREATE TABLE IF NOT EXISTS notifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        title TEXT NOT NULL,
+        message TEXT NOT NULL,
+        is_read INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        notification_type TEXT DEFAULT 'info'
+    )
+    ''',
+    # Таблица отчетов о трудоустройстве
+    '''
+    CREATE TABLE IF NOT EXISTS employment_reports (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER,
+        company_name TEXT,
+        position TEXT,
+        employment_date DATE,
+        salary TEXT,
+        report_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (student_id) REFERENCES students (id)
+    )
+    ''',
+]
+
+
+def _seed_recruit(cursor):
+    # Проверяем, есть ли данные в таблице students
+    cursor.execute("SELECT COUNT(*) FROM students")
+    if cursor.fetchone()[0] == 0:
+        # Добавляем тестовых студентов
+        test_students = [
+            ('Алиев Аскар Бауыржанович', 4, 'Информационные Системы', 'Python, SQL, Java',
+             'Разработка веб-приложений на Django, участие в хакатонах',
+             'https://github.com/askarali', '+7 701 123 4567', '123456789012',
+             1, 'askar@email.com', 3.8, 'Международный Университет Информационных Технологий', 2024),
+            ('Смирнова Анна Ивановна', 5, 'Компьютерные Науки', 'C++, Python, JavaScript',
+             'Стажировка в ТОО "КазТех", разработка мобильного приложения',
+             'https://github.com/annasm', '+7 777 987 6543', '987654321098',
+             1, 'anna@email.com', 3.9, 'Казахстанско-Британский Технический Университет', 2024),
+        ]
+
+        cursor.executemany('''
+            INSERT INTO students
+            (full_name, course, specialization, programming_languages, work_experience,
+             portfolio_link, contact_number, document_id, is_active, email, gpa, university, graduation_year)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', test_students)
+
+    # Проверяем, есть ли данные в таблице vacancies
+    cursor.execute("SELECT COUNT(*) FROM vacancies")
+    if cursor.fetchone()[0] == 0:
+        # Добавляем тестовые вакансии
+        test_vacancies = [
+            ('Kaspi Bank', 'Junior Java Developer', 'Программная Инженерия', 4,
+             'от 300 000 KZT', 'Разработка backend систем для банковских приложений',
+             'Java, Spring Boot, SQL, Git', 'hr@kaspi.kz', '2024-12-31'),
+            ('One Technologies', 'Python Developer', 'Информационные Системы', 4,
+             '350 000 - 500 000 KZT', 'Разработка микросервисов на Python',
+             'Python, FastAPI, PostgreSQL, Docker', 'career@one.kz', '2024-12-15'),
+        ]
+
+        cursor.executemany('''
+            INSERT INTO vacancies
+            (company_name, position, specialization, required_course, salary_range,
+             description, requirements, contact_email, application_deadline)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', test_vacancies)
+
+
+_RECRUIT_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_students_registration ON students (registration_date)",
+    "CREATE INDEX IF NOT EXISTS idx_vacancies_active_posted ON vacancies (is_active, posted_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_student_date ON applications (student_id, application_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_date ON applications (application_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_vacancy_status ON applications (vacancy_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_created ON notifications (user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_employment_reports_date ON employment_reports (employment_date)",
+]
+
+RECRUIT_MIGRATIONS = [
+    Migration(1, 'base tables', _RECRUIT_TABLES),
+    Migration(2, 'seed demo data', _seed_recruit),
+    Migration(3, 'hot query indexes', _RECRUIT_INDEXES),
+    Migration(4, 'trigger-maintained stats',
+              [_STATS_TABLE, _STATS_BACKFILL] + _STATS_TRIGGERS + _RECRUIT_STATS_EXTRA),
+    Migration(5, 'table versions', _table_versions(
+        ['students', 'vacancies', 'applications', 'notifications', 'employment_reports'])),
+    Migration(6, 'filter indexes', _FILTER_INDEXES),
+    # LANGUAGE_OPTIONS database.py на момент миграции
+    Migration(7, 'student skills', _skills_migration([
+        "Python", "Java", "C++", "JavaScript", "TypeScript", "SQL",
+        "R", "Go", "Swift", "Kotlin", "C#", "PHP", "HTML/CSS", "React", "Vue.js",
+    ])),
+]
+
+
+# ---------- grad_recruitment.db (auth.py) ----------
+_AUTH_TABLES = [
+    # Таблица пользователей
+    '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role TEXT NOT NULL CHECK(role IN ('admin', 'employer', 'student')),
+        email TEXT,
+        full_name TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_active INTEGER DEFAULT 1
+    )
+    ''',
+]
+
+
+def _seed_auth(cursor):
+    # Добавляем тестовых пользователей если таблица пустая
+    cursor.execute("SELECT COUNT(*) FROM users")
+    if cursor.fetchone()[0] == 0:
+        cursor.executemany('''
+            INSERT INTO users (username, password_hash, role, email, full_name)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            ('admin', _sha256('admin123'), 'admin', 'admin@system.kz', 'Администратор Системы'),
+            ('student', _sha256('student123'), 'student', 'student@email.com', 'Тестовый Студент'),
+            ('employer', _sha256('employer123'), 'employer', 'employer@company.kz', 'Тестовый Работодатель'),
+        ])
+
+
+AUTH_MIGRATIONS = [
+    Migration(1, 'users table', _AUTH_TABLES),
+    Migration(2, 'seed demo users', _seed_auth),
+    Migration(3, 'casefolded login keys', _login_keys_migration),
+]
@@ -0,0 +1,52 @@
+# ========== НАВЫКИ СТУДЕНТОВ ==========
+# Навыки лежат в словаре skills и связях student_skills (schema.py).
+# students.programming_languages - та же информация строкой для
+# отображения; обе формы пишутся в одной транзакции.
+
+
+def parse_skills(text):
+    """'SQL, 1С' -> ['SQL', '1С'] (пустые и повторы отбрасываются)"""
+    names = []
+    for name in (text or "").split(','):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def join_skills(names):
+    return ", ".join(names)
+
+
+def set_student_skills(cursor, student_id, names):
+    """Заменяет навыки студента; вызывается внутри транзакции записи"""
+    cursor.execute("DELETE FROM student_skills WHERE student_id = ?", (student_id,))
+    add_student_skills(cursor, [(student_id, name) for name in names])
+
+
+def add_student_skills(cursor, pairs):
+    """Добавляет связи (student_id, навык) пачкой; новые навыки попадают в словарь"""
+    if not pairs:
+        return
+    names = dict.fromkeys(name for _, name in pairs)
+    cursor.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)", [(name,) for name in names])
+    cursor.executemany('''
+        INSERT OR IGNORE INTO student_skills (student_id, skill_id)
+        SELECT ?, id FROM skills WHERE name = ?
+    ''', pairs)
+
+
+def skills_condition(names, match_all=True, column='id'):
+    """Условие WHERE "студент знает все (или хотя бы один) из навыков names".
+
+    Подзапрос идет по индексу (skill_id, student_id): читаются только
+    связи нужных навыков, строки студентов не разбираются.
+    """
+    placeholders = ", ".join("?" for _ in names)
+    having = f" GROUP BY ss.student_id HAVING COUNT(*) = {len(names)}" if match_all else ""
+    condition = f'''{column} IN (
+        SELECT ss.student_id FROM student_skills ss
+        JOIN skills sk ON sk.id = ss.skill_id
+        WHERE sk.name IN ({placeholders}){having}
+    )'''
+    return condition, list(names)
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+import db_pool
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # снимки для BI - опционально
+    pa = pq = None
+
+# ========== СНИМКИ ДЛЯ BI (PARQUET) ==========
+# Таблицы выгружаются в snapshots/<база>/<таблица>/month=YYYY-MM/data.parquet
+# по месяцу колонки с датой. Рядом лежит manifest.json: версия таблицы
+# (table_versions), колонки и sha256 строк каждой партиции. Повторный
+# запуск пропускает таблицы с той же версией, а в остальных перезаписывает
+# только партиции, у которых изменился хэш. Аналитики читают файлы, не
+# трогая рабочую SQLite.
+SNAPSHOT_DIR = 'snapshots'
+MANIFEST_NAME = 'manifest.json'
+CHUNK_SIZE = 5000
+NO_MONTH = 'unknown'  # строки без даты
+
+# Таблица -> колонка, по месяцу которой режутся партиции
+PARTITION_COLUMNS = {
+    'students': 'registration_date',
+    'vacancies': 'posted_date',
+    'applications': 'application_date',
+    'users': 'created_at',
+    'notifications': 'created_at',
+    'employment_reports': 'employment_date',
+}
+
+# Не выгружаются никогда
+EXCLUDED_COLUMNS = {
+    'users': {'password_hash'},
+}
+
+
+class SnapshotError(RuntimeError):
+    """Снимок нельзя построить (нет pyarrow)"""
+
+
+def _arrow_type(declared):
+    """Тип Parquet по объявленному типу колонки (правила affinity SQLite).
+
+    Даты остаются строками ISO, как они лежат в SQLite.
+    """
+    declared = (declared or '').upper()
+    if 'INT' in declared or declared == 'BOOLEAN':
+        return 'int64', 'INTEGER'
+    if any(name in declared for name in ('REAL', 'FLOA', 'DOUB')):
+        return 'float64', 'REAL'
+    return 'string', 'TEXT'
+
+
+def _columns(conn, table):
+    """[(колонка, тип arrow, тип для CAST)] без исключенных колонок"""
+    excluded = EXCLUDED_COLUMNS.get(table, set())
+    return [(name, *_arrow_type(declared))
+            for _, name, declared, *_ in conn.execute(f"PRAGMA table_info({table})")
+            if name not in excluded]
+
+
+def _select(table, columns, partition_column):
+    # CAST гарантирует один тип значений в колонке: SQLite хранит что угодно где угодно
+    casts = ", ".join(f"CAST({name} AS {cast}) as {name}" for name, _, cast in columns)
+    return f"SELECT {partition_column}, {casts} FROM {table} ORDER BY {partition_column}, id"
+
+
+def _month(value):
+    return value[:7] if isinstance(value, str) and value else NO_MONTH
+
+
+def _rows(conn, query, chunk_size):
+    """(месяц, строка без колонки партиции) из курсора порциями"""
+    cursor = conn.execute(query)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        for row in rows:
+            yield _month(row[0]), row[1:]
+
+
+def _table_version(conn, table):
+    try:
+        row = conn.execute("SELECT version FROM table_versions WHERE name = ?", (table,)).fetchone()
+    except sqlite3.OperationalError:
+        return None  # схема без table_versions
+    return row[0] if row else None
+
+
+def _partition_path(table, month):
+    return os.path.join(table, f"month={month}", "data.parquet")
+
+
+class _PartitionWriter:
+    """Пишет строки одной партиции пачками во временный файл рядом с целевым"""
+
+    def __init__(self, path, schema, chunk_size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        self.schema = schema
+        self.chunk_size = chunk_size
+        self.rows = []
+        self.writer = pq.ParquetWriter(self.tmp_path, schema)
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            columns = list(zip(*self.rows))
+            self.writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, field.type) for values, field in zip(columns, self.schema)],
+                schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+
+
+def _snapshot_table(conn, table, root, previous, chunk_size):
+    """Выгружает изменившиеся партиции таблицы, возвращает запись манифеста и число записанных"""
+    partition_column = PARTITION_COLUMNS[table]
+    columns = _columns(conn, table)
+    column_types = [[name, arrow_type] for name, arrow_type, _ in columns]
+    version = _table_version(conn, table)
+
+    previous = previous or {}
+    (rows,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    unchanged = (version is not None and previous.get('version') == version
+                 and previous.get('rows') == rows and previous.get('columns') == column_types
+                 and all(os.path.exists(os.path.join(root, partition['path']))
+                         for partition in previous.get('partitions', {}).values()))
+    if unchanged:
+        return previous, 0
+
+    query = _select(table, columns, partition_column)
+
+    # Проход 1: хэш и число строк каждой партиции - без записи файлов
+    hashes, counts = {}, {}
+    for month, row in _rows(conn, query, chunk_size):
+        if month not in hashes:
+            hashes[month] = hashlib.sha256()
+            counts[month] = 0
+        hashes[month].update(repr(row).encode('utf-8'))
+        counts[month] += 1
+
+    old_partitions = previous.get('partitions', {}) if previous.get('columns') == column_types else {}
+    partitions = {month: {'path': _partition_path(table, month), 'rows': counts[month],
+                          'sha256': hashes[month].hexdigest()} for month in sorted(hashes)}
+    changed = {month for month, partition in partitions.items()
+               if old_partitions.get(month, {}).get('sha256') != partition['sha256']
+               or not os.path.exists(os.path.join(root, partition['path']))}
+
+    # Проход 2: в Parquet кодируются только изменившиеся партиции
+    if changed:
+        schema = pa.schema([(name, arrow_type) for name, arrow_type, _ in columns])
+        writers = {}
+        try:
+            for month, row in _rows(conn, query, chunk_size):
+                if month in changed:
+                    if month not in writers:
+                        writers[month] = _PartitionWriter(
+                            os.path.join(root, partitions[month]['path']), schema, chunk_size)
+                    writers[month].add(row)
+        except BaseException:
+            for writer in writers.values():
+                writer.writer.close()
+                os.remove(writer.tmp_path)
+            raise
+        for writer in writers.values():
+            writer.close()
+
+    # Месяцы, в которых строк больше нет
+    for month, partition in previous.get('partitions', {}).items():
+        if month not in partitions:
+            path = os.path.join(root, partition['path'])
+            if os.path.exists(path):
+                os.remove(path)
+            try:
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+
+    return {
+        'version': version,
+        'partition_column': partition_column,
+        'columns': column_types,
+        'rows': sum(counts.values()),
+        'partitions': partitions,
+    }, len(changed)
+
+
+def _read_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(path, manifest):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def snapshot_database(database, out_dir=SNAPSHOT_DIR, chunk_size=CHUNK_SIZE):
+    """Снимок всех известных таблиц файла БД; вернет {таблица: записано партиций}.
+
+    Каждая таблица читается в своей транзакции чтения: оба прохода видят
+    одни и те же данные. В режиме WAL писателей это не задерживает.
+    """
+    if pq is None:
+        raise SnapshotError("Для снимков Parquet установите пакет pyarrow")
+
+    root = os.path.join(out_dir, os.path.splitext(os.path.basename(database))[0])
+    os.makedirs(root, exist_ok=True)
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    previous = _read_manifest(manifest_path).get('tables', {})
+
+    tables, written = {}, {}
+    with db_pool.connection(database) as conn:
+        existing = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for table in PARTITION_COLUMNS:
+            if table not in existing:
+                continue
+            conn.execute("BEGIN")
+            try:
+                tables[table], written[table] = _snapshot_table(conn, table, root, previous.get(table),
+                                                                chunk_size)
+            finally:
+                conn.rollback()
+
+    _write_manifest(manifest_path, {
+        'database': os.path.basename(database),
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'tables': tables,
+    })
+    return written
+
+
+def main(argv):
+    # python snapshots.py keu_career.db [recruit_system.db ...] [--out snapshots]
+    out_dir = SNAPSHOT_DIR
+    if '--out' in argv:
+        index = argv.index('--out')
+        out_dir = argv[index + 1]
+        argv = argv[:index] + argv[index + 2:]
+    for database in argv or ['keu_career.db']:
+        for table, count in snapshot_database(database, out_dir).items():
+            print(f"{database}: {table} - перезаписано партиций: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+
+# ========== БЮДЖЕТ ХОЛОДНОГО СТАРТА ==========
+# Проверка: python startup.py. Для каждого первого экрана в отдельном
+# процессе импортируются его модули и замеряется время сверх базового
+# импорта streamlit и pandas (без них приложение не запускается вовсе).
+# Заодно проверяется, что тяжелые модули других страниц не загружены.
+STARTUP_BUDGET_MS = 100
+BASE_MODULES = ['streamlit', 'pandas']
+CORE_MODULES = ['app_db', 'components', 'theme', 'views']
+
+# Экран -> модули, которые он импортирует
+SCREENS = {
+    'login': CORE_MODULES + ['views.login'],
+    'student': CORE_MODULES + ['views.student'],
+    'admin': CORE_MODULES + ['views.admin'],
+}
+
+# Загружаются только страницами аналитики, импорта и снимков
+HEAVY_MODULES = ['plotly.express', 'pyarrow.parquet', 'openpyxl', 'charts', 'snapshots', 'roster_import']
+
+_PROBE = '''
+import importlib, json, sys, time
+for name in {base!r}:
+    importlib.import_module(name)
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'ms': elapsed, 'heavy': [name for name in {heavy!r} if name in sys.modules]}}))
+'''
+
+
+def measure(modules, runs=3):
+    """(лучшее время импорта modules в мс, загруженные тяжелые модули) по runs запускам"""
+    code = _PROBE.format(base=BASE_MODULES, modules=modules, heavy=HEAVY_MODULES)
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=here, capture_output=True, text=True,
+                                check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return min(result['ms'] for result in results), results[0]['heavy']
+
+
+def main(argv):
+    # python startup.py [бюджет в мс]
+    budget = float(argv[0]) if argv else STARTUP_BUDGET_MS
+    failed = False
+    for screen, modules in SCREENS.items():
+        elapsed, heavy = measure(modules)
+        status = "ok"
+        if elapsed > budget:
+            status = f"превышен бюджет {budget:.0f} мс"
+            failed = True
+        if heavy:
+            status = f"загружены {', '.join(heavy)}"
+            failed = True
+        print(f"{screen}: {elapsed:.0f} мс - {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+import db_pool
+import migrations
+import schema
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Путь к временному файлу БД; пул соединений к нему закрывается после теста"""
+    path = str(tmp_path / "test.db")
+    yield path
+    db_pool.get_pool(path).close_all()
+
+
+@pytest.fixture(params=['rollback', 'wal'])
+def storage_mode(request, monkeypatch):
+    """Тест выполняется в обоих режимах хранения"""
+    monkeypatch.setattr(db_pool, 'STORAGE_MODE', request.param)
+    return request.param
+
+
+@pytest.fixture
+def wal(monkeypatch):
+    monkeypatch.setattr(db_pool, 'STORAGE_MODE', 'wal')
+
+
+@pytest.fixture
+def sql(database):
+    """Чтение в обход пула и кэшей: sql(query, params) -> список строк"""
+    def run(query, params=()):
+        conn = sqlite3.connect(database)
+        try:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+    return run
+
+
+@pytest.fixture
+def app_database(database, monkeypatch):
+    """Схема app.py (APP_MIGRATIONS) во временном файле; на него смотрит app_db"""
+    import app_db
+
+    migrations.migrate(database, schema.APP_MIGRATIONS)
+    monkeypatch.setattr(app_db, 'DATABASE_NAME', database)
+    return database
+
+
+@pytest.fixture
+def manager(app_database):
+    import app_db
+    return app_db.DatabaseManager()
+
+
+@pytest.fixture
+def recruit_database(database, monkeypatch):
+    """Схема database.py (RECRUIT_MIGRATIONS) во временном файле"""
+    import database as recruit
+
+    migrations.migrate(database, schema.RECRUIT_MIGRATIONS)
+    monkeypatch.setattr(recruit, 'DATABASE_NAME', database)
+    return database
+
+
+@pytest.fixture
+def recruit_manager(recruit_database):
+    import database as recruit
+    return recruit.DatabaseManager()
@@ -0,0 +1,43 @@
+import page_filters
+import queries
+
+
+def _apply_to_all(manager, sql):
+    (student_id,), = sql("SELECT id FROM students")
+    for (vacancy_id,) in sql("SELECT id FROM vacancies ORDER BY id"):
+        manager.apply_for_vacancy(student_id, vacancy_id, "")
+
+
+def test_statuses_batch(manager, sql, storage_mode):
+    _apply_to_all(manager, sql)
+    ids = [app_id for (app_id,) in sql("SELECT id FROM applications ORDER BY id")]
+    assert manager.update_application_statuses(ids[:2], 'accepted') == 2
+    # Повтор не меняет строки, у которых статус уже такой
+    assert manager.update_application_statuses(ids, 'accepted') == 1
+    assert sql("SELECT DISTINCT status FROM applications") == [('accepted',)]
+
+
+def test_single_status_reports_change(manager, sql):
+    _apply_to_all(manager, sql)
+    (app_id,), = sql("SELECT MIN(id) FROM applications")
+    assert manager.update_application_status(app_id, 'accepted') is True
+    assert manager.update_application_status(app_id, 'accepted') is False
+    assert manager.update_application_status(10 ** 6, 'accepted') is False
+
+
+def test_update_where_with_search_filter(manager, sql, storage_mode):
+    _apply_to_all(manager, sql)
+    # contains() компилируется в py_lower(): функция нужна и соединению писателя в WAL
+    filters = (page_filters.equals('a.status', 'pending'),
+               page_filters.contains(('s.full_name', 'v.position'), 'МЕНЕДЖЕР'))
+    assert manager.count_applications(filters) == 1
+    assert manager.update_applications_where('rejected', filters) == 1
+    assert sql('''SELECT v.position FROM applications a JOIN vacancies v ON v.id = a.vacancy_id
+                  WHERE a.status = 'rejected' ''') == [('Менеджер по продажам',)]
+
+
+def test_update_where_closed_vacancies(manager, sql, storage_mode):
+    _apply_to_all(manager, sql)
+    filters = (page_filters.equals('a.status', 'pending'),)
+    # Дедлайны тестовых вакансий уже прошли - закрыты все три
+    assert manager.update_applications_where('rejected', filters, conditions=[queries.CLOSED_VACANCY]) == 3
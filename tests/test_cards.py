@@ -0,0 +1,63 @@
+import pytest
+
+import cards
+
+
+@pytest.fixture(autouse=True)
+def fragments(monkeypatch):
+    cache = cards.FragmentCache(max_entries=3)
+    monkeypatch.setattr(cards, 'fragments', cache)
+    return cache
+
+
+def test_template_is_compiled_to_one_line():
+    template = cards.CardTemplate('test', """
+        <div class="{kind}">
+            {title} / {title}
+        </div>
+    """)
+    assert template.fields == ('kind', 'title')
+    assert template.render({'kind': 'a', 'title': 'Б'}) == '<div class="a">Б / Б</div>'
+
+
+def test_plain_fields_are_escaped():
+    row = {'position': '<script>alert(1)</script>', 'company_name': 'A & B', 'specialization': None,
+           'required_course': float('nan'), 'salary_range': '', 'summary_html': ''}
+    fragment = cards.VACANCY_CARD.render(row)
+    assert '<script>' not in fragment
+    assert '&lt;script&gt;alert(1)&lt;/script&gt;' in fragment
+    assert 'A &amp; B' in fragment
+    assert 'None' not in fragment and 'nan' not in fragment
+
+
+def test_quotes_cannot_leave_attribute():
+    row = {'status': '" onmouseover="alert(1)', 'status_text': 'x', 'cover_letter_html': ''}
+    fragment = cards.RECENT_APPLICATION_CARD.render(row)
+    assert 'status-&quot; onmouseover=&quot;alert(1)' in fragment
+
+
+def test_html_fields_pass_through():
+    letter = cards.cover_letter('<b>Здравствуйте</b>')
+    assert '&lt;b&gt;Здравствуйте&lt;/b&gt;' in letter
+    row = {'status': 'pending', 'status_text': 'Ожидает', 'cover_letter_html': letter}
+    fragment = cards.RECENT_APPLICATION_CARD.render(row)
+    # Готовая разметка вставлена как есть, без повторного экранирования
+    assert letter in fragment
+    assert cards.cover_letter(None) == ''
+
+
+def test_fragments_are_cached_per_values(fragments):
+    template = cards.CardTemplate('test', "<p>{title}</p>")
+    template.render({'title': 'a'})
+    template.render({'title': 'a'})
+    template.render({'title': 'b'})
+    assert (fragments.hits, fragments.misses) == (1, 2)
+
+
+def test_fragment_cache_evicts_least_recent(fragments):
+    template = cards.CardTemplate('test', "<p>{title}</p>")
+    for title in ['a', 'b', 'c', 'a', 'd']:  # 'a' использован снова - вытесняется 'b'
+        template.render({'title': title})
+    assert fragments.get(('test', ('b',))) is None
+    assert [fragments.get(('test', (title,))) for title in 'acd'] == ['<p>a</p>', '<p>c</p>', '<p>d</p>']
+    assert len(fragments._entries) == fragments.max_entries
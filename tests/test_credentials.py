@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+import credentials
+import migrations
+import queries
+import schema
+
+
+def test_hash_and_verify():
+    stored = credentials.hash_password("пароль-123")
+    assert stored.startswith("scrypt$")
+    assert credentials.verify_password("пароль-123", stored)
+    assert not credentials.verify_password("пароль-124", stored)
+    assert not credentials.needs_rehash(stored)
+
+
+def test_legacy_hash_and_rehash_rules():
+    legacy = credentials.legacy_hash("student123")
+    assert credentials.verify_password("student123", legacy)
+    assert credentials.needs_rehash(legacy)
+    assert credentials.needs_rehash(credentials.hash_password("x", n=2 ** 10))
+    assert not credentials.verify_password("x", "scrypt$broken")
+
+
+def test_non_ascii_stored_hash_is_rejected():
+    # Раньше compare_digest на str с кириллицей бросал TypeError
+    assert credentials.verify_password("x", "испорченный хэш") is False
+
+
+def test_login_key_folds_unicode_case():
+    assert credentials.login_key("Иванов") == credentials.login_key("иВАНОВ")
+    assert credentials.login_key("Straße@Mail.KZ") == credentials.login_key("STRASSE@mail.kz")
+    assert credentials.login_key("") is None
+
+
+def _wait_for(check, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if check():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_authenticate_rehashes_legacy_hash(app_database, sql, storage_mode):
+    row = credentials.authenticate(app_database, queries.AUTHENTICATE_USER, "STUDENT", "student123")
+    assert row is not None and row[2] == 'student'
+    assert credentials.authenticate(app_database, queries.AUTHENTICATE_USER, "student", "wrong") is None
+    assert credentials.authenticate(app_database, queries.AUTHENTICATE_USER, "nobody", "student123") is None
+
+    def rehashed():
+        (stored,), = sql("SELECT password_hash FROM users WHERE username = 'student'")
+        return not credentials.needs_rehash(stored)
+    assert _wait_for(rehashed)
+    assert credentials.authenticate(app_database, queries.AUTHENTICATE_USER, "student@KEU.edu.kz",
+                                    "student123") is not None
+
+
+def test_cyrillic_login_is_case_insensitive(database, monkeypatch, storage_mode):
+    import auth
+
+    migrations.migrate(database, schema.AUTH_MIGRATIONS)
+    monkeypatch.setattr(auth, 'DATABASE_NAME', database)
+    assert auth.register_user("Иванов", "секрет", 'student', "Иванов@Почта.kz", "Иванов Иван")
+    # Отличается только регистром кириллицы - дубликат
+    assert not auth.register_user("иванов", "другой", 'student', "other@mail.kz", "Другой")
+
+    user = auth.authenticate_user("ИВАНОВ", "секрет")
+    assert user is not None and user['username'] == "Иванов"
+    assert auth.authenticate_user("иванов@почта.KZ", "секрет") is not None
+
+
+@pytest.mark.parametrize('migration_list', [schema.APP_MIGRATIONS, schema.AUTH_MIGRATIONS])
+def test_login_keys_backfilled(database, sql, migration_list):
+    migrations.migrate(database, migration_list)
+    rows = sql("SELECT username, email, username_key, email_key FROM users")
+    assert rows
+    for username, email, username_key, email_key in rows:
+        assert username_key == credentials.login_key(username)
+        assert email_key == credentials.login_key(email)
@@ -0,0 +1,76 @@
+import sqlite3
+import threading
+
+import pytest
+
+import db_pool
+
+
+def test_connections_are_reused(database):
+    pool = db_pool.ConnectionPool(database, max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first
+
+
+def test_checkout_is_bounded(database):
+    pool = db_pool.ConnectionPool(database, max_size=2, timeout=0.1)
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second
+    with pytest.raises(db_pool.PoolExhaustedError):
+        pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+
+
+def test_waiting_checkout_gets_released_connection(database):
+    pool = db_pool.ConnectionPool(database, max_size=1, timeout=5)
+    conn = pool.acquire()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    pool.release(conn)
+    waiter.join(5)
+    assert got == [conn]
+
+
+def test_broken_connection_is_replaced(database):
+    pool = db_pool.ConnectionPool(database, max_size=1)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.close()  # соединение умерло, пока лежало в пуле
+    with pool.connection() as fresh:
+        assert fresh is not conn
+        assert fresh.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_open_transaction_does_not_leak(database):
+    pool = db_pool.ConnectionPool(database, max_size=1)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")  # владелец забыл commit
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+
+
+def test_pool_connections_have_app_functions(database):
+    with db_pool.connection(database) as conn:
+        assert conn.execute("SELECT py_lower('ИВАНОВ')").fetchone() == ('иванов',)
+
+
+def test_wal_mode_pragmas(database, wal):
+    with db_pool.ConnectionPool(database).connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ('wal',)
+        assert conn.execute("PRAGMA busy_timeout").fetchone() == (db_pool.BUSY_TIMEOUT_MS,)
+
+
+def test_closed_pool_drops_returned_connections(database):
+    pool = db_pool.ConnectionPool(database, max_size=1)
+    conn = pool.acquire()
+    pool.close_all()
+    pool.release(conn)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
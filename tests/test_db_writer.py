@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+import db_writer
+
+
+def _table(database):
+    db_writer.write(database, db_writer.statement("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)"))
+
+
+def test_statement_result_after_commit(database, sql, storage_mode):
+    _table(database)
+    result = db_writer.write(database, db_writer.statement("INSERT INTO items (name) VALUES (?)", ('a',)))
+    assert result.rowcount == 1
+    assert sql("SELECT id, name FROM items") == [(result.lastrowid, 'a')]
+
+
+def test_failed_job_rolls_back_only_its_savepoint(database, sql, wal):
+    _table(database)
+    writer = db_writer.get_writer(database)
+    gate = threading.Event()
+
+    def blocker(cursor):
+        gate.wait(5)
+
+    def partial_then_fail(cursor):
+        cursor.execute("INSERT INTO items (name) VALUES ('partial')")
+        cursor.execute("INSERT INTO items (name) VALUES ('a')")  # нарушает UNIQUE
+
+    # Пока писатель занят blocker, остальные задачи копятся в одну группу
+    first = writer.submit(blocker)
+    futures = [writer.execute("INSERT INTO items (name) VALUES ('a')"),
+               writer.submit(partial_then_fail),
+               writer.execute("INSERT INTO items (name) VALUES ('b')")]
+    gate.set()
+    first.result(5)
+
+    assert futures[0].result(5).rowcount == 1
+    with pytest.raises(Exception, match="UNIQUE"):
+        futures[1].result(5)
+    assert futures[2].result(5).rowcount == 1
+    assert sql("SELECT name FROM items ORDER BY name") == [('a',), ('b',)]
+
+
+def test_writer_survives_base_exception(database, sql, wal):
+    _table(database)
+
+    def interrupted(cursor):
+        cursor.execute("INSERT INTO items (name) VALUES ('lost')")
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        db_writer.write(database, interrupted, timeout=5)
+    # Поток-писатель жив: следующая запись выполняется, а не висит
+    assert db_writer.write(database, db_writer.statement("INSERT INTO items (name) VALUES ('next')"),
+                           timeout=5).rowcount == 1
+    assert sql("SELECT name FROM items") == [('next',)]
+
+
+def test_wait_times_out(database, wal):
+    _table(database)
+    gate = threading.Event()
+    future = db_writer.submit(database, lambda cursor: gate.wait(5))
+    with pytest.raises(TimeoutError):
+        db_writer.wait(future, timeout=0.1)
+    gate.set()
+    future.result(5)
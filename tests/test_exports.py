@@ -0,0 +1,63 @@
+import csv
+import io
+import sqlite3
+
+import exports
+import page_filters
+
+
+def _add_students(database, count):
+    conn = sqlite3.connect(database)
+    conn.executemany(
+        "INSERT INTO students (full_name, course, specialization, email, gpa, registration_date) "
+        "VALUES (?, 2, 'Финансы', ?, 3.0, ?)",
+        [(f"Студент {n:02d}", f"s{n}@keu.kz", f"2026-01-{n % 28 + 1:02d} 10:00:00") for n in range(count)])
+    conn.commit()
+    conn.close()
+
+
+def _parse(text):
+    return list(csv.reader(io.StringIO(text)))
+
+
+def test_streams_in_chunks(app_database, sql):
+    _add_students(app_database, 25)
+    chunks = list(exports.iter_csv(app_database, exports.STUDENTS, chunk_size=10))
+    # 26 студентов (с демо-студентом): три порции, заголовок - в первой
+    assert len(chunks) == 3
+    rows = _parse("".join(chunks))
+    assert rows[0] == exports.STUDENTS.headers
+    assert len(rows) == 27
+    assert len(_parse(chunks[0])) == 11
+
+    expected = sql(f"{exports.STUDENTS.select} ORDER BY {exports.STUDENTS.order}")
+    assert [row[0] for row in rows[1:]] == [row[0] for row in expected]
+
+
+def test_filters_and_empty_result(app_database):
+    _add_students(app_database, 5)
+    filters = (page_filters.contains('full_name', 'студент 03'),)
+    rows = _parse("".join(exports.iter_csv(app_database, exports.STUDENTS, filters)))
+    assert [row[0] for row in rows[1:]] == ['Студент 03']
+
+    nothing = (page_filters.contains('full_name', 'нет такого'),)
+    assert _parse("".join(exports.iter_csv(app_database, exports.STUDENTS, nothing))) == [exports.STUDENTS.headers]
+
+
+def test_csv_file_has_bom_and_same_content(app_database):
+    _add_students(app_database, 3)
+    fileobj = exports.csv_file(app_database, exports.VACANCIES, chunk_size=2)
+    data = fileobj.read()
+    assert data.startswith('﻿'.encode('utf-8'))
+    assert data.decode('utf-8-sig') == "".join(exports.iter_csv(app_database, exports.VACANCIES))
+
+
+def test_abandoned_export_returns_connection(app_database):
+    _add_students(app_database, 30)
+    chunks = exports.iter_csv(app_database, exports.STUDENTS, chunk_size=5)
+    next(chunks)
+    chunks.close()  # пользователь ушел со страницы, не дочитав
+    pool = exports.db_pool.get_pool(app_database)
+    connections = [pool.acquire() for _ in range(pool.max_size)]
+    for conn in connections:
+        pool.release(conn)
@@ -0,0 +1,126 @@
+import random
+
+import db_writer
+import matching
+
+SKILLS = ['Python', 'SQL', 'Excel', '1С', 'Power BI', 'Java']
+SPECIALIZATIONS = ['Экономика', 'Финансы', 'Информационные системы', 'Менеджмент']
+
+
+def _student(rng, number):
+    # GPA у всех разный: в топах вакансий нет равных оценок
+    return (f'Студент {number}', rng.randint(1, 4), rng.choice(SPECIALIZATIONS),
+            ", ".join(rng.sample(SKILLS, rng.randint(0, 3))), '', '', '', f's{number}@keu.kz',
+            round(2.0 + number * 0.013, 3), 2026, 1)
+
+
+def _vacancy(rng, number):
+    return ('Компания', f'Вакансия {number}', rng.choice(SPECIALIZATIONS), rng.randint(1, 4), '',
+            'Описание', "Нужно: " + ", ".join(rng.sample(SKILLS, 2)), 'hr@example.kz', '2099-12-31')
+
+
+def _matches(sql):
+    students = {}
+    for student_id, score in sql("SELECT student_id, score FROM student_matches"):
+        students.setdefault(student_id, []).append(round(score, 5))
+    vacancies = sql("SELECT vacancy_id, student_id, round(score, 5) FROM vacancy_matches ORDER BY 1, 2")
+    return {key: sorted(scores) for key, scores in students.items()}, vacancies
+
+
+def _recompute(database, sql):
+    db_writer.write(database, matching.refresh_all)
+    return _matches(sql)
+
+
+def test_incremental_refresh_equals_full_recompute(manager, app_database, sql, storage_mode):
+    rng = random.Random(7)
+    for number in range(25):
+        assert manager.insert_student(number + 100, _student(rng, number))
+    for number in range(6):
+        manager.insert_vacancy(_vacancy(rng, number))
+    # Очередь писателя FIFO: пустая запись дожидается фоновых пересчетов
+    db_writer.write(app_database, lambda cursor: None)
+    incremental = _matches(sql)
+    assert incremental[0] and incremental[1]
+    assert incremental == _recompute(app_database, sql)
+
+    # Изменение профиля и закрытие вакансии
+    profile = list(_student(rng, 5))
+    profile[3] = "Python, SQL, Java"
+    assert manager.update_student(105, tuple(profile))
+    (vacancy_id,), = sql("SELECT id FROM vacancies WHERE position = 'Вакансия 2'")
+    manager.execute_query("UPDATE vacancies SET is_active = 0 WHERE id = ?", (vacancy_id,))
+    manager.refresh_matches(vacancy_id=vacancy_id)
+    db_writer.write(app_database, lambda cursor: None)
+    incremental = _matches(sql)
+    assert incremental == _recompute(app_database, sql)
+    assert all(len(scores) <= matching.TOP_K for scores in incremental[0].values())
+
+
+def test_insert_student_reports_failure(manager, sql):
+    before = sql("SELECT COUNT(*) FROM students")
+    assert manager.insert_student(1, ('неполные', 'данные')) is False
+    assert sql("SELECT COUNT(*) FROM students") == before
+
+
+def _seed(manager, app_database, rng, students=25, vacancies=6):
+    for number in range(students):
+        assert manager.insert_student(number + 100, _student(rng, number))
+    for number in range(vacancies):
+        manager.insert_vacancy(_vacancy(rng, number))
+    db_writer.write(app_database, lambda cursor: None)
+
+
+def test_random_profile_edits_match_full_recompute(manager, app_database, sql):
+    rng = random.Random(11)
+    _seed(manager, app_database, rng)
+    for step in range(40):
+        number = rng.randrange(25)
+        if rng.random() < 0.1:
+            for (student_id,) in sql("SELECT id FROM students WHERE user_id = ?", (number + 100,)):
+                manager.execute_query("DELETE FROM students WHERE id = ?", (student_id,))
+                manager.refresh_matches(student_id=student_id)
+            continue
+        profile = list(_student(rng, number))
+        profile[8] = round(2.0 + rng.random() * 2, 4)  # оценка участника топа может и упасть
+        if manager.update_student(number + 100, tuple(profile)):
+            db_writer.write(app_database, lambda cursor: None)
+            incremental = _matches(sql)
+            assert incremental == _recompute(app_database, sql), step
+
+
+def test_deleted_student_leaves_vacancy_tops(manager, app_database, sql):
+    _seed(manager, app_database, random.Random(3))
+    (student_id,), = sql("SELECT student_id FROM vacancy_matches ORDER BY score DESC LIMIT 1")
+    manager.execute_query("DELETE FROM students WHERE id = ?", (student_id,))
+    db_writer.write(app_database, lambda cursor: matching.refresh_student(cursor, student_id))
+    assert sql("SELECT COUNT(*) FROM vacancy_matches WHERE student_id = ?", (student_id,)) == [(0,)]
+    assert _matches(sql) == _recompute(app_database, sql)
+
+
+def test_refresh_scans_students_only_when_needed(manager, app_database, sql, monkeypatch):
+    _seed(manager, app_database, random.Random(5))
+    scans = []
+    score_all = matching._score_all_students
+    monkeypatch.setattr(matching, '_score_all_students', lambda *args: scans.append(1) or score_all(*args))
+
+    # Оценки студента только растут: топы правятся без обхода всех студентов
+    (student_id,), = sql("SELECT id FROM students ORDER BY gpa LIMIT 1")
+    db_writer.write(app_database, db_writer.statement("UPDATE students SET gpa = 4 WHERE id = ?", (student_id,)))
+    db_writer.write(app_database, lambda cursor: matching.refresh_student(cursor, student_id))
+    assert scans == []
+
+    (vacancy_id,), = sql("SELECT MIN(id) FROM vacancies WHERE is_active = 1")
+    db_writer.write(app_database, lambda cursor: matching.refresh_vacancy(cursor, vacancy_id))
+    assert scans == [1]
+    assert _matches(sql) == _recompute(app_database, sql)
+
+
+def test_failed_refresh_is_logged(manager, app_database, monkeypatch, caplog, storage_mode):
+    def broken(cursor, student_id):
+        raise RuntimeError("сбой подбора")
+
+    monkeypatch.setattr(matching, 'refresh_student', broken)
+    manager.refresh_matches(student_id=1)
+    db_writer.write(app_database, lambda cursor: None)
+    assert "сбой подбора" in caplog.text
@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+import migrations
+import schema
+
+
+def _baseline(database, tables, seed, extra=()):
+    """Файл, который создавал init_database до миграций: таблицы и демо-данные, без schema_version"""
+    conn = sqlite3.connect(database)
+    for statement in tables:
+        conn.execute(statement)
+    seed(conn.cursor())
+    for statement in extra:
+        conn.execute(statement)
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.parametrize('migration_list', [schema.APP_MIGRATIONS, schema.RECRUIT_MIGRATIONS,
+                                            schema.AUTH_MIGRATIONS])
+def test_versions_strictly_increase(migration_list):
+    versions = [migration.version for migration in migration_list]
+    assert versions == list(range(1, len(versions) + 1))
+
+
+def test_fresh_database(database, sql):
+    assert migrations.schema_version(database) == 0
+    target = migrations.migrate(database, schema.APP_MIGRATIONS)
+    assert target == schema.APP_MIGRATIONS[-1].version
+    assert migrations.schema_version(database) == target
+    assert sql("SELECT COUNT(*) FROM schema_version") == [(target,)]
+
+
+def test_upgrade_from_baseline_keeps_data(database, sql, monkeypatch):
+    _baseline(database, schema._APP_TABLES, schema._seed_app, [
+        "INSERT INTO vacancies (company_name, position, specialization, required_course) "
+        "VALUES ('ТОО Старое', 'Бухгалтер', 'Учет и аудит', 2)",
+    ])
+    before = sql("SELECT id, username, password_hash FROM users ORDER BY id")
+
+    migrations.migrate(database, schema.APP_MIGRATIONS)
+    assert migrations.schema_version(database) == schema.APP_MIGRATIONS[-1].version
+    # Сиды второй раз не добавились, строки пользователей не тронуты
+    assert sql("SELECT id, username, password_hash FROM users ORDER BY id") == before
+    assert sql("SELECT COUNT(*) FROM vacancies") == [(4,)]
+    # Производные таблицы заполнены из существующих строк
+    assert sql("SELECT total_students, active_vacancies FROM stats") == [(1, 4)]
+    assert sql("SELECT COUNT(*) FROM vacancies_fts") == [(4,)]
+    assert sql("SELECT COUNT(*) FROM student_skills") == [(3,)]
+
+    # Повтор в новом процессе (кэш версий пуст) ничего не применяет
+    monkeypatch.setattr(migrations, '_applied', {})
+    applied = sql("SELECT version, applied_at FROM schema_version")
+    migrations.migrate(database, schema.APP_MIGRATIONS)
+    assert sql("SELECT version, applied_at FROM schema_version") == applied
+
+
+def test_failed_migration_rolls_back(database, sql):
+    steps = [
+        migrations.Migration(1, 'table', ["CREATE TABLE t (x INTEGER)"]),
+        migrations.Migration(2, 'broken', ["INSERT INTO t VALUES (1)", "INSERT INTO missing VALUES (1)"]),
+    ]
+    with pytest.raises(sqlite3.OperationalError):
+        migrations.migrate(database, steps)
+    assert migrations.schema_version(database) == 1
+    assert sql("SELECT COUNT(*) FROM t") == [(0,)]
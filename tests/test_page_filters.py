@@ -0,0 +1,55 @@
+import pytest
+
+import page_filters
+
+
+def test_unset_filters_are_skipped():
+    filters = (page_filters.equals('course', page_filters.ANY), page_filters.contains('full_name', '  '),
+               page_filters.one_of('course', []), page_filters.at_least('gpa', None))
+    assert page_filters.compile_filters(filters) == ([], [])
+
+
+def test_compiles_to_parameterized_sql():
+    conditions, params = page_filters.compile_filters((
+        page_filters.equals('s.course', 3),
+        page_filters.at_least('gpa', 3.5),
+        page_filters.one_of('specialization', ['Финансы', 'Экономика']),
+        page_filters.contains(('full_name', 'email'), ' ИВАНОВ '),
+    ))
+    assert conditions == [
+        "s.course = ?",
+        "gpa >= ?",
+        "specialization IN (?, ?)",
+        "(instr(py_lower(full_name), ?) > 0 OR instr(py_lower(email), ?) > 0)",
+    ]
+    assert params == [3, 3.5, 'Финансы', 'Экономика', 'иванов', 'иванов']
+
+
+def test_numpy_values_become_python():
+    import numpy as np
+    _, params = page_filters.compile_filters((page_filters.equals('course', np.int64(2)),))
+    assert params == [2] and type(params[0]) is int
+
+
+@pytest.mark.parametrize('column', ["gpa; DROP TABLE students", "a.b.c", "1col"])
+def test_rejects_unsafe_columns(column):
+    with pytest.raises(ValueError):
+        page_filters.compile_filters((page_filters.equals(column, 1),))
+
+
+def test_skills_filter():
+    conditions, params = page_filters.compile_filters((page_filters.has_skills(['SQL', 'SQL', 'Python']),))
+    assert params == ['SQL', 'Python']
+    assert "HAVING COUNT(*) = 2" in conditions[0]
+
+
+def test_filters_run_in_sqlite(manager, sql, storage_mode):
+    # contains() с кириллицей в другом регистре: py_lower() есть и у пула, и у писателя (WAL)
+    filters = (page_filters.contains(('full_name',), 'айкобенов'),)
+    page, _ = manager.get_students_page(filters)
+    assert list(page['full_name']) == [name for (name,) in sql("SELECT full_name FROM students")
+                                       if 'айкобенов' in name.lower()]
+    assert len(page) == 1
+
+    by_spec, _ = manager.get_vacancies_page((page_filters.equals('specialization', 'Финансы'),))
+    assert list(by_spec['company_name']) == ['Halyk Bank']
@@ -0,0 +1,160 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import db_writer
+import query_cache
+from tests.workload import random_writes
+
+
+def _versions(sql):
+    return dict(sql("SELECT name, version FROM table_versions"))
+
+
+def test_table_versions_count_changed_rows(app_database, sql):
+    before = _versions(sql)
+    changed = random_writes(app_database, seed=5)
+    after = _versions(sql)
+    # Триггеры FOR EACH ROW: версия растет на число измененных строк
+    for table in ('students', 'vacancies', 'applications'):
+        assert after[table] - before[table] == changed[table]
+    assert after['users'] == before['users']
+
+
+def test_tables_of_includes_derived():
+    tables = query_cache.tables_of("SELECT * FROM stats s JOIN vacancies v ON 1")
+    assert {'stats', 'vacancies', 'students', 'applications'} <= tables
+
+
+class _Loader:
+    def __init__(self, database, query):
+        self.database, self.query, self.calls = database, query, 0
+
+    def __call__(self):
+        self.calls += 1
+        conn = sqlite3.connect(self.database)
+        try:
+            return pd.read_sql_query(self.query, conn)
+        finally:
+            conn.close()
+
+
+@pytest.fixture
+def cache():
+    return query_cache.QueryCache()
+
+
+def test_cached_until_table_changes(app_database, cache, storage_mode):
+    query = "SELECT id, position FROM vacancies ORDER BY id"
+    loader = _Loader(app_database, query)
+
+    first = cache.get_or_load(app_database, query, (), loader)
+    assert cache.get_or_load(app_database, query, (), loader).equals(first)
+    assert loader.calls == 1
+
+    # Запись в другую таблицу не сбрасывает результат
+    db_writer.write(app_database, db_writer.statement("UPDATE students SET gpa = 3.1"))
+    cache.get_or_load(app_database, query, (), loader)
+    assert loader.calls == 1
+
+    db_writer.write(app_database, db_writer.statement("UPDATE vacancies SET position = 'Новая' WHERE id = 1"))
+    fresh = cache.get_or_load(app_database, query, (), loader)
+    assert loader.calls == 2
+    assert fresh.loc[fresh['id'] == 1, 'position'].item() == 'Новая'
+
+
+def test_write_from_other_connection_invalidates(app_database, cache):
+    query = "SELECT COUNT(*) AS n FROM applications"
+    loader = _Loader(app_database, query)
+    assert cache.get_or_load(app_database, query, (), loader)['n'].item() == 0
+
+    conn = sqlite3.connect(app_database)  # "другой процесс"
+    conn.execute("INSERT INTO applications (student_id, vacancy_id) VALUES (1, 1)")
+    conn.commit()
+    conn.close()
+    assert cache.get_or_load(app_database, query, (), loader)['n'].item() == 1
+    assert loader.calls == 2
+
+
+def test_derived_table_follows_base_table(app_database, cache):
+    query = "SELECT total_applications FROM stats"
+    loader = _Loader(app_database, query)
+    cache.get_or_load(app_database, query, (), loader)
+    db_writer.write(app_database, db_writer.statement(
+        "INSERT INTO applications (student_id, vacancy_id) VALUES (1, 1)"))
+    assert cache.get_or_load(app_database, query, (), loader)['total_applications'].item() == 1
+
+
+def test_returned_frame_is_a_copy(app_database, cache):
+    query = "SELECT id FROM vacancies"
+    loader = _Loader(app_database, query)
+    frame = cache.get_or_load(app_database, query, (), loader)
+    frame['id'] = -1
+    assert (cache.get_or_load(app_database, query, (), loader)['id'] > 0).all()
+
+
+def test_manager_reads_see_manager_writes(manager, storage_mode):
+    before = len(manager.get_all_vacancies())
+    manager.insert_vacancy(('ТОО Новая', 'Аналитик', 'Финансы', 2, '', '', '', 'hr@new.kz', '2099-01-01'))
+    assert len(manager.get_all_vacancies()) == before + 1
+
+
+class _RowLoader:
+    def __init__(self, database, query, params):
+        self.database, self.query, self.params, self.calls = database, query, params, 0
+
+    def __call__(self):
+        self.calls += 1
+        conn = sqlite3.connect(self.database)
+        try:
+            return conn.execute(self.query, self.params).fetchone()
+        finally:
+            conn.close()
+
+
+@pytest.fixture
+def records(cache):
+    return query_cache.RecordCache(cache)
+
+
+def test_record_cached_until_its_table_changes(app_database, records, storage_mode):
+    loader = _RowLoader(app_database, "SELECT position FROM vacancies WHERE id = ?", (1,))
+    first = records.get_or_load(app_database, 'vacancies', 1, loader)
+    assert records.get_or_load(app_database, 'vacancies', 1, loader) is first
+    db_writer.write(app_database, db_writer.statement("UPDATE students SET gpa = 3.2"))
+    records.get_or_load(app_database, 'vacancies', 1, loader)
+    assert loader.calls == 1
+
+    db_writer.write(app_database, db_writer.statement("UPDATE vacancies SET position = 'Ревизор' WHERE id = 1"))
+    assert records.get_or_load(app_database, 'vacancies', 1, loader) == ('Ревизор',)
+    assert loader.calls == 2
+
+
+def test_missing_record_is_reloaded_after_insert(app_database, records):
+    loader = _RowLoader(app_database, "SELECT student_id FROM applications WHERE id = ?", (1,))
+    assert records.get_or_load(app_database, 'applications', 1, loader) is None
+    assert records.get_or_load(app_database, 'applications', 1, loader) is None
+    assert loader.calls == 1
+    db_writer.write(app_database, db_writer.statement(
+        "INSERT INTO applications (id, student_id, vacancy_id) VALUES (1, 1, 1)"))
+    assert records.get_or_load(app_database, 'applications', 1, loader) == (1,)
+
+
+def test_record_cache_evicts_least_recent(app_database, cache):
+    records = query_cache.RecordCache(cache, max_entries=2)
+    loaders = {key: _RowLoader(app_database, "SELECT id FROM vacancies WHERE id = ?", (key,)) for key in (1, 2, 3)}
+    for key in (1, 2, 1, 3):
+        records.get_or_load(app_database, 'vacancies', key, loaders[key])
+    records.get_or_load(app_database, 'vacancies', 1, loaders[1])
+    records.get_or_load(app_database, 'vacancies', 2, loaders[2])
+    assert (loaders[1].calls, loaders[2].calls) == (1, 2)
+
+
+def test_manager_record_follows_writes(manager, storage_mode):
+    vacancy = manager.get_vacancy_by_id(1)
+    assert manager.get_vacancy_by_id(1) is vacancy
+    manager.execute_query("UPDATE vacancies SET salary_range = '500 000' WHERE id = 1")
+    assert manager.get_vacancy_by_id(1)['salary_range'] == '500 000'
+    manager.execute_query("DELETE FROM vacancies WHERE id = 1")
+    assert manager.get_vacancy_by_id(1) is None
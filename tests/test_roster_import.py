@@ -0,0 +1,97 @@
+import io
+import sqlite3
+
+import pytest
+
+import roster_import
+from app_db import SKILL_OPTIONS, SPECIALIZATION_OPTIONS
+
+
+def _csv(*lines, course='2'):
+    rows = ("ФИО;Email;Логин;Специальность;Навыки;Курс",) + tuple(f"{line};{course}" for line in lines)
+    return io.BytesIO("\n".join(rows).encode('utf-8'))
+
+
+def _import(database, file, chunk_size=roster_import.CHUNK_SIZE):
+    return roster_import.import_roster(database, file, 'roster.csv', SPECIALIZATION_OPTIONS, SKILL_OPTIONS,
+                                       chunk_size=chunk_size)
+
+
+def test_cyrillic_logins_differing_in_case_are_duplicates(app_database, sql, storage_mode):
+    report = _import(app_database, _csv("Петров Петр;petrov@keu.kz;Петров;Экономика;",
+                                        "Петров Павел;pavel@keu.kz;пЕТРОВ;Экономика;"))
+    assert report.created == 1
+    assert [error.line for error in report.errors] == [3]
+
+    report = _import(app_database, _csv("Петров Пётр;petr2@keu.kz;ПЕТРОВ;Экономика;"))
+    assert report.created == 0 and "логин уже занят" in report.errors[0].message
+    assert sql("SELECT COUNT(*) FROM users WHERE username_key = 'петров'") == [(1,)]
+
+
+def test_chunked_import_with_duplicates(app_database, sql, storage_mode):
+    file = _csv(
+        "Алиев Аскар;aliev@keu.kz;;Экономика;SQL, python",     # 2
+        "Бекова Дана;bekova@keu.kz;dana;Финансы;",              # 3
+        "Алиев Второй;ALIEV@keu.kz;aliev2;Экономика;",          # 4: email из прошлой порции
+        "Без почты;;;Экономика;",                               # 5: ошибка формата
+        "Дана Другая;dana2@keu.kz;DANA;Финансы;",               # 6: логин в другом регистре
+        "Ведущий Студент;student@keu.edu.kz;new;Финансы;",      # 7: email уже в базе
+        "Гани Ерлан;gani@keu.kz;;Неизвестная;",                 # 8: специальность
+        "Жанна Ким;kim@keu.kz;kim;Менеджмент;Excel",            # 9
+    )
+    report = _import(app_database, file, chunk_size=2)
+    assert report.processed == 8
+    assert report.created == 3
+    assert sorted(error.line for error in report.errors) == [4, 5, 6, 7, 8]
+
+    created = sql("SELECT username, email FROM users WHERE role = 'student' AND username != 'student' "
+                  "ORDER BY username")
+    assert created == [('aliev', 'aliev@keu.kz'), ('dana', 'bekova@keu.kz'), ('kim', 'kim@keu.kz')]
+    assert sql("SELECT COUNT(*) FROM students s JOIN users u ON u.id = s.user_id "
+               "WHERE u.username IN ('aliev', 'dana', 'kim')") == [(3,)]
+    # Навыки приведены к написанию из формы и лежат в связях
+    assert sql('''SELECT sk.name FROM student_skills ss JOIN skills sk ON sk.id = ss.skill_id
+                  JOIN students s ON s.id = ss.student_id WHERE s.email = 'aliev@keu.kz'
+                  ORDER BY sk.name''') == [('Python',), ('SQL',)]
+
+    # Пароли не были заданы - сгенерированы и выданы в отчете
+    lines = report.credentials_csv().splitlines()
+    assert lines[0] == 'username,password' and len(lines) == 4
+
+
+def test_progress_after_each_chunk(app_database):
+    rows = [f"Студент {n};s{n}@keu.kz;;Экономика;" for n in range(5)]
+    seen = []
+    roster_import.import_roster(app_database, _csv(*rows), 'roster.csv', SPECIALIZATION_OPTIONS, SKILL_OPTIONS,
+                                progress=lambda report: seen.append(report.processed), chunk_size=2)
+    assert seen == [2, 4, 5]
+
+
+def test_course_is_required(app_database, sql):
+    report = _import(app_database, _csv("Без курса;nocourse@keu.kz;;Экономика;", course=''))
+    assert report.created == 0
+    assert [(error.line, error.message) for error in report.errors] == [(2, "не указан курс")]
+
+    file = io.BytesIO("ФИО;Email;Специальность\nНет колонки;nocol@keu.kz;Экономика".encode('utf-8'))
+    with pytest.raises(roster_import.RosterError, match="course"):
+        _import(app_database, file)
+
+
+def test_failed_chunk_does_not_stop_import(app_database, sql, storage_mode):
+    conn = sqlite3.connect(app_database)
+    conn.execute('''CREATE TRIGGER fail_students BEFORE INSERT ON students WHEN NEW.full_name = 'Сбой'
+                    BEGIN SELECT RAISE(ABORT, 'запись отклонена'); END''')
+    conn.commit()
+    conn.close()
+
+    rows = [f"Студент {n};s{n}@keu.kz;;Экономика;" for n in range(6)]
+    rows[3] = "Сбой;fail@keu.kz;;Экономика;"  # строка 5, вторая порция - строки 4 и 5
+    report = _import(app_database, _csv(*rows), chunk_size=2)
+
+    assert report.processed == 6 and report.created == 4
+    assert [error.line for error in report.errors] == [4, 5]
+    assert "запись отклонена" in report.errors[0].message
+    # Порция откатилась целиком, соседние записаны, пароли выданы только созданным
+    assert sql("SELECT email FROM users WHERE email IN ('s2@keu.kz', 'fail@keu.kz')") == []
+    assert sql("SELECT COUNT(*) FROM students WHERE full_name LIKE 'Студент %'") == [(4,)]
+    assert len(report.credentials_csv().splitlines()) == 5
@@ -0,0 +1,46 @@
+import queries
+
+
+def _vacancy(company, position, description='Описание', requirements='Требования'):
+    return (company, position, 'Финансы', 2, '', description, requirements, 'hr@example.kz', '2099-01-01')
+
+
+def _found(manager, text):
+    result = manager.search_vacancies(text)
+    return [] if result is None else list(result['company_name'])
+
+
+def test_fts_match_quotes_words():
+    assert queries.fts_match('Учёт AND "1С" -NEAR') == '"учет"* "and"* "1с"* "near"*'
+    assert queries.fts_match(' ?! ') is None
+
+
+def test_yo_is_folded_both_ways(manager, storage_mode):
+    manager.insert_vacancy(_vacancy('ТОО Ёлка', 'Бухгалтер', description='Учёт первичных документов'))
+    manager.insert_vacancy(_vacancy('ТОО Ель', 'Бухгалтер', description='Учет основных средств'))
+    assert set(_found(manager, 'учет')) == {'ТОО Ель', 'ТОО Ёлка'}
+    assert set(_found(manager, 'УЧЁТ')) == {'ТОО Ель', 'ТОО Ёлка'}
+    assert _found(manager, 'елка') == ['ТОО Ёлка']
+
+
+def test_index_follows_updates_and_deletes(manager, sql):
+    manager.insert_vacancy(_vacancy('ТОО Старт', 'Кассир'))
+    (vacancy_id,), = sql("SELECT id FROM vacancies WHERE company_name = 'ТОО Старт'")
+    manager.execute_query("UPDATE vacancies SET position = 'Ревизор' WHERE id = ?", (vacancy_id,))
+    assert _found(manager, 'кассир') == []
+    assert _found(manager, 'ревизор') == ['ТОО Старт']
+    manager.execute_query("DELETE FROM vacancies WHERE id = ?", (vacancy_id,))
+    assert _found(manager, 'ревизор') == []
+
+
+def test_bm25_prefers_position_over_description(manager):
+    # Слово в должности (вес 10) важнее того же слова в описании (вес 1)
+    manager.insert_vacancy(_vacancy('В описании', 'Специалист', description='Нужен аудитор с опытом'))
+    manager.insert_vacancy(_vacancy('В должности', 'Аудитор', description='Нужен специалист с опытом'))
+    assert _found(manager, 'аудитор') == ['В должности', 'В описании']
+
+
+def test_snippet_marks_matches(manager):
+    manager.insert_vacancy(_vacancy('ТОО Метка', 'Логист', description='Планирование поставок'))
+    result = manager.search_vacancies('поставок')
+    assert '\x02поставок\x03' in result['snippet'].iloc[0]
@@ -0,0 +1,58 @@
+import skills
+
+
+def _recruit_student(name, languages):
+    # full_name, course, specialization, programming_languages, work_experience, portfolio_link,
+    # contact_number, document_id, email, gpa, graduation_year, is_active
+    return (name, 3, 'Финансы', languages, '', '', '', f'doc-{name}', f'{name}@keu.kz', 3.5, 2026, 1)
+
+
+def _skills_of(sql, student_id):
+    return [name for (name,) in sql('''
+        SELECT sk.name FROM student_skills ss JOIN skills sk ON sk.id = ss.skill_id
+        WHERE ss.student_id = ? ORDER BY sk.name''', (student_id,))]
+
+
+def test_parse_skills():
+    assert skills.parse_skills(" SQL, 1С,,SQL , Excel") == ['SQL', '1С', 'Excel']
+    assert skills.parse_skills(None) == []
+
+
+def test_insert_and_update_sync_junction(recruit_manager, sql, storage_mode):
+    assert recruit_manager.insert_student(_recruit_student('ivan', 'Python, SQL'))
+    (student_id,), = sql("SELECT id FROM students WHERE full_name = 'ivan'")
+    assert _skills_of(sql, student_id) == ['Python', 'SQL']
+
+    assert recruit_manager.update_student(student_id, _recruit_student('ivan', 'SQL, Новый навык'))
+    assert _skills_of(sql, student_id) == ['SQL', 'Новый навык']
+    # Строка для отображения и связи пишутся вместе
+    assert sql("SELECT programming_languages FROM students WHERE id = ?", (student_id,)) == [('SQL, Новый навык',)]
+
+
+def test_update_missing_student_leaves_no_links(recruit_manager, sql, storage_mode):
+    missing = sql("SELECT COALESCE(MAX(id), 0) + 100 FROM students")[0][0]
+    before = sql("SELECT COUNT(*) FROM student_skills")
+    assert recruit_manager.update_student(missing, _recruit_student('ghost', 'Python')) is False
+    assert _skills_of(sql, missing) == []
+    assert sql("SELECT COUNT(*) FROM student_skills") == before
+
+
+def test_delete_removes_links(recruit_manager, sql):
+    recruit_manager.insert_student(_recruit_student('olga', 'Excel'))
+    (student_id,), = sql("SELECT id FROM students WHERE full_name = 'olga'")
+    assert recruit_manager.delete_student(student_id)
+    assert _skills_of(sql, student_id) == []
+
+
+def test_skills_filter_matches_text_column(recruit_manager, sql):
+    recruit_manager.insert_student(_recruit_student('anna', 'Python, SQL'))
+    recruit_manager.insert_student(_recruit_student('boris', 'Python'))
+    wanted = {'Python', 'SQL'}
+    rows = [(name, set(skills.parse_skills(text))) for name, text
+            in sql("SELECT full_name, programming_languages FROM students")]
+
+    both = recruit_manager.find_students_by_skills(sorted(wanted))
+    either = recruit_manager.find_students_by_skills(sorted(wanted), match_all=False)
+    assert set(both['full_name']) == {name for name, known in rows if wanted <= known}
+    assert set(either['full_name']) == {name for name, known in rows if wanted & known}
+    assert 'anna' in set(both['full_name']) and 'boris' not in set(both['full_name'])
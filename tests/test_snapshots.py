@@ -0,0 +1,134 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+import snapshots
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+@pytest.fixture
+def out_dir(tmp_path):
+    return str(tmp_path / "snapshots")
+
+
+def _add_students(database, months):
+    conn = sqlite3.connect(database)
+    conn.executemany(
+        "INSERT INTO students (full_name, course, specialization, gpa, registration_date) "
+        "VALUES (?, 2, 'Финансы', 3.5, ?)",
+        [(f"Студент {month} {n}", f"{month}-1{n} 10:00:00") for month in months for n in range(3)])
+    conn.commit()
+    conn.close()
+
+
+def _root(database, out_dir):
+    return os.path.join(out_dir, os.path.splitext(os.path.basename(database))[0])
+
+
+def _manifest(database, out_dir):
+    with open(os.path.join(_root(database, out_dir), snapshots.MANIFEST_NAME), encoding='utf-8') as f:
+        return json.load(f)['tables']
+
+
+def _partition(database, out_dir, table, month):
+    return os.path.join(_root(database, out_dir), snapshots._partition_path(table, month))
+
+
+def test_partitions_hold_all_rows(app_database, out_dir, sql):
+    _add_students(app_database, ['2026-01', '2026-02'])
+    written = snapshots.snapshot_database(app_database, out_dir)
+    manifest = _manifest(app_database, out_dir)
+    assert written['students'] == len(manifest['students']['partitions']) >= 2
+
+    names = []
+    for month in manifest['students']['partitions']:
+        names += pq.read_table(_partition(app_database, out_dir, 'students', month)).column('full_name').to_pylist()
+    assert sorted(names) == sorted(name for (name,) in sql("SELECT full_name FROM students"))
+    assert manifest['students']['rows'] == len(names)
+
+
+def test_password_hash_is_never_exported(app_database, out_dir):
+    snapshots.snapshot_database(app_database, out_dir)
+    columns = [name for name, _ in _manifest(app_database, out_dir)['users']['columns']]
+    assert 'password_hash' not in columns and 'username' in columns
+    for month in _manifest(app_database, out_dir)['users']['partitions']:
+        table = pq.read_table(_partition(app_database, out_dir, 'users', month))
+        assert 'password_hash' not in table.column_names
+
+
+def test_unchanged_tables_are_skipped(app_database, out_dir, monkeypatch):
+    _add_students(app_database, ['2026-01'])
+    snapshots.snapshot_database(app_database, out_dir)
+
+    scanned = []
+    rows = snapshots._rows
+    monkeypatch.setattr(snapshots, '_rows', lambda conn, query, chunk_size: scanned.append(query)
+                        or rows(conn, query, chunk_size))
+    written = snapshots.snapshot_database(app_database, out_dir)
+    # Та же версия и то же число строк: таблицы даже не читаются
+    assert set(written.values()) == {0}
+    assert scanned == []
+
+
+def test_only_changed_month_is_rewritten(app_database, out_dir):
+    _add_students(app_database, ['2026-01', '2026-02', '2026-03'])
+    snapshots.snapshot_database(app_database, out_dir)
+    before = _manifest(app_database, out_dir)['students']['partitions']
+
+    conn = sqlite3.connect(app_database)
+    conn.execute("UPDATE students SET gpa = 4.0 WHERE full_name = 'Студент 2026-02 1'")
+    conn.commit()
+    conn.close()
+    written = snapshots.snapshot_database(app_database, out_dir)
+    after = _manifest(app_database, out_dir)['students']['partitions']
+
+    assert written['students'] == 1
+    assert [month for month in after if after[month]['sha256'] != before[month]['sha256']] == ['2026-02']
+    gpa = pq.read_table(_partition(app_database, out_dir, 'students', '2026-02')).column('gpa').to_pylist()
+    assert sorted(gpa) == [3.5, 3.5, 4.0]
+
+
+def test_vanished_month_is_removed(app_database, out_dir):
+    _add_students(app_database, ['2026-01', '2026-02'])
+    snapshots.snapshot_database(app_database, out_dir)
+    path = _partition(app_database, out_dir, 'students', '2026-01')
+    assert os.path.exists(path)
+
+    conn = sqlite3.connect(app_database)
+    conn.execute("DELETE FROM students WHERE registration_date LIKE '2026-01-%'")
+    conn.commit()
+    conn.close()
+    snapshots.snapshot_database(app_database, out_dir)
+    assert not os.path.exists(os.path.dirname(path))
+    assert '2026-01' not in _manifest(app_database, out_dir)['students']['partitions']
+    assert os.path.exists(_partition(app_database, out_dir, 'students', '2026-02'))
+
+
+def test_failed_write_leaves_previous_snapshot(app_database, out_dir, monkeypatch):
+    _add_students(app_database, ['2026-01', '2026-02'])
+    snapshots.snapshot_database(app_database, out_dir)
+    manifest = _manifest(app_database, out_dir)
+    path = _partition(app_database, out_dir, 'students', '2026-02')
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    conn = sqlite3.connect(app_database)
+    conn.execute("UPDATE students SET gpa = 2.0")
+    conn.commit()
+    conn.close()
+
+    def broken(self, row):
+        raise RuntimeError("диск заполнен")
+
+    monkeypatch.setattr(snapshots._PartitionWriter, 'add', broken)
+    with pytest.raises(RuntimeError):
+        snapshots.snapshot_database(app_database, out_dir)
+
+    leftovers = [name for _, _, files in os.walk(out_dir) for name in files if name.endswith('.tmp')]
+    assert leftovers == []
+    with open(path, 'rb') as f:
+        assert f.read() == data
+    assert _manifest(app_database, out_dir) == manifest
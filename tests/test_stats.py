@@ -0,0 +1,84 @@
+import sqlite3
+
+import pytest
+
+from tests.workload import random_writes
+
+RECOMPUTE = '''
+    SELECT
+        (SELECT COUNT(*) FROM students),
+        (SELECT COUNT(*) FROM students WHERE is_active = 1),
+        (SELECT COUNT(*) FROM vacancies WHERE is_active = 1),
+        (SELECT COUNT(*) FROM applications),
+        (SELECT COUNT(*) FROM applications WHERE status = 'accepted'),
+        (SELECT COUNT(*) FROM applications WHERE status = 'pending'),
+        (SELECT ROUND(COALESCE(SUM(gpa), 0), 6) FROM students),
+        (SELECT COUNT(gpa) FROM students)
+'''
+
+MAINTAINED = '''
+    SELECT total_students, active_students, active_vacancies, total_applications,
+           accepted_applications, pending_applications, ROUND(gpa_sum, 6), gpa_count
+    FROM stats
+'''
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_stats_row_matches_recompute(app_database, sql, seed):
+    random_writes(app_database, seed=seed)
+    assert sql(MAINTAINED) == sql(RECOMPUTE)
+
+
+def test_get_statistics_reads_stats_row(manager, app_database, sql):
+    random_writes(app_database)
+    stats = manager.get_statistics()
+    total, active, vacancies, applications, accepted, pending, _, _ = sql(RECOMPUTE)[0]
+    assert (stats['total_students'], stats['active_students'], stats['active_vacancies'],
+            stats['total_applications']) == (total, active, vacancies, applications)
+
+
+DAILY_RECOMPUTE = '''
+    SELECT COALESCE(date(a.application_date), ''), COALESCE(a.status, ''),
+           COALESCE(v.specialization, ''), COALESCE(v.company_name, ''), COUNT(*)
+    FROM applications a
+    LEFT JOIN vacancies v ON v.id = a.vacancy_id
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4
+'''
+
+DAILY_MAINTAINED = '''
+    SELECT day, status, specialization, company_name, applications
+    FROM daily_application_stats
+    ORDER BY 1, 2, 3, 4
+'''
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_daily_stats_match_recompute(app_database, sql, seed):
+    # Workload вставляет и вакансии с id, на который уже есть отклики
+    random_writes(app_database, seed=seed)
+    assert sql(DAILY_MAINTAINED) == sql(DAILY_RECOMPUTE)
+    assert sql("SELECT COUNT(*) FROM daily_application_stats WHERE applications = 0") == [(0,)]
+
+
+def test_application_series_sums_daily_rows(manager, app_database, sql):
+    random_writes(app_database)
+    start, end = manager.get_applications_day_range()
+    monthly = manager.get_application_series(start, end, 'month', 'status')
+    expected = sql("SELECT strftime('%Y-%m-01', application_date), COALESCE(status, ''), COUNT(*) "
+                   "FROM applications WHERE application_date IS NOT NULL GROUP BY 1, 2 ORDER BY 1, 2")
+    assert sorted(monthly.itertuples(index=False, name=None)) == expected
+
+
+def test_chart_groups_skip_null(manager, app_database, sql):
+    conn = sqlite3.connect(app_database)
+    conn.execute("INSERT INTO vacancies (company_name, position, specialization, is_active) "
+                 "VALUES ('ТОО Без специальности', 'Стажер', NULL, 1)")
+    conn.execute("INSERT INTO applications (student_id, vacancy_id, status) VALUES (1, 1, NULL)")
+    conn.commit()
+    conn.close()
+    by_specialization = manager.get_vacancies_by_specialization()
+    assert None not in by_specialization
+    assert sum(by_specialization.values()) == sql(
+        "SELECT COUNT(*) FROM vacancies WHERE is_active = 1 AND specialization IS NOT NULL")[0][0]
+    assert None not in manager.get_applications_by_status()
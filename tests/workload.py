@@ -0,0 +1,77 @@
+import random
+import sqlite3
+from collections import Counter
+
+# Случайная смесь вставок, изменений и удалений в students, vacancies и
+# applications напрямую через sqlite3 - так же, как их видят триггеры.
+SPECIALIZATIONS = ['Экономика', 'Финансы', 'Менеджмент', None]
+COMPANIES = ['Kaspi Bank', 'Halyk Bank', 'Kazpost']
+STATUSES = ['pending', 'accepted', 'rejected', None]
+
+
+def _any_id(cursor, rng, table, missing=False):
+    ids = [row[0] for row in cursor.execute(f"SELECT id FROM {table}")]
+    if missing or not ids:
+        return 10 ** 6 + rng.randint(0, 100)  # строка, которой нет
+    return rng.choice(ids)
+
+
+def _date(rng):
+    return f"2026-0{rng.randint(1, 3)}-{rng.randint(10, 28)} {rng.randint(10, 23)}:00:00"
+
+
+def _operations(cursor, rng):
+    def gpa():
+        return rng.choice([None, round(rng.uniform(2, 4), 2)])
+
+    return [
+        ('students', "INSERT INTO students (full_name, course, specialization, gpa, is_active) "
+                     "VALUES ('Студент', 2, 'Экономика', ?, ?)", lambda: (gpa(), rng.randint(0, 1))),
+        ('students', "UPDATE students SET gpa = ?, is_active = ? WHERE id = ?",
+         lambda: (gpa(), rng.choice([0, 1, None]), _any_id(cursor, rng, 'students'))),
+        ('students', "DELETE FROM students WHERE id = ?", lambda: (_any_id(cursor, rng, 'students'),)),
+        ('vacancies', "INSERT INTO vacancies (id, company_name, position, specialization, is_active) "
+                      "VALUES (?, ?, 'Стажер', ?, ?)",
+         lambda: (rng.choice([None, None, _any_id(cursor, rng, 'vacancies', missing=True)]),
+                  rng.choice(COMPANIES), rng.choice(SPECIALIZATIONS), rng.randint(0, 1))),
+        ('vacancies', "UPDATE vacancies SET specialization = ?, company_name = ?, is_active = ? WHERE id = ?",
+         lambda: (rng.choice(SPECIALIZATIONS), rng.choice(COMPANIES), rng.randint(0, 1),
+                  _any_id(cursor, rng, 'vacancies'))),
+        ('vacancies', "DELETE FROM vacancies WHERE id = ?", lambda: (_any_id(cursor, rng, 'vacancies'),)),
+        ('applications', "INSERT INTO applications (student_id, vacancy_id, status, application_date) "
+                         "VALUES (?, ?, ?, ?)",
+         lambda: (_any_id(cursor, rng, 'students'),
+                  _any_id(cursor, rng, 'vacancies', missing=rng.random() < 0.2),
+                  rng.choice(STATUSES), _date(rng))),
+        ('applications', "UPDATE applications SET status = ?, application_date = ?, vacancy_id = ? WHERE id = ?",
+         lambda: (rng.choice(STATUSES), _date(rng), _any_id(cursor, rng, 'vacancies'),
+                  _any_id(cursor, rng, 'applications'))),
+        ('applications', "UPDATE applications SET status = ? WHERE status IS ?",
+         lambda: (rng.choice(STATUSES), rng.choice(STATUSES))),
+        ('applications', "DELETE FROM applications WHERE id = ?", lambda: (_any_id(cursor, rng, 'applications'),)),
+    ]
+
+
+def random_writes(database, steps=300, seed=1):
+    """Выполняет steps случайных записей; вернет число измененных строк по таблицам"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(database)
+    cursor = conn.cursor()
+    operations = _operations(cursor, rng)
+    # Вставки чаще удалений, чтобы таблицы росли
+    weights = [4, 2, 1, 3, 2, 1, 6, 3, 1, 1]
+    changed = Counter()
+    try:
+        for _ in range(steps):
+            table, query, params = rng.choices(operations, weights)[0]
+            try:
+                cursor.execute(query, params())
+            except sqlite3.IntegrityError:
+                continue  # id "несуществующей" вакансии уже занят
+            changed[table] += cursor.rowcount
+            if rng.random() < 0.3:
+                conn.commit()
+        conn.commit()
+    finally:
+        conn.close()
+    return changed
@@ -0,0 +1,315 @@
+import streamlit as st
+
+# ========== УЛУЧШЕННАЯ ПЕРСИКОВАЯ ТЕМА ==========
+# CSS - константа модуля: строка собирается один раз при импорте, на
+# каждом перезапуске в страницу уходит готовый текст
+PEACH_THEME_CSS = """
+    <style>
+    /* УЛУЧШЕННАЯ ПЕРСИКОВО-БЕЖЕВАЯ ТЕМА */
+    :root {
+        --peach-primary: #FFA07A;
+        --peach-light: #FFE4B5;
+        --peach-dark: #D2691E;
+        --peach-gradient: linear-gradient(135deg, #FFA07A 0%, #FF8C69 50%, #FF7F50 100%);
+        --beige-light: #F5F5DC;
+        --beige-medium: #E6D5B8;
+        --beige-dark: #D2B48C;
+        --text-dark: #5D4037;
+        --text-light: #8D6E63;
+        --success: #4CAF50;
+        --warning: #FF9800;
+        --danger: #F44336;
+        --card-bg: rgba(255, 255, 255, 0.95);
+        --shadow-glow: 0 0 15px rgba(255, 160, 122, 0.3);
+    }
+
+    * {
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    /* Главный контейнер */
+    [data-testid="stAppViewContainer"] {
+        background: linear-gradient(135deg, var(--beige-light) 0%, var(--peach-light) 100%) !important;
+        color: var(--text-dark) !important;
+        animation: backgroundShift 20s ease infinite alternate;
+        background-size: 200% 200%;
+    }
+
+    @keyframes backgroundShift {
+        0% { background-position: 0% 50%; }
+        100% { background-position: 100% 50%; }
+    }
+
+    /* Заголовки */
+    h1, h2, h3, h4, h5, h6 {
+        color: var(--peach-dark) !important;
+        font-weight: 600 !important;
+        position: relative;
+    }
+
+    h1::after, h2::after {
+        content: '';
+        position: absolute;
+        bottom: -5px;
+        left: 0;
+        width: 60px;
+        height: 3px;
+        background: var(--peach-gradient);
+        border-radius: 2px;
+    }
+
+    /* Заголовок главный */
+    .main-header {
+        background: linear-gradient(135deg, var(--peach-primary) 0%, var(--peach-dark) 100%);
+        color: white !important;
+        padding: 2rem;
+        margin-bottom: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        box-shadow: 0 4px 20px rgba(210, 105, 30, 0.3);
+        animation: pulse 3s infinite alternate;
+        border: 2px solid rgba(255, 255, 255, 0.1);
+    }
+
+    @keyframes pulse {
+        0% { box-shadow: 0 4px 20px rgba(210, 105, 30, 0.3); }
+        100% { box-shadow: 0 4px 30px rgba(210, 105, 30, 0.5); }
+    }
+
+    .main-header h1 {
+        color: white !important;
+        font-size: 2.8rem;
+        margin: 0;
+        text-shadow: 1px 1px 3px rgba(0, 0, 0, 0.2);
+        animation: glow 2s infinite alternate;
+    }
+
+    @keyframes glow {
+        from { text-shadow: 0 0 10px rgba(255, 255, 255, 0.5); }
+        to { text-shadow: 0 0 20px rgba(255, 255, 255, 0.8); }
+    }
+
+    /* Карточки */
+    .content-card {
+        background: var(--card-bg) !important;
+        border: 1px solid var(--beige-dark) !important;
+        border-radius: 12px !important;
+        padding: 1.5rem !important;
+        margin-bottom: 1.5rem !important;
+        box-shadow: var(--shadow-glow) !important;
+        backdrop-filter: blur(5px);
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+    }
+
+    .content-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 8px 25px rgba(255, 160, 122, 0.4) !important;
+    }
+
+    .metric-card {
+        background: linear-gradient(135deg, var(--card-bg) 0%, rgba(255, 255, 255, 0.98) 100%);
+        border: 2px solid var(--peach-primary) !important;
+        border-radius: 12px;
+        padding: 1.5rem;
+        text-align: center;
+        box-shadow: 0 4px 15px rgba(255, 160, 122, 0.3);
+        transition: all 0.3s ease;
+    }
+
+    .metric-card:hover {
+        transform: scale(1.05);
+        box-shadow: 0 6px 20px rgba(255, 160, 122, 0.5);
+    }
+
+    /* Кнопки */
+    .stButton > button {
+        border-radius: 8px !important;
+        padding: 10px 24px !important;
+        font-weight: 600 !important;
+        font-size: 14px !important;
+        transition: all 0.3s ease !important;
+        border: none !important;
+        position: relative;
+        overflow: hidden;
+    }
+
+    .stButton > button::after {
+        content: '';
+        position: absolute;
+        top: 50%;
+        left: 50%;
+        width: 5px;
+        height: 5px;
+        background: rgba(255, 255, 255, 0.5);
+        opacity: 0;
+        border-radius: 100%;
+        transform: scale(1, 1) translate(-50%);
+        transform-origin: 50% 50%;
+    }
+
+    .stButton > button:focus:not(:active)::after {
+        animation: ripple 1s ease-out;
+    }
+
+    @keyframes ripple {
+        0% { transform: scale(0, 0); opacity: 0.5; }
+        100% { transform: scale(20, 20); opacity: 0; }
+    }
+
+    .student-button {
+        background: linear-gradient(135deg, var(--peach-primary) 0%, #FF8C69 100%) !important;
+        color: white !important;
+        box-shadow: 0 3px 10px rgba(255, 160, 122, 0.3) !important;
+    }
+
+    .student-button:hover {
+        transform: translateY(-2px) !important;
+        box-shadow: 0 5px 20px rgba(255, 140, 105, 0.5) !important;
+        background: linear-gradient(135deg, #FF8C69 0%, var(--peach-primary) 100%) !important;
+    }
+
+    .admin-button {
+        background: linear-gradient(135deg, #6A5ACD 0%, #483D8B 100%) !important;
+        color: white !important;
+        box-shadow: 0 3px 10px rgba(106, 90, 205, 0.3) !important;
+    }
+
+    .admin-button:hover {
+        transform: translateY(-2px) !important;
+        box-shadow: 0 5px 20px rgba(72, 61, 139, 0.5) !important;
+        background: linear-gradient(135deg, #483D8B 0%, #6A5ACD 100%) !important;
+    }
+
+    /* Кнопка назад */
+    .back-button {
+        background: white !important;
+        border: 2px solid var(--peach-primary) !important;
+        color: var(--peach-primary) !important;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1) !important;
+    }
+
+    .back-button:hover {
+        background: linear-gradient(135deg, var(--peach-light) 0%, white 100%) !important;
+        border-color: var(--peach-dark) !important;
+        color: var(--peach-dark) !important;
+        transform: translateX(-5px) !important;
+    }
+
+    /* Сайдбар */
+    section[data-testid="stSidebar"] {
+        background: linear-gradient(180deg, var(--beige-light) 0%, #FAF0E6 100%) !important;
+        border-right: 3px solid var(--peach-primary) !important;
+    }
+
+    [data-testid="stSidebar"] .stButton > button {
+        width: 100% !important;
+        margin-bottom: 10px !important;
+        border-radius: 8px !important;
+        padding: 12px !important;
+        text-align: left !important;
+        background: white !important;
+        border: 1px solid var(--beige-dark) !important;
+        color: var(--text-dark) !important;
+        transition: all 0.3s ease !important;
+    }
+
+    [data-testid="stSidebar"] .stButton > button:hover {
+        background: linear-gradient(135deg, var(--peach-primary) 0%, #FF8C69 100%) !important;
+        color: white !important;
+        border-color: var(--peach-primary) !important;
+        transform: translateX(5px) !important;
+        padding-left: 20px !important;
+    }
+
+    /* Таблицы */
+    .dataframe {
+        background: white !important;
+        border: 1px solid var(--beige-dark) !important;
+        border-radius: 10px !important;
+        overflow: hidden !important;
+        box-shadow: 0 3px 10px rgba(0, 0, 0, 0.08);
+    }
+
+    .dataframe th {
+        background: var(--peach-gradient) !important;
+        color: white !important;
+        font-weight: 600 !important;
+        border: none !important;
+        padding: 12px !important;
+    }
+
+    .dataframe td {
+        color: var(--text-dark) !important;
+        border-color: var(--beige-medium) !important;
+        padding: 10px !important;
+    }
+
+    .dataframe tr:hover {
+        background: rgba(255, 160, 122, 0.1) !important;
+    }
+
+    /* Логотип в сайдбаре */
+    .logo-container {
+        text-align: center;
+        padding: 25px 0;
+        border-bottom: 2px solid var(--peach-primary);
+        margin-bottom: 25px;
+        background: white;
+        border-radius: 0 0 15px 15px;
+        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+    }
+
+    /* Центрирование на странице входа */
+    .login-center {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        min-height: 70vh;
+    }
+
+    /* Улучшенные статусные бейджи */
+    .status-badge {
+        padding: 6px 16px;
+        border-radius: 20px;
+        font-size: 0.85rem;
+        font-weight: 600;
+        display: inline-block;
+        transition: all 0.3s ease;
+    }
+
+    .status-badge:hover {
+        transform: scale(1.05);
+    }
+
+    .status-pending { 
+        background: linear-gradient(135deg, rgba(255, 152, 0, 0.15) 0%, rgba(255, 152, 0, 0.3) 100%); 
+        color: var(--warning); 
+        border: 1px solid var(--warning); 
+    }
+
+    .status-accepted { 
+        background: linear-gradient(135deg, rgba(76, 175, 80, 0.15) 0%, rgba(76, 175, 80, 0.3) 100%); 
+        color: var(--success); 
+        border: 1px solid var(--success); 
+    }
+
+    .status-rejected { 
+        background: linear-gradient(135deg, rgba(244, 67, 54, 0.15) 0%, rgba(244, 67, 54, 0.3) 100%); 
+        color: var(--danger); 
+        border: 1px solid var(--danger); 
+    }
+
+    /* Стили для расширенной таблицы */
+    .full-table-container {
+        background: white;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
+        margin-top: 20px;
+    }
+    </style>
+    """
+
+
+def apply_peach_theme():
+    st.markdown(PEACH_THEME_CSS, unsafe_allow_html=True)
@@ -0,0 +1,41 @@
+import importlib
+
+# ========== СТРАНИЦЫ ==========
+# Страница -> (модуль, функция). Модуль импортируется при первом открытии
+# страницы и дальше берется из sys.modules: главный скрипт app.py на
+# каждом перезапуске выполняет только маршрутизацию. Тяжелые зависимости
+# (plotly, pyarrow, openpyxl) импортируют только модули своих страниц.
+LOGIN_PAGE = ('views.login', 'login_page')
+
+STUDENT_PAGES = {
+    'dashboard': ('views.student', 'student_dashboard'),
+    'profile': ('views.student', 'student_profile'),
+    'vacancies': ('views.student', 'student_vacancies'),
+    'apply_vacancy': ('views.student', 'student_apply_vacancy'),
+    'my_applications': ('views.student', 'student_my_applications'),
+    'stats': ('views.student', 'student_stats'),
+}
+
+ADMIN_PAGES = {
+    'dashboard': ('views.admin', 'admin_dashboard'),
+    'students': ('views.admin', 'admin_students'),
+    'students_detailed': ('views.admin', 'admin_students_detailed'),
+    'vacancies': ('views.admin', 'admin_vacancies'),
+    'add_vacancy': ('views.admin', 'admin_add_vacancy'),
+    'applications': ('views.admin', 'admin_applications'),
+    'shortlist': ('views.admin', 'admin_shortlist'),
+    'import_students': ('views.admin_import', 'admin_import_students'),
+    'analytics': ('views.analytics', 'admin_analytics'),
+}
+
+
+def load(page):
+    """Функция страницы по паре (модуль, функция)"""
+    module, name = page
+    return getattr(importlib.import_module(module), name)
+
+
+def page_handler(role, page):
+    """Обработчик страницы page для роли; неизвестная страница - главная"""
+    pages = STUDENT_PAGES if role == 'student' else ADMIN_PAGES
+    return load(pages.get(page, pages['dashboard']))
@@ -0,0 +1,601 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import cards
+import exports
+import matching
+import page_filters
+import queries
+from app_db import COURSE_OPTIONS, SPECIALIZATION_OPTIONS
+from components import (create_header, metric_card, back_button, page_cursor, pagination_controls,
+                        plain_snippet)
+
+# ========== СТРАНИЦЫ АДМИНА ==========
+def admin_dashboard():
+    create_header()
+
+    db = st.session_state.db_manager
+
+    try:
+        stats = db.get_statistics()
+
+        st.markdown(f"""
+        <div class="content-card">
+            <h2>👨‍💼 Панель администратора</h2>
+            <p>Добро пожаловать в систему управления карьерным центром КЭУ</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Основные метрики
+        st.subheader("📊 Ключевые показатели")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            metric_card("Всего студентов", stats['total_students'], "👨‍🎓")
+        with col2:
+            metric_card("Активных", stats['active_students'], "🔍")
+        with col3:
+            metric_card("Вакансий", stats['active_vacancies'], "💼")
+        with col4:
+            metric_card("Откликов", stats['total_applications'], "📨")
+
+        # Быстрые действия
+        st.subheader("⚡ Быстрые действия")
+
+        col_actions1, col_actions2, col_actions3, col_actions4 = st.columns(4)
+        with col_actions1:
+            if st.button("➕ Новая вакансия", key="admin_new_vacancy", use_container_width=True):
+                st.session_state.page = 'add_vacancy'
+                st.rerun()
+        with col_actions2:
+            if st.button("👨‍🎓 Все студенты", key="admin_all_students", use_container_width=True):
+                st.session_state.page = 'students'
+                st.rerun()
+        with col_actions3:
+            if st.button("📨 Все отклики", key="admin_all_apps", use_container_width=True):
+                st.session_state.page = 'applications'
+                st.rerun()
+        with col_actions4:
+            if st.button("📊 Аналитика", key="admin_analytics", use_container_width=True):
+                st.session_state.page = 'analytics'
+                st.rerun()
+
+        # Последние отклики (ИСПРАВЛЕННАЯ ЛОГИКА)
+        st.subheader("🔄 Последние отклики")
+
+        applications = db.get_recent_applications(10)
+
+        if not applications.empty:
+            # Выбор внутри формы не перезапускает скрипт: одно действие на все выбранные
+            review_form = st.form("quick_review_form")
+            rows = application_rows(applications)
+            cards.show_cards(cards.RECENT_APPLICATION_CARD, rows, container=review_form)
+            pending = {row['app_id']: row for row in rows if row['status'] == 'pending'}
+            selected = review_form.multiselect("Ожидающие отклики для обработки", list(pending),
+                                               format_func=lambda app_id: application_label(pending[app_id]),
+                                               key="quick_review_selected")
+
+            col_acc, col_rej, col_empty = review_form.columns([1, 1, 2])
+            with col_acc:
+                accept = st.form_submit_button("✅ Принять выбранные", use_container_width=True)
+            with col_rej:
+                reject = st.form_submit_button("❌ Отклонить выбранные", use_container_width=True)
+
+            if accept or reject:
+                if selected:
+                    changed = db.update_application_statuses(selected, 'accepted' if accept else 'rejected')
+                    st.success(f"Обновлено откликов: {changed}")
+                    st.rerun()
+                else:
+                    st.warning("Выберите ожидающие отклики")
+        else:
+            st.info("Пока нет откликов")
+
+    except Exception as e:
+        st.error(f"Ошибка отображения дашборда: {str(e)}")
+
+
+def admin_students():
+    st.header("👨‍🎓 Управление студентами")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        stats = db.get_statistics()
+
+        if stats['total_students'] > 0:
+            # Поиск и фильтры
+            col_filter1, col_filter2, col_filter3 = st.columns(3)
+            with col_filter1:
+                search_name = st.text_input("Поиск по ФИО", key="admin_search_name")
+            with col_filter2:
+                search_course = st.selectbox("Курс", ["Все"] + COURSE_OPTIONS, key="admin_search_course")
+            with col_filter3:
+                search_spec = st.selectbox("Специальность", ["Все"] + SPECIALIZATION_OPTIONS, key="admin_search_spec")
+
+            filters = page_filters.student_filters(search_name, search_course, search_spec)
+            students, next_cursor = db.get_students_page(filters, after=page_cursor('admin_students', filters))
+
+            # Таблица студентов
+            display_df = students[
+                ['full_name', 'course', 'specialization', 'gpa', 'is_active', 'email', 'contact_number']].copy()
+            display_df['is_active'] = display_df['is_active'].apply(lambda x: '✅' if x == 1 else '❌')
+
+            st.dataframe(
+                display_df.rename(columns={
+                    'full_name': 'ФИО',
+                    'course': 'Курс',
+                    'specialization': 'Специальность',
+                    'gpa': 'GPA',
+                    'is_active': 'Активен',
+                    'email': 'Email',
+                    'contact_number': 'Телефон'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+            pagination_controls('admin_students', next_cursor)
+
+            # Статистика по всей таблице, а не по странице
+            st.subheader("📊 Статистика студентов")
+
+            col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+            with col_stat1:
+                st.metric("Всего студентов", int(stats['total_students']))
+            with col_stat2:
+                st.metric("Активно ищут", int(stats['active_students']))
+            with col_stat3:
+                avg_gpa = stats['avg_gpa'] if pd.notna(stats['avg_gpa']) else 0
+                st.metric("Средний GPA", f"{avg_gpa:.2f}")
+            with col_stat4:
+                most_popular = db.get_top_specialization() or "Нет данных"
+                st.metric("Популярная спец.", most_popular)
+
+        else:
+            st.info("Пока нет зарегистрированных студентов")
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def admin_students_detailed():
+    st.header("👨‍🎓 Детальная таблица студентов")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        stats = db.get_statistics()
+
+        if stats['total_students'] > 0:
+            st.markdown('<div class="full-table-container">', unsafe_allow_html=True)
+
+            # Поиск и фильтры
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                search_name = st.text_input("🔍 Поиск по ФИО", key="detailed_search_name")
+            with col2:
+                search_course = st.selectbox("🎓 Курс", ["Все"] + COURSE_OPTIONS, key="detailed_search_course")
+            with col3:
+                search_spec = st.selectbox("🎯 Специальность", ["Все"] + SPECIALIZATION_OPTIONS,
+                                           key="detailed_search_spec")
+            search_profile = st.text_input("🔎 Поиск по профилю", placeholder="Навыки, опыт работы...",
+                                           key="detailed_search_profile")
+            col_skills, col_mode = st.columns([3, 1])
+            with col_skills:
+                search_skills = st.multiselect("🧩 Навыки", db.get_skill_names(), key="detailed_search_skills")
+            with col_mode:
+                skills_mode = st.radio("Совпадение", ["Все навыки", "Любой из"], key="detailed_skills_mode")
+
+            # Фильтры выполняются в SQL, строк не больше SEARCH_LIMIT
+            filters = page_filters.student_filters(search_name, search_course, search_spec)
+            if search_skills:
+                filters += (page_filters.has_skills(search_skills, match_all=skills_mode == "Все навыки"),)
+            filtered_students = db.search_students(search_profile, filters, limit=queries.SEARCH_LIMIT)
+            if filtered_students is None:
+                filtered_students, truncated = db.get_students_page(filters, limit=queries.SEARCH_LIMIT)
+            else:
+                truncated = len(filtered_students) == queries.SEARCH_LIMIT
+            if truncated:
+                st.caption(f"Показаны первые {queries.SEARCH_LIMIT} студентов - уточните фильтры")
+
+            # Детальная таблица
+            columns = [
+                'full_name', 'course', 'specialization', 'gpa', 'email',
+                'contact_number', 'programming_languages', 'graduation_year',
+                'work_experience', 'is_active'
+            ]
+            if 'snippet' in filtered_students.columns:
+                columns.append('snippet')  # результаты поиска - с фрагментом совпадения
+            display_df = filtered_students[columns].copy()
+
+            display_df['is_active'] = display_df['is_active'].apply(lambda x: '✅ Да' if x == 1 else '❌ Нет')
+            if 'snippet' in display_df.columns:
+                display_df['snippet'] = display_df['snippet'].apply(plain_snippet)
+
+            st.dataframe(
+                display_df.rename(columns={
+                    'full_name': 'ФИО',
+                    'course': 'Курс',
+                    'specialization': 'Специальность',
+                    'gpa': 'GPA',
+                    'email': 'Email',
+                    'contact_number': 'Телефон',
+                    'programming_languages': 'Навыки',
+                    'graduation_year': 'Год выпуска',
+                    'work_experience': 'Опыт работы',
+                    'is_active': 'В поиске работы',
+                    'snippet': 'Совпадение'
+                }),
+                use_container_width=True,
+                height=400
+            )
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # Экспорт данных
+            st.subheader("📤 Экспорт данных")
+            col_exp1, col_exp2 = st.columns(2)
+
+            with col_exp1:
+                # Выгружаются все студенты под фильтрами (без SEARCH_LIMIT);
+                # файл собирается только по нажатию кнопки
+                export_conditions, export_params = [], []
+                match = queries.fts_match(search_profile)
+                if match is not None:
+                    export_conditions.append(queries.fts_condition('students_fts'))
+                    export_params.append(match)
+                st.download_button(
+                    label="📥 Экспорт в CSV",
+                    data=lambda: db.export_csv(exports.STUDENTS, filters, export_conditions, export_params),
+                    file_name=f"students_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    mime="text/csv",
+                    key="export_csv"
+                )
+
+            with col_exp2:
+                if st.button("📊 Создать отчет", key="create_report"):
+                    report = f"""
+                    ОТЧЕТ ПО СТУДЕНТАМ КЭУ
+                    Дата: {datetime.now().strftime('%d.%m.%Y %H:%M')}
+
+                    Всего студентов: {int(stats['total_students'])}
+                    Активно ищут работу: {int(stats['active_students'])}
+                    Средний GPA: {stats['avg_gpa'] if pd.notna(stats['avg_gpa']) else 0:.2f}
+
+                    Распределение по курсам:
+                    """
+
+                    by_course = db.get_students_by_course()
+                    for course in COURSE_OPTIONS:
+                        count = by_course.get(course, 0)
+                        report += f"- Курс {course}: {count} студентов\n"
+
+                    st.text_area("Отчет", report, height=200)
+
+        else:
+            st.info("Пока нет зарегистрированных студентов")
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def admin_vacancies():
+    st.header("💼 Управление вакансиями")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        vacancies = db.get_all_vacancies()
+
+        if not vacancies.empty:
+            # Кнопка добавления
+            if st.button("➕ Добавить вакансию", key="admin_add_vacancy_btn"):
+                st.session_state.page = 'add_vacancy'
+                st.rerun()
+
+            # Таблица вакансий
+            display_df = vacancies[['company_name', 'position', 'specialization', 'salary_range',
+                                    'application_deadline', 'contact_email']].copy()
+
+            st.dataframe(
+                display_df.rename(columns={
+                    'company_name': 'Компания',
+                    'position': 'Должность',
+                    'specialization': 'Специальность',
+                    'salary_range': 'Зарплата',
+                    'application_deadline': 'Дедлайн',
+                    'contact_email': 'Email компании'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+            st.download_button(
+                label="📥 Экспорт вакансий в CSV",
+                data=lambda: db.export_csv(exports.VACANCIES, conditions=["is_active = 1"]),
+                file_name=f"vacancies_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                mime="text/csv",
+                key="export_vacancies_csv"
+            )
+        else:
+            st.info("Пока нет активных вакансий")
+            if st.button("➕ Добавить первую вакансию", key="admin_add_first_vacancy"):
+                st.session_state.page = 'add_vacancy'
+                st.rerun()
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def admin_add_vacancy():
+    st.header("➕ Новая вакансия")
+    back_button()
+
+    with st.form("add_vacancy_form", clear_on_submit=True):
+        st.markdown('<div class="content-card">', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            company_name = st.text_input("Название компании *", key="vac_company")
+            position = st.text_input("Должность *", key="vac_position")
+            specialization = st.selectbox("Специальность", SPECIALIZATION_OPTIONS, key="vac_specialization")
+            required_course = st.selectbox("Требуемый курс", COURSE_OPTIONS, key="vac_course")
+
+        with col2:
+            salary_range = st.text_input("Зарплатная вилка", placeholder="150 000 - 200 000 KZT", key="vac_salary")
+            contact_email = st.text_input("Email для откликов *", placeholder="hr@company.kz", key="vac_email")
+            application_deadline = st.date_input("Дедлайн подачи", key="vac_deadline")
+
+        description = st.text_area("Описание вакансии *", height=120, key="vac_description")
+        requirements = st.text_area("Требования *", height=120, key="vac_requirements")
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        col_btn1, col_btn2 = st.columns(2)
+        with col_btn1:
+            submitted = st.form_submit_button("📤 Опубликовать", use_container_width=True, key="vac_submit")
+        with col_btn2:
+            if st.form_submit_button("❌ Отмена", use_container_width=True, key="vac_cancel"):
+                st.session_state.page = 'vacancies'
+                st.rerun()
+
+        if submitted:
+            if all([company_name, position, description, requirements, contact_email]):
+                vacancy_data = (
+                    company_name, position, specialization, required_course,
+                    salary_range, description, requirements, contact_email,
+                    application_deadline.strftime('%Y-%m-%d')
+                )
+                try:
+                    st.session_state.db_manager.insert_vacancy(vacancy_data)
+                    st.success("✅ Вакансия успешно опубликована!")
+                    st.session_state.page = 'vacancies'
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Ошибка: {str(e)}")
+            else:
+                st.warning("⚠️ Заполните все обязательные поля")
+
+
+STATUS_TEXT = {
+    'pending': '⏳ Ожидает',
+    'accepted': '✅ Принято',
+    'rejected': '❌ Отклонено'
+}
+
+
+def application_rows(applications):
+    """Строки откликов для карточек: подписи статуса, дата, письмо"""
+    rows = applications.to_dict('records')
+    for row in rows:
+        # Вакансия или студент могли быть удалены - в строке NaN
+        if pd.isna(row.get('full_name')):
+            row['full_name'] = "Студент удален/неизвестен"
+        if pd.isna(row.get('position')):
+            row['position'] = "Вакансия удалена"
+        if pd.isna(row.get('company_name')):
+            row['company_name'] = "Не указано"
+        if pd.isna(row.get('status')):
+            row['status'] = 'pending'
+        row['status_text'] = STATUS_TEXT.get(row['status'], row['status'])
+        row['date'] = str(row['application_date'])[:10] if pd.notna(row.get('application_date')) else "Не указана"
+        row['cover_letter_html'] = cards.cover_letter(row.get('cover_letter'))
+    return rows
+
+
+def application_label(row):
+    """Подпись отклика в списках выбора"""
+    return f"#{row['app_id']} {row['full_name']} — {row['position']}"
+
+
+def application_actions(db, applications):
+    """Один выбор отклика вместо кнопок на каждой карточке"""
+    app_id = st.selectbox("Отклик", list(applications), index=None, key="admin_app_selected",
+                          placeholder="Выберите отклик для изменения статуса",
+                          format_func=lambda app_id: application_label(applications[app_id]))
+    if app_id is None:
+        return
+    app = applications[app_id]
+
+    col_status1, col_status2, col_status3 = st.columns(3)
+    with col_status1:
+        if st.button("✅ Принять", key="list_accept", disabled=app['status'] == 'accepted',
+                     use_container_width=True):
+            db.update_application_status(app_id, 'accepted')
+            st.success("Принято!")
+            st.rerun()
+    with col_status2:
+        if st.button("❌ Отклонить", key="list_reject", disabled=app['status'] == 'rejected',
+                     use_container_width=True):
+            db.update_application_status(app_id, 'rejected')
+            st.warning("Отклонено.")
+            st.rerun()
+    with col_status3:
+        with st.popover("📋 Подробнее", use_container_width=True):
+            st.write(f"**ID отклика:** {app_id}")
+            st.write(f"**Зарплата:** {app['salary_range']}")
+
+
+def application_review_form(db, applications, key):
+    """Режим проверки: отметить несколько откликов и обработать их одной транзакцией.
+
+    Таблица внутри формы, поэтому отметки не перезапускают скрипт - один
+    rerun на всю пачку.
+    """
+    table = applications[['app_id', 'full_name', 'position', 'company_name', 'status', 'application_date']].copy()
+    table.insert(0, 'selected', False)
+    table['status'] = table['status'].map(lambda x: STATUS_TEXT.get(x, x))
+    table['application_date'] = table['application_date'].astype(str).str[:10]
+    table = table.rename(columns={
+        'selected': 'Выбрать',
+        'app_id': 'ID',
+        'full_name': 'Студент',
+        'position': 'Вакансия',
+        'company_name': 'Компания',
+        'status': 'Статус',
+        'application_date': 'Дата'
+    })
+
+    with st.form(f"{key}_review_form"):
+        edited = st.data_editor(table, hide_index=True, use_container_width=True,
+                                disabled=[column for column in table.columns if column != 'Выбрать'],
+                                key=f"{key}_review_editor")
+        col_accept, col_reject = st.columns(2)
+        with col_accept:
+            accept = st.form_submit_button("✅ Принять выбранные", use_container_width=True)
+        with col_reject:
+            reject = st.form_submit_button("❌ Отклонить выбранные", use_container_width=True)
+
+    if accept or reject:
+        selected = edited.loc[edited['Выбрать'], 'ID'].tolist()
+        if not selected:
+            st.warning("Не выбрано ни одного отклика")
+        else:
+            changed = db.update_application_statuses(selected, 'accepted' if accept else 'rejected')
+            st.success(f"Обновлено откликов: {changed}")
+            st.rerun()
+
+
+def bulk_application_actions(db, filters):
+    """Массовые действия над всеми откликами под фильтром, одним UPDATE"""
+    with st.expander("⚡ Массовые действия"):
+        matched = db.count_applications(filters)
+        col_status, col_apply = st.columns([3, 1])
+        with col_status:
+            bulk_status = st.selectbox(f"Статус для всех откликов по текущим фильтрам ({matched})",
+                                       list(STATUS_TEXT), format_func=STATUS_TEXT.get, key="bulk_status")
+        with col_apply:
+            st.markdown("<br>", unsafe_allow_html=True)
+            if st.button("Применить", key="bulk_apply", disabled=matched == 0, use_container_width=True):
+                changed = db.update_applications_where(bulk_status, filters)
+                st.success(f"Обновлено откликов: {changed}")
+                st.rerun()
+
+        closed_filters = (page_filters.equals('a.status', 'pending'),)
+        closed = db.count_applications(closed_filters, conditions=[queries.CLOSED_VACANCY])
+        if st.button(f"❌ Отклонить все ожидающие по закрытым вакансиям ({closed})",
+                     key="bulk_reject_closed", disabled=closed == 0):
+            changed = db.update_applications_where('rejected', closed_filters, conditions=[queries.CLOSED_VACANCY])
+            st.warning(f"Отклонено откликов: {changed}")
+            st.rerun()
+
+
+def admin_applications():
+    st.header("📨 Управление откликами")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        if db.get_statistics()['total_applications'] > 0:
+            # Фильтры
+            col_filter1, col_filter2 = st.columns(2)
+            with col_filter1:
+                status_filter = st.selectbox("Статус", ["Все", "pending", "accepted", "rejected"],
+                                             key="admin_status_filter")
+            with col_filter2:
+                search_app = st.text_input("Поиск", placeholder="Студент, вакансия...", key="admin_app_search")
+
+            # Используем постраничный метод с правильными ID
+            filters = (
+                page_filters.equals('a.status', status_filter),
+                page_filters.contains(('s.full_name', 'v.position'), search_app),
+            )
+            applications, next_cursor = db.get_applications_page(
+                filters, after=page_cursor('admin_applications', filters))
+            review_mode = st.toggle("🗂 Режим проверки: выбор нескольких откликов", key="admin_review_mode")
+            if applications.empty:
+                st.info("🔍 Откликов по выбранным фильтрам нет")
+            elif review_mode:
+                application_review_form(db, applications, 'admin_applications')
+            else:
+                rows = application_rows(applications)
+                cards.show_cards(cards.APPLICATION_CARD, rows)
+                application_actions(db, {row['app_id']: row for row in rows})
+
+            pagination_controls('admin_applications', next_cursor)
+            st.download_button(
+                label="📥 Экспорт откликов в CSV",
+                data=lambda: db.export_csv(exports.APPLICATIONS, filters),
+                file_name=f"applications_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                mime="text/csv",
+                key="export_applications_csv"
+            )
+            bulk_application_actions(db, filters)
+        else:
+            st.info("📭 Пока нет откликов на вакансии")
+
+    except Exception as e:
+        st.error(f"Ошибка в списке откликов: {str(e)}")
+
+
+def admin_shortlist():
+    st.header("🎯 Шорт-листы по вакансиям")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        vacancies = db.get_active_vacancy_titles()
+
+        if not vacancies.empty:
+            titles = {row['id']: f"{row['position']} — {row['company_name']}" for _, row in vacancies.iterrows()}
+            col_select, col_refresh = st.columns([3, 1])
+            with col_select:
+                vacancy_id = st.selectbox("Вакансия", list(titles), format_func=titles.get, key="shortlist_vacancy")
+            with col_refresh:
+                st.markdown("<br>", unsafe_allow_html=True)
+                if st.button("🔄 Пересчитать", key="shortlist_refresh", use_container_width=True):
+                    db.refresh_all_matches()
+                    st.success("Подбор пересчитан")
+
+            shortlist = db.get_vacancy_shortlist(vacancy_id)
+            if not shortlist.empty:
+                display_df = shortlist[['full_name', 'score', 'course', 'specialization', 'gpa',
+                                        'programming_languages', 'email', 'contact_number']].copy()
+                display_df['score'] = display_df['score'].apply(lambda x: f"{x:.0%}")
+                st.dataframe(
+                    display_df.rename(columns={
+                        'full_name': 'ФИО',
+                        'score': 'Совпадение',
+                        'course': 'Курс',
+                        'specialization': 'Специальность',
+                        'gpa': 'GPA',
+                        'programming_languages': 'Навыки',
+                        'email': 'Email',
+                        'contact_number': 'Телефон'
+                    }),
+                    use_container_width=True,
+                    hide_index=True
+                )
+                st.caption(f"Лучшие {matching.TOP_K} кандидатов: навыки, специальность, курс и GPA")
+            else:
+                st.info("Для этой вакансии пока нет кандидатов")
+        else:
+            st.info("💼 Активных вакансий пока нет")
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
@@ -0,0 +1,72 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import roster_import
+from components import metric_card, back_button
+
+# ========== ИМПОРТ СТУДЕНТОВ (АДМИН) ==========
+def admin_import_students():
+    st.header("📥 Импорт студентов")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    st.markdown(
+        "Файл CSV или XLSX с заголовком. Обязательные колонки: **ФИО**, **Email**, **Курс**, **Специальность**. "
+        "Необязательные: Логин, Пароль, GPA, Навыки, Телефон, Год выпуска. "
+        "Если логин не указан, берется часть email до @; если пароль не указан, он генерируется."
+    )
+
+    uploaded = st.file_uploader("Список студентов", type=['csv', 'xlsx'], key="roster_file")
+
+    if uploaded is not None and st.button("📥 Импортировать", key="roster_import", type="primary"):
+        progress_bar = st.progress(0.0, text="Импорт...")
+        total = max(uploaded.size, 1)
+
+        def progress(report):
+            # Точное число строк заранее неизвестно - оцениваем по прочитанной части файла
+            done = min(uploaded.tell() / total, 1.0) if not uploaded.name.lower().endswith('.xlsx') else 0.0
+            progress_bar.progress(done, text=f"Обработано строк: {report.processed}, добавлено: {report.created}")
+
+        try:
+            report = db.import_roster(uploaded, uploaded.name, progress)
+        except roster_import.RosterError as e:
+            progress_bar.empty()
+            st.error(f"❌ {e}")
+            return
+        except Exception as e:
+            progress_bar.empty()
+            st.error(f"Ошибка импорта: {str(e)}")
+            return
+
+        progress_bar.progress(1.0, text=f"Обработано строк: {report.processed}")
+        st.session_state.roster_report = report
+
+    report = st.session_state.get('roster_report')
+    if report is not None:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            metric_card("Строк в файле", report.processed, "📄")
+        with col2:
+            metric_card("Добавлено", report.created, "✅")
+        with col3:
+            metric_card("Ошибок", report.error_count, "⚠️")
+
+        if report.errors:
+            st.subheader("⚠️ Пропущенные строки")
+            st.dataframe(
+                pd.DataFrame(report.errors).rename(columns={'line': 'Строка', 'message': 'Ошибка'}),
+                use_container_width=True,
+                hide_index=True
+            )
+            if report.error_count > len(report.errors):
+                st.caption(f"Показаны первые {len(report.errors)} из {report.error_count}")
+
+        if report.generated_passwords:
+            st.download_button(
+                label=f"🔑 Скачать сгенерированные пароли ({report.generated_passwords})",
+                data=report.credentials_csv(),
+                file_name=f"keu_roster_credentials_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                key="roster_credentials"
+            )
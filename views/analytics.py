@@ -0,0 +1,231 @@
+import streamlit as st
+import pandas as pd
+from plotly.colors import sequential
+import charts
+import queries
+import snapshots
+from components import metric_card, back_button
+
+# ========== АНАЛИТИКА (АДМИН) ==========
+# Отдельный модуль: plotly (charts.py) и pyarrow (snapshots.py) грузятся
+# только при первом открытии аналитики
+REPORT_POLL_SECONDS = 0.5
+
+
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def report_progress():
+    """Прогресс фонового отчета (reports.py) без ожидания в потоке страницы.
+
+    Фрагмент перерисовывается по таймеру, пока задача не завершится, затем
+    перезапускает страницу - она покажет результат. При уходе со страницы
+    отчет достроится и будет доступен из кэша.
+    """
+    job = st.session_state.get('report_job')
+    if job is not None and not job.done():
+        st.progress(job.progress, text=job.stage)
+    else:
+        st.rerun()
+
+
+def admin_analytics():
+    st.header("📊 Расширенная аналитика")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        stats = db.get_statistics()
+        total_students = int(stats['total_students'])
+        total_applications = int(stats['total_applications'])
+
+        # Основные метрики
+        st.subheader("📈 Ключевые показатели")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            metric_card("Всего студентов", stats['total_students'], "👨‍🎓")
+        with col2:
+            metric_card("Вакансий", stats['active_vacancies'], "💼")
+        with col3:
+            metric_card("Откликов", stats['total_applications'], "📨")
+        with col4:
+            metric_card("Конверсия",
+                        f"{(stats['accepted_applications'] / stats['total_applications'] * 100):.1f}%" if stats[
+                                                                                                              'total_applications'] > 0 else "0%",
+                        "📊")
+
+        # Визуализация
+        st.subheader("📊 Визуализация данных")
+
+        # Распределение студентов по курсам
+        if total_students > 0:
+            col_chart1, col_chart2 = st.columns(2)
+
+            with col_chart1:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.write("**Распределение студентов по курсам**")
+
+                def courses_chart():
+                    course_counts = db.get_students_by_course()
+                    return charts.pie({course: course_counts[course] for course in sorted(course_counts)},
+                                      "Курсы", colors=sequential.RdBu, textinfo='percent+label')
+
+                fig1 = db.cached_figure(('courses',), ('students',), courses_chart)
+                st.plotly_chart(fig1, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col_chart2:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.write("**Распределение по специальностям**")
+
+                fig2 = db.cached_figure(
+                    ('specializations',), ('students',),
+                    lambda: charts.bar(db.get_students_by_specialization(), "Специальности",
+                                       "Количество", "Специальность", colorscale='Peach'))
+                st.plotly_chart(fig2, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        # Анализ откликов
+        if total_applications > 0:
+            st.subheader("📨 Анализ откликов")
+
+            col_app1, col_app2 = st.columns(2)
+
+            with col_app1:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.write("**Статусы откликов**")
+
+                def statuses_chart():
+                    status_counts = db.get_applications_by_status()
+                    labels = {'pending': 'На рассмотрении', 'accepted': 'Принято', 'rejected': 'Отклонено'}
+                    return charts.pie({labels.get(status, status): count for status, count in status_counts.items()},
+                                      "Статусы откликов", colors=['#FF9800', '#4CAF50', '#F44336'])
+
+                fig3 = db.cached_figure(('statuses',), ('applications',), statuses_chart)
+                st.plotly_chart(fig3, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col_app2:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.write("**Динамика откликов**")
+
+                day_range = db.get_applications_day_range()
+                if day_range is not None:
+                    period = st.date_input("Период", value=day_range, min_value=day_range[0],
+                                           max_value=day_range[1], key="analytics_period")
+                    col_res, col_group = st.columns(2)
+                    with col_res:
+                        resolution = st.radio("Шаг", ['day', 'week', 'month'], horizontal=True,
+                                              format_func={'day': "День", 'week': "Неделя", 'month': "Месяц"}.get,
+                                              key="analytics_resolution")
+                    with col_group:
+                        group = st.selectbox("Разбивка", [None, 'status', 'specialization', 'company_name'],
+                                             format_func=lambda g: {None: "Без разбивки", 'status': "По статусу",
+                                                                    'specialization': "По специальности",
+                                                                    'company_name': "По компании"}[g],
+                                             key="analytics_series_group")
+                    # Пока выбран только первый день диапазона, показываем до конца истории;
+                    # очищенное поле (пустой кортеж) - вся история
+                    if len(period) == 2:
+                        start, end = period
+                    elif len(period) == 1:
+                        start, end = period[0], day_range[1]
+                    else:
+                        start, end = day_range
+
+                    def series_chart():
+                        series = db.get_application_series(start, end, resolution, group)
+                        return charts.line(
+                            series['period'], series['applications'],
+                            {'day': "Количество откликов по дням", 'week': "Количество откликов по неделям",
+                             'month': "Количество откликов по месяцам"}[resolution],
+                            "Дата", "Количество откликов",
+                            groups=series[group] if group else None)
+
+                    fig4 = db.cached_figure(('series', start, end, resolution, group),
+                                            ('applications', 'vacancies'), series_chart)
+                    st.plotly_chart(fig4, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        # Успеваемость
+        gpa_stats = db.get_gpa_summary()
+        if gpa_stats is not None:
+            st.subheader("⭐ Анализ успеваемости")
+
+            col_gpa1, col_gpa2 = st.columns(2)
+
+            with col_gpa1:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.write("**Статистика GPA**")
+
+                stats_data = {
+                    'Метрика': ['Среднее', 'Медиана', 'Минимум', 'Максимум', 'Стандартное отклонение'],
+                    'Значение': [
+                        f"{gpa_stats['mean']:.2f}",
+                        f"{gpa_stats['median']:.2f}",
+                        f"{gpa_stats['min']:.2f}",
+                        f"{gpa_stats['max']:.2f}",
+                        f"{gpa_stats['std']:.2f}"
+                    ]
+                }
+
+                st.table(pd.DataFrame(stats_data))
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col_gpa2:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.write("**Распределение GPA**")
+
+                # Корзины посчитаны в SQL, в фигуру уходят только их счетчики
+                def gpa_chart():
+                    histogram = db.get_gpa_histogram()
+                    return charts.histogram(histogram['students'], [*histogram['gpa'], queries.GPA_MAX],
+                                            "Распределение среднего балла", "GPA", "Количество студентов",
+                                            color='#FFA07A')
+
+                fig5 = db.cached_figure(('gpa',), ('students',), gpa_chart)
+                st.plotly_chart(fig5, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        # Генерация комплексного отчета
+        st.subheader("📋 Генерация комплексного отчета")
+
+        if st.button("📊 Сгенерировать полный отчет", key="generate_full_report"):
+            st.session_state.report_job = db.request_report()
+        job = st.session_state.get('report_job')
+        if job is not None and job.done():
+            del st.session_state.report_job
+            job.result()
+            st.success("✅ Комплексный отчет сгенерирован!")
+        elif job is not None:
+            report_progress()
+
+        # Готовый отчет показывается, пока данные не изменились
+        report = db.get_cached_report()
+        if report is not None:
+            st.caption(f"Отчет от {report.generated_at.strftime('%d.%m.%Y %H:%M:%S')} - данные с тех пор не менялись")
+            st.text_area("Содержимое отчета", report.text, height=400)
+
+            st.download_button(
+                label="📥 Скачать полный отчет",
+                data=report.text,
+                file_name=f"keu_comprehensive_report_{report.generated_at.strftime('%Y%m%d_%H%M%S')}.txt",
+                mime="text/plain",
+                key="download_full_report"
+            )
+
+        # Снимок для внешних BI-инструментов
+        st.subheader("🗄 Снимок данных для BI")
+        st.caption(f"Parquet по месяцам в папке {snapshots.SNAPSHOT_DIR}/; перезаписываются только изменившиеся месяцы")
+
+        if st.button("🗄 Обновить снимок", key="write_snapshot"):
+            try:
+                with st.spinner("Выгрузка..."):
+                    written = db.write_snapshot()
+                st.success("✅ Снимок обновлен: " + ", ".join(
+                    f"{table} - {count}" for table, count in written.items()) + " (перезаписано партиций)")
+            except snapshots.SnapshotError as e:
+                st.error(f"❌ {e}")
+
+    except Exception as e:
+        st.error(f"Ошибка при генерации аналитики: {str(e)}")
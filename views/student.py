@@ -0,0 +1,509 @@
+import html
+import streamlit as st
+import pandas as pd
+import cards
+import page_filters
+import skills
+from app_db import COURSE_OPTIONS, SPECIALIZATION_OPTIONS, SKILL_OPTIONS
+from components import (create_header, metric_card, back_button, page_cursor, pagination_controls,
+                        highlight_snippet)
+
+# ========== СТРАНИЦЫ СТУДЕНТА ==========
+def student_dashboard():
+    create_header()
+
+    user = st.session_state.user
+    db = st.session_state.db_manager
+
+    try:
+        # Получаем данные студента
+        student = db.get_current_student(user['id'])
+        stats = db.get_statistics()
+
+        # Приветствие
+        st.markdown(f"""
+        <div class="content-card">
+            <h2>👋 Добро пожаловать, {user['full_name'].split()[0]}!</h2>
+            <p>Рады видеть вас в Карьерном центре КЭУ. Здесь вы можете найти подходящие вакансии и начать свою карьеру.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Быстрые действия
+        st.subheader("⚡ Быстрые действия")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("👤 Заполнить профиль", key="student_profile_btn", use_container_width=True):
+                st.session_state.page = 'profile'
+                st.rerun()
+        with col2:
+            if st.button("💼 Найти вакансии", key="student_vacancies_btn", use_container_width=True):
+                st.session_state.page = 'vacancies'
+                st.rerun()
+        with col3:
+            if st.button("📨 Мои отклики", key="student_applications_btn", use_container_width=True):
+                st.session_state.page = 'my_applications'
+                st.rerun()
+
+        # Статистика
+        st.subheader("📊 Ваша статистика")
+        col_stat1, col_stat2, col_stat3 = st.columns(3)
+        with col_stat1:
+            metric_card("Активных вакансий", stats['active_vacancies'], "💼")
+        with col_stat2:
+            if student is not None:
+                metric_card("Ваш GPA", f"{student['gpa']:.2f}" if student['gpa'] is not None else "—", "⭐")
+            else:
+                metric_card("Заполните профиль", "→", "📝")
+        with col_stat3:
+            metric_card("Всего студентов", stats['total_students'], "👨‍🎓")
+
+        # Подходящие вакансии из предрасчитанного подбора, без профиля - последние
+        vacancies = db.get_student_matches(student['id']) if student is not None else pd.DataFrame()
+        if not vacancies.empty:
+            st.subheader("🔥 Подходящие вакансии")
+        else:
+            st.subheader("🔥 Последние вакансии")
+            vacancies = db.get_vacancies_page(limit=3)[0]
+        if not vacancies.empty:
+            for i, vacancy in vacancies.iterrows():
+                match_html = ""
+                if 'score' in vacancy:
+                    match_html = f"⭐ <strong>Совпадение:</strong> {vacancy['score']:.0%}<br>"
+                with st.container():
+                    st.markdown(f"""
+                    <div class="content-card">
+                        <h4 style="color: var(--peach-dark); margin: 0;">{vacancy['position']}</h4>
+                        <p style="color: var(--peach-primary); font-weight: 600; margin: 5px 0;">{vacancy['company_name']}</p>
+                        <p style="margin: 5px 0;">
+                            {match_html}
+                            💰 <strong>Зарплата:</strong> {vacancy['salary_range']}<br>
+                            🎯 <strong>Специальность:</strong> {vacancy['specialization']}
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    col_btn1, col_btn2 = st.columns(2)
+                    with col_btn1:
+                        if st.button("📨 Откликнуться", key=f"quick_apply_{vacancy['id']}"):
+                            if student is not None:
+                                st.session_state.current_vacancy_id = vacancy['id']
+                                st.session_state.page = 'apply_vacancy'
+                                st.rerun()
+                            else:
+                                st.warning("Сначала заполните свой профиль!")
+                    with col_btn2:
+                        if st.button("📋 Подробнее", key=f"details_{vacancy['id']}"):
+                            with st.expander("Подробная информация"):
+                                st.write(f"**Описание:** {vacancy['description']}")
+                                st.write(f"**Требования:** {vacancy['requirements']}")
+                                st.write(f"**Контакты:** {vacancy['contact_email']}")
+                                st.write(f"**Дедлайн:** {vacancy['application_deadline']}")
+                    st.markdown("---")
+        else:
+            st.info("Пока нет активных вакансий")
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def student_profile():
+    st.header("👤 Мой профиль")
+    back_button()
+
+    user = st.session_state.user
+    db = st.session_state.db_manager
+
+    # Получаем текущие данные студента
+    student = db.get_current_student(user['id'])
+
+    with st.form("student_profile_form", clear_on_submit=False):
+        st.markdown('<div class="content-card">', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            full_name = st.text_input("ФИО *",
+                                      value=student['full_name'] if student is not None else user['full_name'],
+                                      key="profile_full_name")
+            course = st.selectbox("Курс *", COURSE_OPTIONS,
+                                  index=3 if student is None else COURSE_OPTIONS.index(student['course']) if student[
+                                                                                                                 'course'] in COURSE_OPTIONS else 3,
+                                  key="profile_course")
+            specialization = st.selectbox("Специальность *", SPECIALIZATION_OPTIONS,
+                                          index=0 if student is None else SPECIALIZATION_OPTIONS.index(
+                                              student['specialization']) if student[
+                                                                                'specialization'] in SPECIALIZATION_OPTIONS else 0,
+                                          key="profile_specialization")
+            email = st.text_input("Email *",
+                                  value=student['email'] if student is not None else "",
+                                  key="profile_email")
+
+        with col2:
+            contact_number = st.text_input("Контактный номер *",
+                                           value=student['contact_number'] if student is not None else "",
+                                           key="profile_phone")
+            current_skills = skills.parse_skills(student['programming_languages']) if student is not None else []
+            programming_languages = st.multiselect("Навыки и технологии", SKILL_OPTIONS,
+                                                   default=[name for name in current_skills if name in SKILL_OPTIONS],
+                                                   key="profile_skills")
+            gpa = st.number_input("Средний балл (GPA)", min_value=0.0, max_value=4.0, step=0.1,
+                                  value=float(student['gpa']) if student is not None and student['gpa'] else 3.0,
+                                  key="profile_gpa")
+            graduation_year = st.number_input("Год выпуска", min_value=2024, max_value=2030,
+                                              value=int(student['graduation_year']) if student is not None and student[
+                                                  'graduation_year'] else 2024,
+                                              key="profile_year")
+
+        work_experience = st.text_area("Опыт работы и практики",
+                                       value=student['work_experience'] if student is not None else "",
+                                       height=120,
+                                       placeholder="Опишите ваш опыт работы, практики, проекты...",
+                                       key="profile_experience")
+
+        portfolio_link = st.text_input("Ссылка на портфолио (опционально)",
+                                       value=student['portfolio_link'] if student is not None else "",
+                                       placeholder="https://...",
+                                       key="profile_portfolio")
+
+        is_active = st.checkbox("Активно ищу работу/стажировку",
+                                value=bool(student['is_active']) if student is not None else True,
+                                key="profile_active")
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 2])
+        with col_btn1:
+            submitted = st.form_submit_button("💾 Сохранить", use_container_width=True, key="profile_submit")
+        with col_btn2:
+            if st.form_submit_button("❌ Отмена", use_container_width=True, key="profile_cancel"):
+                st.session_state.page = 'dashboard'
+                st.rerun()
+
+        if submitted:
+            if all([full_name, email, contact_number]):
+                skills_str = skills.join_skills(programming_languages)
+                student_data = (
+                    full_name, course, specialization, skills_str,
+                    work_experience, portfolio_link, contact_number,
+                    email, gpa, graduation_year, int(is_active)
+                )
+
+                try:
+                    if student is not None:
+                        # Обновляем существующую запись
+                        saved = db.update_student(user['id'], student_data)
+                        if saved:
+                            st.success("✅ Профиль успешно обновлен!")
+                    else:
+                        # Создаем новую запись
+                        saved = db.insert_student(user['id'], student_data)
+                        if saved:
+                            st.success("✅ Профиль успешно создан!")
+                            st.balloons()
+
+                    # При ошибке остаемся на форме: сообщение уже показано
+                    if saved:
+                        st.session_state.page = 'dashboard'
+                        st.rerun()
+
+                except Exception as e:
+                    st.error(f"❌ Ошибка сохранения: {str(e)}")
+            else:
+                st.warning("⚠️ Пожалуйста, заполните все обязательные поля (отмечены *)")
+
+
+def vacancy_actions(db, vacancies):
+    """Один выбор вакансии вместо пары кнопок на каждой карточке"""
+    vacancy_id = st.selectbox("Вакансия", list(vacancies), index=None, key="vacancy_selected",
+                              placeholder="Выберите вакансию для отклика или подробностей",
+                              format_func=lambda vid: f"{vacancies[vid]['position']} — {vacancies[vid]['company_name']}")
+    if vacancy_id is None:
+        return
+    vacancy = vacancies[vacancy_id]
+
+    with st.expander("📋 Полная информация о вакансии"):
+        st.write("**Описание:**")
+        st.write(vacancy['description'])
+        st.write("**Требования:**")
+        st.write(vacancy['requirements'])
+        st.write(f"**Контакты:** {vacancy['contact_email']}")
+        st.write(f"**Дедлайн подачи:** {vacancy['application_deadline']}")
+
+    if st.button("📨 Откликнуться", key="apply_vacancy_selected", use_container_width=True):
+        # Проверяем, заполнен ли профиль
+        student = db.get_current_student(st.session_state.user['id'])
+        if student is not None:
+            st.session_state.current_vacancy_id = vacancy_id
+            st.session_state.page = 'apply_vacancy'
+            st.rerun()
+        else:
+            st.warning("Сначала заполните свой профиль в разделе 'Мой профиль'")
+
+
+def student_vacancies():
+    st.header("💼 Доступные вакансии")
+    back_button()
+
+    db = st.session_state.db_manager
+
+    try:
+        # Фильтры
+        col_filter1, col_filter2 = st.columns(2)
+        with col_filter1:
+            search_query = st.text_input("🔍 Поиск", placeholder="Должность, компания, требования...",
+                                         key="vacancy_search")
+        with col_filter2:
+            spec_filter = st.selectbox("Специальность", ["Все"] + SPECIALIZATION_OPTIONS, key="vacancy_spec_filter")
+
+        # Фильтры применяются в SQL, в Python приходит только текущая страница
+        filters = (page_filters.equals('specialization', spec_filter),)
+        vacancies = db.search_vacancies(search_query, filters)
+        if vacancies is None:
+            vacancies, next_cursor = db.get_vacancies_page(filters, after=page_cursor('vacancies', filters))
+        else:
+            next_cursor = None  # результаты поиска - лучшие SEARCH_RESULTS совпадений по релевантности
+
+        if not vacancies.empty:
+            # Вся страница карточек - один элемент; действия - через выбор вакансии
+            rows = vacancies.to_dict('records')
+            for row in rows:
+                row['summary_html'] = (highlight_snippet(row['snippet']) if 'snippet' in row
+                                       else html.escape(f"{row['description'][:200]}..."))
+            cards.show_cards(cards.VACANCY_CARD, rows)
+            vacancy_actions(db, {row['id']: row for row in rows})
+
+            pagination_controls('vacancies', next_cursor)
+        elif search_query or spec_filter != "Все":
+            st.info("🔍 По вашему запросу вакансий не найдено")
+        else:
+            st.info("💼 Активных вакансий пока нет")
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def student_apply_vacancy():
+    st.header("📨 Отклик на вакансию")
+    back_button()
+
+    if 'current_vacancy_id' not in st.session_state:
+        st.warning("Сначала выберите вакансию для отклика")
+        if st.button("⬅️ К вакансиям", key="back_to_vacancies"):
+            st.session_state.page = 'vacancies'
+            st.rerun()
+        return
+
+    db = st.session_state.db_manager
+    user = st.session_state.user
+
+    try:
+        # Получаем информацию о вакансии
+        vacancy = db.get_vacancy_by_id(st.session_state.current_vacancy_id)
+        if vacancy is None or not vacancy['is_active']:
+            st.error("Вакансия не найдена или уже закрыта")
+            if st.button("⬅️ К вакансиям", key="missing_vacancy_back"):
+                st.session_state.page = 'vacancies'
+                st.rerun()
+            return
+
+        # Получаем данные студента
+        student = db.get_current_student(user['id'])
+
+        if student is None:
+            st.error("Сначала заполните свой профиль!")
+            if st.button("👤 Заполнить профиль", key="fill_profile_first"):
+                st.session_state.page = 'profile'
+                st.rerun()
+            return
+
+        st.markdown(f"""
+        <div class="content-card">
+            <h3>{vacancy['position']}</h3>
+            <p style="font-size: 1.1rem; color: var(--peach-primary);">
+                Компания: <strong>{vacancy['company_name']}</strong>
+            </p>
+            <p>Зарплата: <strong>{vacancy['salary_range']}</strong></p>
+            <p>Требуемый курс: <strong>{vacancy['required_course']}+</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.subheader("Ваши данные")
+        st.info(f"""
+        **ФИО:** {student['full_name']}
+        **Специальность:** {student['specialization']}
+        **Курс:** {student['course']}
+        **GPA:** {student['gpa']}
+        **Email:** {student['email']}
+        **Телефон:** {student['contact_number']}
+        """)
+
+        st.subheader("Сопроводительное письмо")
+        cover_letter = st.text_area(
+            "Расскажите, почему вы подходите для этой должности",
+            height=150,
+            placeholder="Опишите ваш опыт, навыки и почему вы хотите работать в этой компании...",
+            key="cover_letter_text"
+        )
+
+        col_btn1, col_btn2 = st.columns(2)
+        with col_btn1:
+            if st.button("📤 Отправить отклик", key="send_application", use_container_width=True):
+                try:
+                    db.apply_for_vacancy(student['id'], vacancy['id'], cover_letter)
+                    st.success("✅ Ваш отклик успешно отправлен!")
+                    st.balloons()
+
+                    # Очищаем состояние и возвращаемся
+                    del st.session_state.current_vacancy_id
+                    st.session_state.page = 'my_applications'
+                    st.rerun()
+
+                except Exception as e:
+                    st.error(f"❌ Ошибка при отправке: {str(e)}")
+
+        with col_btn2:
+            if st.button("❌ Отмена", key="cancel_application", use_container_width=True):
+                del st.session_state.current_vacancy_id
+                st.session_state.page = 'vacancies'
+                st.rerun()
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def student_my_applications():
+    st.header("📨 Мои отклики")
+    back_button()
+
+    user = st.session_state.user
+    db = st.session_state.db_manager
+
+    try:
+        # Получаем данные студента
+        student = db.get_current_student(user['id'])
+
+        if student is None:
+            st.info("У вас еще нет профиля. Сначала заполните его.")
+            if st.button("👤 Заполнить профиль", key="create_profile_for_apps"):
+                st.session_state.page = 'profile'
+                st.rerun()
+            return
+
+        # Получаем отклики студента
+        applications = db.get_applications_by_student(student['id'])
+
+        if not applications.empty:
+            # Статистика
+            status_counts = applications['status'].value_counts()
+
+            col_stat1, col_stat2, col_stat3 = st.columns(3)
+            with col_stat1:
+                st.metric("Всего откликов", len(applications))
+            with col_stat2:
+                pending = status_counts.get('pending', 0)
+                st.metric("На рассмотрении", pending)
+            with col_stat3:
+                accepted = status_counts.get('accepted', 0)
+                st.metric("Принято", accepted)
+
+            # Список откликов
+            for i, app in applications.iterrows():
+                status_class = f"status-{app['status']}"
+                status_text = {
+                    'pending': '⏳ На рассмотрении',
+                    'accepted': '✅ Принято',
+                    'rejected': '❌ Отклонено'
+                }.get(app['status'], app['status'])
+
+                st.markdown(f"""
+                <div class="content-card">
+                    <div style="display: flex; justify-content: space-between; align-items: start;">
+                        <div>
+                            <h4 style="margin: 0; color: var(--peach-dark);">{app['position']}</h4>
+                            <p style="margin: 5px 0; color: var(--peach-primary);">{app['company_name']}</p>
+                            <p style="margin: 0;"><strong>Дата отклика:</strong> {app['application_date'][:10]}</p>
+                            <p style="margin: 0;"><strong>Зарплата:</strong> {app['salary_range']}</p>
+                        </div>
+                        <span class="status-badge {status_class}">{status_text}</span>
+                    </div>
+                    {f'<p style="margin-top: 10px;"><strong>Сопроводительное письмо:</strong><br>{app["cover_letter"]}</p>' if app['cover_letter'] else ''}
+                </div>
+                """, unsafe_allow_html=True)
+                st.markdown("---")
+        else:
+            st.info("📭 У вас пока нет откликов на вакансии")
+            if st.button("💼 Найти вакансии", key="find_vacancies_from_apps"):
+                st.session_state.page = 'vacancies'
+                st.rerun()
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")
+
+
+def student_stats():
+    st.header("📊 Статистика")
+    back_button()
+
+    db = st.session_state.db_manager
+    user = st.session_state.user
+
+    try:
+        student = db.get_current_student(user['id'])
+        stats = db.get_statistics()
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown('<div class="content-card">', unsafe_allow_html=True)
+            st.subheader("📈 Общая статистика")
+
+            st.metric("Всего студентов", stats['total_students'])
+            st.metric("Активных вакансий", stats['active_vacancies'])
+            st.metric("Всего откликов", stats['total_applications'])
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        with col2:
+            st.markdown('<div class="content-card">', unsafe_allow_html=True)
+            st.subheader("👤 Ваша статистика")
+
+            if student is not None:
+                # Получаем отклики студента
+                applications = db.get_applications_by_student(student['id'])
+
+                col_stat1, col_stat2 = st.columns(2)
+                with col_stat1:
+                    st.metric("Ваш GPA", f"{student['gpa']:.2f}" if student['gpa'] is not None else "—")
+                with col_stat2:
+                    st.metric("Ваш курс", student['course'])
+
+                if not applications.empty:
+                    status_counts = applications['status'].value_counts()
+                    st.write("**Ваши отклики:**")
+                    st.write(f"- Всего: {len(applications)}")
+                    st.write(f"- На рассмотрении: {status_counts.get('pending', 0)}")
+                    st.write(f"- Принято: {status_counts.get('accepted', 0)}")
+                else:
+                    st.info("У вас пока нет откликов")
+            else:
+                st.info("Заполните свой профиль")
+                if st.button("👤 Заполнить профиль", key="fill_profile_stats"):
+                    st.session_state.page = 'profile'
+                    st.rerun()
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Статистика по вакансиям
+        st.subheader("💼 Статистика по вакансиям")
+
+        spec_counts = db.get_vacancies_by_specialization()
+        if spec_counts:
+            # Самые популярные специальности в вакансиях
+            total_vacancies = sum(spec_counts.values())
+            st.write("**Вакансии по специальностям:**")
+            for spec, count in spec_counts.items():
+                percentage = (count / total_vacancies) * 100
+                st.progress(percentage / 100, text=f"{spec}: {count} вакансий ({percentage:.1f}%)")
+
+    except Exception as e:
+        st.error(f"Ошибка: {str(e)}")